@@ -13,6 +13,12 @@ from dataclasses import asdict
 import pandas as pd
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from qualitative_evaluation_translator import (
     QualitativeEvaluation, 
     EvaluationType, 
@@ -20,6 +26,29 @@ from qualitative_evaluation_translator import (
 )
 
 
+def _dump_json(data, file_path: str):
+    """Write data as indented JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(file_path, 'w') as file:
+            json.dump(data, file, indent=2)
+
+
+def _load_json(file_path: str):
+    """Read a JSON file, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'rb') as file:
+            return orjson.loads(file.read())
+    with open(file_path, 'r') as file:
+        return json.load(file)
+
+
+_SENTENCE_SPLIT = re.compile(r'[.!?]+')
+_RANKING_SPLIT = re.compile(r'[,\s>]+')
+
+
 class NaturalLanguageParser:
     """Parse qualitative evaluations from natural language text"""
     
@@ -56,6 +85,36 @@ class NaturalLanguageParser:
             r'(\w+)\s*>\s*(\w+)\s*>\s*(\w+)',
             r'(\w+)\s+(?:then\s+)?(\w+)\s+(?:then\s+)?(\w+)'
         ]
+        
+        # Compiled once, each paired with the operator its matches imply
+        self._comparison_regexes = [
+            (re.compile(pattern, re.IGNORECASE), self._comparison_operator(pattern))
+            for pattern in self.comparison_patterns
+        ]
+        self._range_regexes = [re.compile(pattern, re.IGNORECASE) for pattern in self.range_patterns]
+        self._threshold_regexes = [
+            (re.compile(pattern, re.IGNORECASE), self._threshold_operator(pattern))
+            for pattern in self.threshold_patterns
+        ]
+        self._ranking_regexes = [re.compile(pattern, re.IGNORECASE) for pattern in self.ranking_patterns]
+    
+    @staticmethod
+    def _comparison_operator(pattern: str) -> ComparisonOperator:
+        """Operator implied by a comparison pattern"""
+        if any(word in pattern for word in ['better', 'greater', 'higher', 'superior', '>']):
+            return ComparisonOperator.GREATER
+        elif any(word in pattern for word in ['worse', 'less', 'lower', 'inferior', '<']):
+            return ComparisonOperator.LESS
+        else:
+            return ComparisonOperator.EQUAL
+    
+    @staticmethod
+    def _threshold_operator(pattern: str) -> ComparisonOperator:
+        """Operator implied by a threshold pattern"""
+        if any(word in pattern for word in ['at least', '>=', '≥', 'greater than', '>']):
+            return ComparisonOperator.GREATER_EQUAL if 'least' in pattern or '>=' in pattern else ComparisonOperator.GREATER
+        else:
+            return ComparisonOperator.LESS_EQUAL if 'most' in pattern or '<=' in pattern else ComparisonOperator.LESS
     
     def parse_text(self, text: str, evaluator_id: str) -> List[QualitativeEvaluation]:
         """Parse natural language text into qualitative evaluations"""
@@ -63,7 +122,7 @@ class NaturalLanguageParser:
         text = text.lower().strip()
         
         # Split text into sentences to avoid cross-sentence matches
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT.split(text)
         
         for sentence in sentences:
             sentence = sentence.strip()
@@ -71,9 +130,8 @@ class NaturalLanguageParser:
                 continue
                 
             # Try comparison patterns
-            for pattern in self.comparison_patterns:
-                matches = re.findall(pattern, sentence, re.IGNORECASE)
-                for match in matches:
+            for regex, operator in self._comparison_regexes:
+                for match in regex.findall(sentence):
                     if len(match) == 2:
                         proj_a, proj_b = match
                         
@@ -81,14 +139,6 @@ class NaturalLanguageParser:
                         if len(proj_a.strip()) < 3 or len(proj_b.strip()) < 3:
                             continue
                         
-                        # Determine operator based on pattern
-                        if any(word in pattern for word in ['better', 'greater', 'higher', 'superior', '>']):
-                            operator = ComparisonOperator.GREATER
-                        elif any(word in pattern for word in ['worse', 'less', 'lower', 'inferior', '<']):
-                            operator = ComparisonOperator.LESS
-                        else:
-                            operator = ComparisonOperator.EQUAL
-                        
                         evaluation = QualitativeEvaluation(
                             evaluator_id=evaluator_id,
                             evaluation_type=EvaluationType.COMPARISON,
@@ -99,9 +149,8 @@ class NaturalLanguageParser:
                         evaluations.append(evaluation)
         
             # Try range patterns
-            for pattern in self.range_patterns:
-                matches = re.findall(pattern, sentence, re.IGNORECASE)
-                for match in matches:
+            for regex in self._range_regexes:
+                for match in regex.findall(sentence):
                     if len(match) == 3:
                         project, min_val, max_val = match
                         
@@ -125,9 +174,8 @@ class NaturalLanguageParser:
                             continue  # Skip if can't parse numbers
         
             # Try threshold patterns
-            for pattern in self.threshold_patterns:
-                matches = re.findall(pattern, sentence, re.IGNORECASE)
-                for match in matches:
+            for regex, operator in self._threshold_regexes:
+                for match in regex.findall(sentence):
                     if len(match) == 2:
                         project, threshold = match
                         
@@ -139,12 +187,6 @@ class NaturalLanguageParser:
                             # Clean up the threshold value
                             threshold = threshold.rstrip('.,')
                             
-                            # Determine operator based on pattern
-                            if any(word in pattern for word in ['at least', '>=', '≥', 'greater than', '>']):
-                                operator = ComparisonOperator.GREATER_EQUAL if 'least' in pattern or '>=' in pattern else ComparisonOperator.GREATER
-                            else:
-                                operator = ComparisonOperator.LESS_EQUAL if 'most' in pattern or '<=' in pattern else ComparisonOperator.LESS
-                            
                             evaluation = QualitativeEvaluation(
                                 evaluator_id=evaluator_id,
                                 evaluation_type=EvaluationType.THRESHOLD,
@@ -158,12 +200,11 @@ class NaturalLanguageParser:
                             continue  # Skip if can't parse number
         
         # Try ranking patterns on the full text (rankings often span sentences)
-        for pattern in self.ranking_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for regex in self._ranking_regexes:
+            for match in regex.findall(text):
                 if isinstance(match, str):
                     # Handle comma-separated or space-separated rankings
-                    projects = re.split(r'[,\s>]+', match.strip())
+                    projects = _RANKING_SPLIT.split(match.strip())
                     projects = [p.strip() for p in projects if p.strip() and len(p.strip()) >= 3]
                 elif isinstance(match, tuple) and len(match) >= 2:
                     projects = [p.strip() for p in match if p.strip() and len(p.strip()) >= 3]
@@ -230,8 +271,7 @@ class StructuredDataParser:
     @staticmethod
     def from_json(file_path: str) -> List[QualitativeEvaluation]:
         """Load evaluations from JSON file"""
-        with open(file_path, 'r') as file:
-            data = json.load(file)
+        data = _load_json(file_path)
         
         evaluations = []
         for item in data:
@@ -304,7 +344,12 @@ class EvaluationExporter:
     
     @staticmethod
     def to_csv(evaluations: List[QualitativeEvaluation], file_path: str):
-        """Export evaluations to CSV file"""
+        """
+        Export evaluations to CSV file
+        
+        Rows are streamed to a plain csv.writer as tuples, in the column
+        order of the header, instead of building a dict per evaluation.
+        """
         with open(file_path, 'w', newline='') as file:
             if not evaluations:
                 return
@@ -313,22 +358,22 @@ class EvaluationExporter:
                 'evaluator_id', 'evaluation_type', 'projects', 'operator', 
                 'values', 'confidence', 'criteria', 'timestamp', 'metadata'
             ]
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for eval in evaluations:
-                row = {
-                    'evaluator_id': eval.evaluator_id,
-                    'evaluation_type': eval.evaluation_type.value,
-                    'projects': ','.join(eval.projects),
-                    'operator': eval.operator.value if eval.operator else '',
-                    'values': ','.join(map(str, eval.values)) if eval.values else '',
-                    'confidence': eval.confidence,
-                    'criteria': eval.criteria or '',
-                    'timestamp': eval.timestamp or '',
-                    'metadata': json.dumps(eval.metadata) if eval.metadata else '{}'
-                }
-                writer.writerow(row)
+            writer = csv.writer(file)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                (
+                    eval.evaluator_id,
+                    eval.evaluation_type.value,
+                    ','.join(eval.projects),
+                    eval.operator.value if eval.operator else '',
+                    ','.join(map(str, eval.values)) if eval.values else '',
+                    eval.confidence,
+                    eval.criteria or '',
+                    eval.timestamp or '',
+                    json.dumps(eval.metadata) if eval.metadata else '{}'
+                )
+                for eval in evaluations
+            )
     
     @staticmethod
     def to_json(evaluations: List[QualitativeEvaluation], file_path: str):
@@ -342,8 +387,7 @@ class EvaluationExporter:
                 eval_dict['operator'] = eval.operator.value
             data.append(eval_dict)
         
-        with open(file_path, 'w') as file:
-            json.dump(data, file, indent=2)
+        _dump_json(data, file_path)
     
     @staticmethod
     def to_dataframe(evaluations: List[QualitativeEvaluation]) -> pd.DataFrame:
@@ -66,7 +66,7 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 import scipy.spatial
 from scipy.optimize import linprog
-from typing import List, Tuple, Dict, Optional, Any
+from typing import List, Tuple, Dict, Optional, Any, Union, IO
 import itertools
 import warnings
 
@@ -77,9 +77,75 @@ except ImportError:
     PYPOMAN_AVAILABLE = False
     warnings.warn("pypoman not available. Some polytope operations may be limited.")
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from qualitative_evaluation_translator import QualitativeEvaluationTranslator, LinearConstraint
 
 
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _verify_vertices_kernel(A, b, V, tol):
+        # Stream each vertex once; stop at its first violated constraint
+        ok = np.ones(V.shape[0], dtype=np.bool_)
+        for i in prange(V.shape[0]):
+            for r in range(A.shape[0]):
+                s = 0.0
+                for j in range(A.shape[1]):
+                    s += A[r, j] * V[i, j]
+                if s - b[r] > tol:
+                    ok[i] = False
+                    break
+        return ok.all()
+
+
+def verify_vertices(A: np.ndarray, b: np.ndarray, vertices: np.ndarray, tol: float = 1e-8) -> bool:
+    """
+    Check that every vertex satisfies A * v <= b + tol.
+    
+    Uses a parallel Numba kernel when numba is installed (no residual matrix
+    is materialized), otherwise a single NumPy matmul.
+    
+    Args:
+        A: Constraint matrix, shape (n_constraints, n_dimensions)
+        b: Constraint bounds, shape (n_constraints,)
+        vertices: Vertices, shape (n_vertices, n_dimensions)
+        tol: Allowed violation
+        
+    Returns:
+        True if no vertex violates any constraint
+    """
+    if len(vertices) == 0:
+        return True
+    A = np.ascontiguousarray(A, dtype=np.float64)
+    b = np.ascontiguousarray(b, dtype=np.float64)
+    vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return bool(_verify_vertices_kernel(A, b, vertices, tol))
+    return bool(np.all(A @ vertices.T - b[:, None] <= tol))
+
+
+def _deduplicate_vertices(vertices: np.ndarray, atol: float = 1e-8) -> np.ndarray:
+    """
+    Drop vertices that are np.allclose to an earlier kept vertex.
+    
+    Each kept vertex is compared against all later ones in a single
+    vectorized np.isclose call rather than pairwise in Python.
+    """
+    if len(vertices) == 0:
+        return np.array([])
+    
+    removed = np.zeros(len(vertices), dtype=bool)
+    for i in range(len(vertices)):
+        if removed[i]:
+            continue
+        removed[i + 1:] |= np.all(np.isclose(vertices[i + 1:], vertices[i], atol=atol), axis=1)
+    return vertices[~removed]
+
+
 class PolytopeVisualizer:
     """
     Interactive visualization of constraint polytopes from qualitative evaluations.
@@ -88,19 +154,24 @@ class PolytopeVisualizer:
     linear constraints in 2D and 3D, with interactive controls for exploration.
     """
     
-    def __init__(self, translator: QualitativeEvaluationTranslator):
+    def __init__(self, translator: QualitativeEvaluationTranslator,
+                 constraint_matrices: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None):
         """
         Initialize the polytope visualizer.
         
         Args:
             translator: QualitativeEvaluationTranslator instance with constraints
+            constraint_matrices: Optional (A_ineq, b_ineq, A_eq, b_eq) already
+                obtained from translator.get_constraint_matrices()
         """
         self.translator = translator
         # Ensure constraints are generated
         if not translator.constraints:
             translator.translate_evaluations()
         self.constraints = translator.constraints
-        self.A_ineq, self.b_ineq, self.A_eq, self.b_eq = translator.get_constraint_matrices()
+        if constraint_matrices is None:
+            constraint_matrices = translator.get_constraint_matrices()
+        self.A_ineq, self.b_ineq, self.A_eq, self.b_eq = constraint_matrices
         
         # Generate dimension names
         self.dimension_names = []
@@ -111,8 +182,12 @@ class PolytopeVisualizer:
         
         # Cache for computed polytope properties
         self._vertices = None
+        # Bounds the cached vertices were computed for
+        self._vertices_bounds = None
         self._volume = None
         self._centroid = None
+        # Last interior point found for the halfspace intersection
+        self._last_x0 = None
         
     def compute_vertices(self, bounds: Optional[List[Tuple[float, float]]] = None) -> np.ndarray:
         """
@@ -123,9 +198,16 @@ class PolytopeVisualizer:
             
         Returns:
             Array of polytope vertices, shape (n_vertices, n_dimensions)
+            
+        The result is cached per bounds; computing it again for other bounds
+        starts the halfspace intersection from the previous interior point
+        when that point is still strictly inside.
         """
-        if self._vertices is not None:
+        bounds_key = None if bounds is None else tuple((float(lo), float(hi)) for lo, hi in bounds)
+        if self._vertices is not None and bounds_key == self._vertices_bounds:
             return self._vertices
+        self._vertices = None
+        self._vertices_bounds = bounds_key
             
         if PYPOMAN_AVAILABLE and self.A_eq is None:
             # Use pypoman for efficient vertex computation
@@ -136,14 +218,26 @@ class PolytopeVisualizer:
             except Exception as e:
                 warnings.warn(f"pypoman vertex computation failed: {e}. Using fallback method.")
         
-        # Fallback: enumerate constraint intersections
-        vertices = []
-        n_constraints = len(self.b_ineq)
-        
         # Set default bounds if not provided
         if bounds is None:
             bounds = [(-10, 10) for _ in range(self.n_dimensions)]
         
+        # Contradictory single-variable bounds (e.g. disjoint ranges): empty
+        if self._has_contradictory_bounds(bounds):
+            self._vertices = np.array([])
+            return self._vertices
+        
+        # Halfspace intersection from a Chebyshev interior point (its LP also
+        # detects any other infeasibility)
+        vertices = self._compute_vertices_halfspace(bounds)
+        if vertices is not None:
+            self._vertices = vertices
+            return self._vertices
+        
+        # Fallback: enumerate constraint intersections
+        vertices = []
+        n_constraints = len(self.b_ineq)
+        
         # Generate combinations of constraints to find intersection points
         for constraint_indices in itertools.combinations(range(n_constraints), self.n_dimensions):
             try:
@@ -164,31 +258,114 @@ class PolytopeVisualizer:
         
         if vertices:
             # Remove duplicate vertices
-            vertices = np.array(vertices)
-            unique_vertices = []
-            for vertex in vertices:
-                is_duplicate = False
-                for existing in unique_vertices:
-                    if np.allclose(vertex, existing, atol=1e-8):
-                        is_duplicate = True
-                        break
-                if not is_duplicate:
-                    unique_vertices.append(vertex)
-            
-            self._vertices = np.array(unique_vertices) if unique_vertices else np.array([])
+            self._vertices = _deduplicate_vertices(np.array(vertices))
         else:
             self._vertices = np.array([])
             
         return self._vertices
     
-    def compute_polytope_properties(self) -> Dict[str, Any]:
+    def _has_contradictory_bounds(self, bounds: List[Tuple[float, float]]) -> bool:
+        """
+        Check the per-coordinate bounds implied by single-variable constraints
+        (a * x_j <= b) and the box bounds for lower > upper, without an LP.
+        """
+        A_ineq = np.asarray(self.A_ineq, dtype=float)
+        b_ineq = np.asarray(self.b_ineq, dtype=float)
+        lower = np.array([lo for lo, _ in bounds], dtype=float)
+        upper = np.array([hi for _, hi in bounds], dtype=float)
+        
+        single = np.count_nonzero(A_ineq, axis=1) == 1
+        if np.any(single):
+            cols = np.argmax(A_ineq[single] != 0, axis=1)
+            coeffs = A_ineq[single, cols]
+            limits = b_ineq[single] / coeffs
+            # a > 0 gives an upper bound on x_j, a < 0 a lower bound
+            np.minimum.at(upper, cols[coeffs > 0], limits[coeffs > 0])
+            np.maximum.at(lower, cols[coeffs < 0], limits[coeffs < 0])
+        
+        return bool(np.any(lower > upper + 1e-10))
+    
+    def _compute_vertices_halfspace(self, bounds: List[Tuple[float, float]]) -> Optional[np.ndarray]:
+        """
+        Compute vertices with scipy's HalfspaceIntersection (Qhull).
+        
+        The inequality system is clipped to the bounds box, an interior point
+        is found as the Chebyshev center (max r s.t. A_i x + r ||A_i|| <= b_i)
+        with HiGHS, and only intersection points that are vertices of the
+        unclipped system (n linearly independent active constraints) are kept,
+        matching the constraint enumeration fallback.
+        
+        Returns:
+            Array of vertices, or None if this method does not apply (fewer
+            than 2 dimensions, or no strictly interior point) and the caller
+            should fall back to enumeration.
+        """
+        n = self.n_dimensions
+        A_ineq = np.asarray(self.A_ineq, dtype=float)
+        b_ineq = np.asarray(self.b_ineq, dtype=float)
+        if n < 2 or len(b_ineq) == 0:
+            return None
+        if len(b_ineq) < n:
+            # No point has n active constraints, so there are no vertices to
+            # keep; skip Qhull, which does not scale to high dimensions
+            return np.array([])
+        
+        lower = np.array([lo for lo, _ in bounds], dtype=float)
+        upper = np.array([hi for _, hi in bounds], dtype=float)
+        A = np.vstack([A_ineq, np.eye(n), -np.eye(n)])
+        b = np.concatenate([b_ineq, upper, -lower])
+        
+        # Reuse the previous interior point while it stays strictly inside
+        # (HiGHS takes no warm start through linprog, so skip the LP instead)
+        x0 = self._last_x0
+        if x0 is None or len(x0) != n or not np.all(A @ x0 < b - 1e-9):
+            # Chebyshev center of the clipped polytope
+            norms = np.linalg.norm(A, axis=1)
+            c = np.zeros(n + 1)
+            c[-1] = -1.0
+            result = linprog(c, A_ub=np.column_stack([A, norms]), b_ub=b,
+                             bounds=[(None, None)] * n + [(0, None)], method='highs')
+            if not result.success:
+                # Infeasible: no vertices at all
+                return np.array([]) if result.status == 2 else None
+            if result.x[-1] <= 1e-9:
+                # Not full-dimensional, Qhull needs a strictly interior point
+                return None
+            x0 = result.x[:-1]
+            self._last_x0 = x0
+        
+        try:
+            # Qhull halfspaces are stacked as [A; -b] for A x - b <= 0
+            hs = scipy.spatial.HalfspaceIntersection(np.column_stack([A, -b]), x0)
+        except Exception as e:
+            warnings.warn(f"Halfspace intersection failed: {e}. Using fallback method.")
+            return None
+        
+        candidates = hs.intersections
+        
+        # Keep points that are vertices of the original (unclipped) system:
+        # feasible, with n linearly independent active constraints. The
+        # count test screens out box-only points before any rank computation.
+        residuals = A_ineq @ candidates.T - b_ineq[:, None]
+        active = np.abs(residuals) <= 1e-8
+        screened = np.flatnonzero(np.all(residuals <= 1e-10, axis=0) & (active.sum(axis=0) >= n))
+        keep = [k for k in screened if np.linalg.matrix_rank(A_ineq[active[:, k]]) == n]
+        
+        # Remove duplicate vertices (degenerate vertices are reported once per facet)
+        return _deduplicate_vertices(candidates[keep])
+    
+    def compute_polytope_properties(self, vertices: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Compute various properties of the polytope.
         
+        Args:
+            vertices: Vertices from compute_vertices(), if already available
+            
         Returns:
             Dictionary containing polytope properties
         """
-        vertices = self.compute_vertices()
+        if vertices is None:
+            vertices = self.compute_vertices()
         
         properties = {
             'n_vertices': len(vertices),
@@ -224,7 +401,9 @@ class PolytopeVisualizer:
                               show_vertices: bool = True,
                               show_constraints: bool = True,
                               show_feasible_region: bool = True,
-                              resolution: int = 100) -> go.Figure:
+                              resolution: int = 100,
+                              precomputed_vertices: Optional[np.ndarray] = None,
+                              projected_constraints: Optional[np.ndarray] = None) -> go.Figure:
         """
         Create 2D visualization of the polytope.
         
@@ -235,6 +414,10 @@ class PolytopeVisualizer:
             show_constraints: Whether to show constraint boundaries
             show_feasible_region: Whether to shade feasible region
             resolution: Resolution for constraint boundary plotting
+            precomputed_vertices: Vertices from compute_vertices(), to reuse
+                across several projections
+            projected_constraints: A_ineq[:, [dim_x, dim_y]], if already
+                gathered (see create_2d_visualizations)
             
         Returns:
             Plotly figure object
@@ -242,7 +425,7 @@ class PolytopeVisualizer:
         fig = go.Figure()
         
         # Get vertices and project to 2D
-        vertices = self.compute_vertices()
+        vertices = self.compute_vertices() if precomputed_vertices is None else precomputed_vertices
         
         if len(vertices) == 0:
             fig.add_annotation(
@@ -253,8 +436,8 @@ class PolytopeVisualizer:
             )
             return fig
         
-        # Project vertices to selected dimensions
-        vertices_2d = vertices[:, [dim_x, dim_y]]
+        # Project vertices to selected dimensions (float32 is ample for plotting)
+        vertices_2d = vertices[:, [dim_x, dim_y]].astype(np.float32)
         
         # Compute 2D convex hull for visualization
         if len(vertices_2d) >= 3:
@@ -305,46 +488,48 @@ class PolytopeVisualizer:
             else:
                 x_min, x_max, y_min, y_max = -5, 5, -5, 5
             
+            # Coefficients of the inequality constraints (the rows of A_ineq)
+            # for the selected dimensions
+            if projected_constraints is None:
+                projected_constraints = np.asarray(self.A_ineq)[:, [dim_x, dim_y]]
+            inequality_constraints = [(i, c) for i, c in enumerate(self.constraints) if not c.is_equality]
+            
             # Plot each constraint boundary
-            for i, constraint in enumerate(self.constraints):
-                if not constraint.is_equality:  # Only plot inequality constraints
-                    # Extract coefficients for selected dimensions
-                    a_x = constraint.coefficients[dim_x]
-                    a_y = constraint.coefficients[dim_y]
-                    b = constraint.bound
-                    
-                    # Skip if constraint doesn't involve these dimensions
-                    if abs(a_x) < 1e-10 and abs(a_y) < 1e-10:
-                        continue
+            for (i, constraint), (a_x, a_y) in zip(inequality_constraints, projected_constraints):
+                b = constraint.bound
+                
+                # Skip if constraint doesn't involve these dimensions
+                if abs(a_x) < 1e-10 and abs(a_y) < 1e-10:
+                    continue
+                
+                # Generate line points
+                if abs(a_y) > 1e-10:  # Can solve for y
+                    x_line = np.linspace(x_min, x_max, resolution)
+                    y_line = (b - a_x * x_line) / a_y
                     
-                    # Generate line points
-                    if abs(a_y) > 1e-10:  # Can solve for y
-                        x_line = np.linspace(x_min, x_max, resolution)
-                        y_line = (b - a_x * x_line) / a_y
-                        
-                        # Filter points within plot bounds
-                        valid_mask = (y_line >= y_min) & (y_line <= y_max)
-                        x_line = x_line[valid_mask]
-                        y_line = y_line[valid_mask]
-                        
-                    elif abs(a_x) > 1e-10:  # Vertical line
-                        x_line = np.full(resolution, b / a_x)
-                        y_line = np.linspace(y_min, y_max, resolution)
-                    else:
-                        continue
+                    # Filter points within plot bounds
+                    valid_mask = (y_line >= y_min) & (y_line <= y_max)
+                    x_line = x_line[valid_mask]
+                    y_line = y_line[valid_mask]
                     
-                    if len(x_line) > 0:
-                        fig.add_trace(go.Scatter(
-                            x=x_line,
-                            y=y_line,
-                            mode='lines',
-                            line=dict(color=f'rgba({i*50 % 255}, {(i*80) % 255}, {(i*120) % 255}, 0.7)', 
-                                     width=1, dash='dash'),
-                            name=f'Constraint {i+1}',
-                            hovertemplate=f'Constraint {i+1}: {constraint.constraint_id}<br>' +
-                                        f'{self.dimension_names[dim_x]}: %{{x}}<br>' +
-                                        f'{self.dimension_names[dim_y]}: %{{y}}<extra></extra>'
-                        ))
+                elif abs(a_x) > 1e-10:  # Vertical line
+                    x_line = np.full(resolution, b / a_x)
+                    y_line = np.linspace(y_min, y_max, resolution)
+                else:
+                    continue
+                
+                if len(x_line) > 0:
+                    fig.add_trace(go.Scatter(
+                        x=x_line,
+                        y=y_line,
+                        mode='lines',
+                        line=dict(color=f'rgba({i*50 % 255}, {(i*80) % 255}, {(i*120) % 255}, 0.7)', 
+                                 width=1, dash='dash'),
+                        name=f'Constraint {i+1}',
+                        hovertemplate=f'Constraint {i+1}: {constraint.constraint_id}<br>' +
+                                    f'{self.dimension_names[dim_x]}: %{{x}}<br>' +
+                                    f'{self.dimension_names[dim_y]}: %{{y}}<extra></extra>'
+                    ))
         
         # Update layout
         fig.update_layout(
@@ -358,13 +543,45 @@ class PolytopeVisualizer:
         
         return fig
     
+    def create_2d_visualizations(self,
+                                 dimension_pairs: List[Tuple[int, int]],
+                                 **kwargs) -> List[go.Figure]:
+        """
+        Create 2D visualizations for several dimension pairs.
+        
+        Vertices are computed once and the constraint coefficients of all
+        pairs are gathered from A_ineq in a single fancy-index.
+        
+        Args:
+            dimension_pairs: List of (dim_x, dim_y) pairs
+            **kwargs: Passed on to create_2d_visualization
+            
+        Returns:
+            List of Plotly figures, one per pair
+        """
+        vertices = self.compute_vertices()
+        pairs = np.asarray(dimension_pairs, dtype=int).reshape(-1, 2)
+        # Shape (n_constraints, n_pairs, 2)
+        projected_constraints = np.asarray(self.A_ineq)[:, pairs]
+        
+        return [
+            self.create_2d_visualization(
+                dim_x=int(dim_x), dim_y=int(dim_y),
+                precomputed_vertices=vertices,
+                projected_constraints=projected_constraints[:, k],
+                **kwargs
+            )
+            for k, (dim_x, dim_y) in enumerate(pairs)
+        ]
+    
     def create_3d_visualization(self,
                               dim_x: int = 0,
                               dim_y: int = 1, 
                               dim_z: int = 2,
                               show_vertices: bool = True,
                               show_wireframe: bool = True,
-                              opacity: float = 0.3) -> go.Figure:
+                              opacity: float = 0.3,
+                              precomputed_vertices: Optional[np.ndarray] = None) -> go.Figure:
         """
         Create 3D visualization of the polytope.
         
@@ -375,6 +592,8 @@ class PolytopeVisualizer:
             show_vertices: Whether to show polytope vertices
             show_wireframe: Whether to show polytope edges
             opacity: Opacity of polytope surface
+            precomputed_vertices: Vertices from compute_vertices(), to reuse
+                across several projections
             
         Returns:
             Plotly figure object
@@ -382,7 +601,7 @@ class PolytopeVisualizer:
         fig = go.Figure()
         
         # Get vertices and project to 3D
-        vertices = self.compute_vertices()
+        vertices = self.compute_vertices() if precomputed_vertices is None else precomputed_vertices
         
         if len(vertices) == 0:
             fig.add_annotation(
@@ -393,11 +612,11 @@ class PolytopeVisualizer:
             )
             return fig
         
-        # Project vertices to selected dimensions
-        vertices_3d = vertices[:, [dim_x, dim_y, dim_z]]
+        # Project vertices to selected dimensions (float32 is ample for plotting)
+        vertices_3d = vertices[:, [dim_x, dim_y, dim_z]].astype(np.float32)
         
-        # Compute 3D convex hull
-        if len(vertices_3d) >= 4:
+        # Compute 3D convex hull, unless the projection is flat (zero volume)
+        if len(vertices_3d) >= 4 and np.linalg.matrix_rank(vertices_3d - vertices_3d[0]) == 3:
             try:
                 hull_3d = scipy.spatial.ConvexHull(vertices_3d)
                 
@@ -471,30 +690,36 @@ class PolytopeVisualizer:
                    [{'type': 'scatter3d'}, {'type': 'table'}]]
         )
         
+        # All projections share one vertex set
+        vertices = self.compute_vertices()
+        
         # Add 2D projections
         if self.n_dimensions >= 2:
             # First 2D projection
-            fig_2d_1 = self.create_2d_visualization(0, 1, show_constraints=False)
+            fig_2d_1 = self.create_2d_visualization(0, 1, show_constraints=False,
+                                                    precomputed_vertices=vertices)
             for trace in fig_2d_1.data:
                 trace.showlegend = False
                 fig.add_trace(trace, row=1, col=1)
             
             # Second 2D projection (if possible)
             if self.n_dimensions >= 4:
-                fig_2d_2 = self.create_2d_visualization(2, 3, show_constraints=False)
+                fig_2d_2 = self.create_2d_visualization(2, 3, show_constraints=False,
+                                                        precomputed_vertices=vertices)
                 for trace in fig_2d_2.data:
                     trace.showlegend = False
                     fig.add_trace(trace, row=1, col=2)
         
         # Add 3D visualization
         if self.n_dimensions >= 3:
-            fig_3d = self.create_3d_visualization(0, 1, 2, show_wireframe=False)
+            fig_3d = self.create_3d_visualization(0, 1, 2, show_wireframe=False,
+                                                  precomputed_vertices=vertices)
             for trace in fig_3d.data:
                 trace.showlegend = False
                 fig.add_trace(trace, row=2, col=1)
         
         # Add properties table
-        properties = self.compute_polytope_properties()
+        properties = self.compute_polytope_properties(vertices)
         
         table_data = []
         for key, value in properties.items():
@@ -524,60 +749,70 @@ class PolytopeVisualizer:
         
         return fig
     
-    def export_polytope_data(self, filename: str, format: str = 'json') -> None:
+    def export_polytope_data(self, filename: Union[str, IO], format: str = 'json',
+                             vertices: Optional[np.ndarray] = None) -> None:
         """
         Export polytope data to file.
         
         Args:
-            filename: Output filename
+            filename: Output filename, or an open file-like object (text for
+                'json'/'csv', binary for 'npz')
             format: Export format ('json', 'csv', 'npz')
+            vertices: Vertices from compute_vertices(), to reuse across
+                several exports
         """
-        vertices = self.compute_vertices()
-        properties = self.compute_polytope_properties()
+        if format not in ('json', 'csv', 'npz'):
+            raise ValueError(f"Unsupported format: {format}")
         
-        # Convert numpy arrays to lists for JSON serialization
-        json_properties = {}
-        for key, value in properties.items():
-            if isinstance(value, np.ndarray):
-                json_properties[key] = value.tolist()
-            elif isinstance(value, dict):
-                json_properties[key] = {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in value.items()}
-            else:
-                json_properties[key] = value
-        
-        data = {
-            'vertices': vertices.tolist() if len(vertices) > 0 else [],
-            'constraints': [
-                {
-                    'coefficients': c.coefficients.tolist(),
-                    'bound': float(c.bound),
-                    'is_equality': c.is_equality,
-                    'constraint_id': c.constraint_id
-                }
-                for c in self.constraints
-            ],
-            'dimension_names': self.dimension_names,
-            'properties': json_properties
-        }
+        if vertices is None:
+            vertices = self.compute_vertices()
         
         if format == 'json':
             import json
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            properties = self.compute_polytope_properties(vertices)
+            
+            # Convert numpy arrays to lists for JSON serialization
+            json_properties = {}
+            for key, value in properties.items():
+                if isinstance(value, np.ndarray):
+                    json_properties[key] = value.tolist()
+                elif isinstance(value, dict):
+                    json_properties[key] = {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in value.items()}
+                else:
+                    json_properties[key] = value
+            
+            data = {
+                'vertices': vertices.tolist() if len(vertices) > 0 else [],
+                'constraints': [
+                    {
+                        'coefficients': c.coefficients.tolist(),
+                        'bound': float(c.bound),
+                        'is_equality': c.is_equality,
+                        'constraint_id': c.constraint_id
+                    }
+                    for c in self.constraints
+                ],
+                'dimension_names': self.dimension_names,
+                'properties': json_properties
+            }
+            
+            if hasattr(filename, 'write'):
+                json.dump(data, filename, indent=2)
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(data, f, indent=2)
         elif format == 'csv':
-            # Export vertices as CSV
+            # Export vertices as CSV in one call to pandas' C writer
             if len(vertices) > 0:
                 df = pd.DataFrame(vertices, columns=self.dimension_names)
                 df.to_csv(filename, index=False)
-        elif format == 'npz':
-            # Export as NumPy archive
-            np.savez(filename, 
-                    vertices=vertices,
+        else:
+            # Export as NumPy archive; vertices in float32 (constraints stay float64)
+            np.savez_compressed(filename,
+                    vertices=vertices.astype(np.float32, copy=False),
                     A_ineq=self.A_ineq,
                     b_ineq=self.b_ineq,
                     dimension_names=self.dimension_names)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
 
 
 def create_interactive_polytope_app(translator: QualitativeEvaluationTranslator):
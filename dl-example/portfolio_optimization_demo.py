@@ -6,52 +6,114 @@ This script demonstrates the complete workflow of the robust human-machine
 project portfolio selection system using real project data from the ecosystem.
 """
 
+import io
 import json
+import sys
+import traceback
 import numpy as np
+from collections import Counter
+from contextlib import contextmanager, redirect_stdout
+from functools import wraps
 from typing import List, Dict
 
-from qualitative_evaluation_translator import (
-    QualitativeEvaluationTranslator,
-    QualitativeEvaluation,
-    EvaluationType,
-    ComparisonOperator
-)
-from evaluation_input_parser import StructuredDataParser
+# pandas, the translator, the parser and scipy.optimize are imported inside
+# the demo functions that use them, so importing this module stays cheap
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
-def load_project_data():
-    """Load the generated project portfolio data"""
-    with open("logos_nimbus_status_projects.json", 'r') as f:
-        data = json.load(f)
-    
-    projects = data['projects']
-    project_names = [p['name'] for p in projects]
+
+@contextmanager
+def buffered_stdout():
+    """
+    Print through one block-buffered wrapper of stdout instead of a line
+    buffered stream; the demo flushes it at section boundaries and before
+    code that logs to stderr, so the two streams stay in order
+    """
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        # e.g. stdout already replaced by a StringIO
+        yield
+        return
+    
+    sys.stdout.flush()
+    stream = io.TextIOWrapper(buffer, encoding=sys.stdout.encoding, errors=sys.stdout.errors,
+                              write_through=False)
+    try:
+        with redirect_stdout(stream):
+            yield
+    finally:
+        stream.flush()
+        # Leave the underlying buffer open for the original stdout
+        stream.detach()
+
+
+def section(func):
+    """Flush buffered output when a demo section ends"""
+    @wraps(func)
+    def run_section(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sys.stdout.flush()
+    return run_section
+
+
+@section
+def load_project_data(path="logos_nimbus_status_projects.json"):
+    """
+    Load the generated project portfolio data
+    
+    Projects are returned as a DataFrame (one row per project) so the demos
+    read whole columns instead of looking up keys project by project. When
+    ijson is installed the file is streamed, so large portfolios are never
+    held as a complete JSON object tree.
+    """
+    import pandas as pd
+    
+    if IJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            metadata = next(ijson.items(f, 'metadata', use_float=True))
+        with open(path, 'rb') as f:
+            projects = pd.DataFrame(ijson.items(f, 'projects.item', use_float=True))
+    else:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        metadata = data['metadata']
+        projects = pd.DataFrame(data['projects'])
+    
+    project_names = projects['name'].tolist()
     
     print("Loaded Project Portfolio:")
     print(f"  Total Projects: {len(projects)}")
-    print(f"  Total Budget: ${data['metadata']['total_budget']:.1f}M")
-    print(f"  Ecosystems: {', '.join(data['metadata']['ecosystems'])}")
+    print(f"  Total Budget: ${metadata['total_budget']:.1f}M")
+    print(f"  Ecosystems: {', '.join(metadata['ecosystems'])}")
     
     return projects, project_names
 
 
+@section
 def load_stakeholder_evaluations():
     """Load stakeholder evaluations"""
+    from evaluation_input_parser import StructuredDataParser
+    
     evaluations = StructuredDataParser.from_json("stakeholder_evaluations.json")
     
     print(f"\nLoaded Stakeholder Evaluations:")
     print(f"  Total Evaluations: {len(evaluations)}")
     
-    evaluator_counts = {}
-    for eval in evaluations:
-        evaluator_counts[eval.evaluator_id] = evaluator_counts.get(eval.evaluator_id, 0) + 1
+    evaluator_counts = Counter(e.evaluator_id for e in evaluations)
     
-    for evaluator, count in evaluator_counts.items():
+    for evaluator, count in evaluator_counts.most_common():
         print(f"    {evaluator}: {count} evaluations")
     
     return evaluations
 
 
+@section
 def demonstrate_constraint_generation(projects, evaluations):
     """Demonstrate the constraint generation process"""
     print("\n" + "="*60)
@@ -59,11 +121,13 @@ def demonstrate_constraint_generation(projects, evaluations):
     print("="*60)
     
     # Extract project names and criteria
-    project_names = [p['name'] for p in projects]
+    project_names = projects['name'].tolist()
     criteria = ['strategic_value', 'technical_complexity', 'market_impact', 
                 'resource_requirement', 'innovation_level']
     
-    # Initialize translator
+    # Initialize translator (which logs to stderr)
+    from qualitative_evaluation_translator import QualitativeEvaluationTranslator
+    sys.stdout.flush()
     translator = QualitativeEvaluationTranslator(project_names, criteria)
     
     print(f"Initialized translator:")
@@ -72,6 +136,7 @@ def demonstrate_constraint_generation(projects, evaluations):
     print(f"  Variables: {len(project_names)} × {len(criteria)} = {len(project_names) * len(criteria)}")
     
     # Add evaluations
+    sys.stdout.flush()
     for evaluation in evaluations:
         translator.add_evaluation(evaluation)
     
@@ -82,12 +147,12 @@ def demonstrate_constraint_generation(projects, evaluations):
     print(f"  Input Evaluations: {len(evaluations)}")
     print(f"  Generated Constraints: {len(constraints)}")
     
-    # Get constraint matrices
-    A_ineq, b_ineq, A_eq, b_eq = translator.get_constraint_matrices()
+    # Get constraint matrices (sparse: each row only touches 1-2 variables)
+    A_ineq, b_ineq, A_eq, b_eq = translator.get_constraint_matrices(sparse=True)
     
     print(f"  Inequality Constraints: {A_ineq.shape[0]}")
-    print(f"  Equality Constraints: {A_eq.shape[0] if A_eq.size > 0 else 0}")
-    print(f"  Constraint Matrix Shape: {A_ineq.shape}")
+    print(f"  Equality Constraints: {A_eq.shape[0]}")
+    print(f"  Constraint Matrix Shape: {A_ineq.shape} ({A_ineq.nnz} non-zeros)")
     
     # Show example constraints
     print(f"\nExample Constraints:")
@@ -100,9 +165,10 @@ def demonstrate_constraint_generation(projects, evaluations):
     if len(constraints) > 5:
         print(f"  ... and {len(constraints) - 5} more constraints")
     
-    return translator, constraints
+    return translator, constraints, (A_ineq, b_ineq, A_eq, b_eq)
 
 
+@section
 def demonstrate_budget_constraints(projects):
     """Demonstrate budget constraint analysis"""
     print("\n" + "="*60)
@@ -116,10 +182,21 @@ def demonstrate_budget_constraints(projects):
     for year, budget in budget_data['annual_budgets'].items():
         print(f"  {year}: ${budget:.1f}M")
     
+    # Per-year utilization as parallel arrays; rate and overrun in one pass
+    utilization = budget_data['utilization_rates']
+    years = list(utilization)
+    allocated = np.fromiter((utilization[y]['allocated'] for y in years), dtype=float, count=len(years))
+    limit = np.fromiter((utilization[y]['limit'] for y in years), dtype=float, count=len(years))
+    rate = allocated / limit
+    over = allocated > limit
+    budget_data['utilization_arrays'] = {
+        'years': years, 'allocated': allocated, 'limit': limit, 'rate': rate, 'over': over
+    }
+    
     print("\nBudget Utilization:")
-    for year, data in budget_data['utilization_rates'].items():
-        status = "⚠️  OVER BUDGET" if data['over_budget'] else "✅ Within Budget"
-        print(f"  {year}: ${data['allocated']:.1f}M / ${data['limit']:.1f}M ({data['utilization_rate']:.1%}) {status}")
+    for year, alloc, lim, r, is_over in zip(years, allocated, limit, rate, over):
+        status = "⚠️  OVER BUDGET" if is_over else "✅ Within Budget"
+        print(f"  {year}: ${alloc:.1f}M / ${lim:.1f}M ({r:.1%}) {status}")
     
     if budget_data['constraint_violations']:
         print(f"\nBudget Violations: {len(budget_data['constraint_violations'])}")
@@ -130,50 +207,78 @@ def demonstrate_budget_constraints(projects):
     return budget_data
 
 
+@section
 def demonstrate_project_constraints(projects):
     """Demonstrate project interdependency constraints"""
     print("\n" + "="*60)
     print("PROJECT INTERDEPENDENCY ANALYSIS")
     print("="*60)
     
-    cooperation_pairs = []
-    precedence_pairs = []
-    exclusive_pairs = []
-    
-    for project in projects:
-        project_name = project['name']
-        
-        # Cooperation constraints
-        for coop_project in project['cooperation_projects']:
-            cooperation_pairs.append((project_name, coop_project))
-        
-        # Precedence constraints
-        for prec_project in project['precedence_projects']:
-            precedence_pairs.append((prec_project, project_name))  # prec_project must come before project_name
-        
-        # Exclusive constraints
-        for excl_project in project['exclusive_projects']:
-            exclusive_pairs.append((project_name, excl_project))
+    # Resolve project ids to row indices once; each relation is stored as an
+    # (n, 2) int32 array of index pairs rather than a list of name tuples
+    project_names = projects['name'].to_numpy()
+    id_to_idx = {project_id: i for i, project_id in enumerate(projects['project_id'])}
+    
+    # Cooperation and exclusivity are symmetric: (i, j) and (j, i) are listed
+    # by both projects, so keep one pair per (min, max) index key. Relations
+    # to ids that are not among the loaded projects are skipped and reported.
+    cooperation, precedence, exclusive = [], [], []
+    seen_cooperation, seen_exclusive = set(), set()
+    unknown_ids = set()
+    relations = zip(projects['cooperation_projects'], projects['precedence_projects'],
+                    projects['exclusive_projects'])
+    for i, (coop_ids, prec_ids, excl_ids) in enumerate(relations):
+        for other in coop_ids:
+            j = id_to_idx.get(other)
+            if j is None:
+                unknown_ids.add(other)
+                continue
+            key = (min(i, j), max(i, j))
+            if key not in seen_cooperation:
+                seen_cooperation.add(key)
+                cooperation += key
+        for other in prec_ids:
+            j = id_to_idx.get(other)
+            if j is None:
+                unknown_ids.add(other)
+                continue
+            precedence += (j, i)  # prec_project must come before project
+        for other in excl_ids:
+            j = id_to_idx.get(other)
+            if j is None:
+                unknown_ids.add(other)
+                continue
+            key = (min(i, j), max(i, j))
+            if key not in seen_exclusive:
+                seen_exclusive.add(key)
+                exclusive += key
+    
+    cooperation_pairs = _index_pairs(cooperation)
+    precedence_pairs = _index_pairs(precedence)
+    exclusive_pairs = _index_pairs(exclusive)
     
     print(f"Cooperation Constraints: {len(cooperation_pairs)}")
-    if cooperation_pairs:
+    if len(cooperation_pairs):
         print("  Projects with synergistic benefits:")
-        for proj1, proj2 in cooperation_pairs[:3]:
-            print(f"    • {proj1} ↔ {proj2}")
+        for i, j in cooperation_pairs[:3]:
+            print(f"    • {project_names[i]} ↔ {project_names[j]}")
         if len(cooperation_pairs) > 3:
             print(f"    ... and {len(cooperation_pairs) - 3} more")
     
     print(f"\nPrecedence Constraints: {len(precedence_pairs)}")
-    if precedence_pairs:
+    if len(precedence_pairs):
         print("  Project dependencies:")
-        for proj1, proj2 in precedence_pairs:
-            print(f"    • {proj1} → {proj2}")
+        for i, j in precedence_pairs:
+            print(f"    • {project_names[i]} → {project_names[j]}")
     
     print(f"\nExclusive Constraints: {len(exclusive_pairs)}")
-    if exclusive_pairs:
+    if len(exclusive_pairs):
         print("  Mutually exclusive projects:")
-        for proj1, proj2 in exclusive_pairs:
-            print(f"    • {proj1} ⊗ {proj2}")
+        for i, j in exclusive_pairs:
+            print(f"    • {project_names[i]} ⊗ {project_names[j]}")
+    
+    if unknown_ids:
+        print(f"\nSkipped relations to unknown projects: {', '.join(map(str, sorted(unknown_ids, key=str)))}")
     
     return {
         'cooperation': cooperation_pairs,
@@ -182,24 +287,75 @@ def demonstrate_project_constraints(projects):
     }
 
 
-def demonstrate_optimization_integration(translator, constraints):
+def _index_pairs(flat_indices):
+    """Pack a flat [i0, j0, i1, j1, ...] index list into an (n, 2) int32 array"""
+    return np.fromiter(flat_indices, dtype=np.int32, count=len(flat_indices)).reshape(-1, 2)
+
+
+def solve_batch(A_ineq, b_ineq, A_eq, b_eq, C, bounds=(0, 1)):
+    """
+    Solve min c^T x over the same constraint system for every column c of C
+    
+    This is a per-column loop over linprog: each call validates and
+    converts the constraint data again, so it collects the results in one
+    place rather than being faster than separate solves.
+    
+    Args:
+        A_ineq, b_ineq, A_eq, b_eq: Constraint system from get_constraint_matrices
+        C: Objective matrix of shape (n_variables, n_objectives); float32 is
+            enough for indicator-style objectives and halves its memory
+        bounds: (lower, upper) bound applied to every variable, or one
+            (lower, upper) row per variable
+    
+    Returns:
+        X: Optimal solutions, one column per objective (NaN where unsolved)
+        objective_values: Optimal objective value per column (NaN where unsolved)
+        statuses: linprog status code per column
+    """
+    from scipy.optimize import linprog
+    
+    C = np.asarray(C)
+    if C.ndim == 1:
+        C = C[:, None]
+    n_vars, n_objectives = C.shape
+    
+    A_eq_arg = A_eq if A_eq.shape[0] > 0 else None
+    b_eq_arg = b_eq if A_eq.shape[0] > 0 else None
+    
+    X = np.full((n_vars, n_objectives), np.nan)
+    objective_values = np.full(n_objectives, np.nan)
+    statuses = np.empty(n_objectives, dtype=np.int8)
+    
+    for k in range(n_objectives):
+        result = linprog(C[:, k], A_ub=A_ineq, b_ub=b_ineq, A_eq=A_eq_arg, b_eq=b_eq_arg,
+                         bounds=bounds, method='highs')
+        statuses[k] = result.status
+        if result.status == 0:
+            X[:, k] = result.x
+            objective_values[k] = result.fun
+    
+    return X, objective_values, statuses
+
+
+@section
+def demonstrate_optimization_integration(translator, constraints, matrices):
     """Demonstrate integration with optimization frameworks"""
     print("\n" + "="*60)
     print("OPTIMIZATION FRAMEWORK INTEGRATION")
     print("="*60)
     
-    # Get constraint matrices
-    A_ineq, b_ineq, A_eq, b_eq = translator.get_constraint_matrices()
+    # Constraint matrices assembled during constraint generation
+    A_ineq, b_ineq, A_eq, b_eq = matrices
     
     print("Constraint System for Optimization:")
     print(f"  Decision Variables: {A_ineq.shape[1]}")
     print(f"  Inequality Constraints: A_ineq * x ≤ b_ineq")
-    print(f"    Matrix Shape: {A_ineq.shape}")
+    print(f"    Matrix Shape: {A_ineq.shape} ({A_ineq.nnz} non-zeros, CSR)")
     print(f"    Bounds Vector: {b_ineq.shape}")
     
-    if A_eq.size > 0:
+    if A_eq.shape[0] > 0:
         print(f"  Equality Constraints: A_eq * x = b_eq")
-        print(f"    Matrix Shape: {A_eq.shape}")
+        print(f"    Matrix Shape: {A_eq.shape} ({A_eq.nnz} non-zeros, CSR)")
         print(f"    Bounds Vector: {b_eq.shape}")
     
     # Validate constraint system
@@ -208,12 +364,28 @@ def demonstrate_optimization_integration(translator, constraints):
     print(f"  Feasible: {not validation['is_overconstrained']}")
     print(f"  Total Constraints: {validation['total_constraints']}")
     print(f"  Variables: {validation['n_variables']}")
+    print(f"  Evaluators: {len(validation['evaluations_by_evaluator'])}")
     
     if validation['warnings']:
         print(f"  Warnings: {len(validation['warnings'])}")
         for warning in validation['warnings']:
             print(f"    - {warning}")
     
+    # Solve a batch of objectives: total value, then each criterion on its own
+    n_vars = A_ineq.shape[1]
+    C = np.zeros((n_vars, translator.n_criteria + 1), dtype=np.float32)
+    C[:, 0] = -1.0
+    for k in range(translator.n_criteria):
+        C[k::translator.n_criteria, k + 1] = -1.0  # Negative for maximization
+    
+    X, objective_values, statuses = solve_batch(A_ineq, b_ineq, A_eq, b_eq, C)
+    
+    print(f"\nBatch Optimization ({C.shape[1]} objectives):")
+    labels = ["Total value"] + list(translator.criteria)
+    for label, value, status in zip(labels, objective_values, statuses):
+        outcome = f"{-value:.3f}" if status == 0 else f"not solved (status {status})"
+        print(f"  {label}: {outcome}")
+    
     # Example optimization setup
     print(f"\nExample Optimization Setup:")
     print(f"```python")
@@ -221,17 +393,18 @@ def demonstrate_optimization_integration(translator, constraints):
     print(f"import numpy as np")
     print(f"")
     print(f"# Objective: maximize total strategic value")
-    print(f"c = -np.ones({A_ineq.shape[1]})  # Negative for maximization")
+    print(f"c = np.full({A_ineq.shape[1]}, -1.0, dtype=np.float32)  # Negative for maximization")
+    print(f"bounds = np.tile([0.0, 1.0], ({A_ineq.shape[1]}, 1)).astype(np.float32)")
     print(f"")
     print(f"# Constraints from qualitative evaluations")
     print(f"result = linprog(")
     print(f"    c=c,")
     print(f"    A_ub=A_ineq,")
     print(f"    b_ub=b_ineq,")
-    if A_eq.size > 0:
+    if A_eq.shape[0] > 0:
         print(f"    A_eq=A_eq,")
         print(f"    b_eq=b_eq,")
-    print(f"    bounds=[(0, 1) for _ in range({A_ineq.shape[1]})],")
+    print(f"    bounds=bounds,")
     print(f"    method='highs'")
     print(f")")
     print(f"```")
@@ -239,6 +412,7 @@ def demonstrate_optimization_integration(translator, constraints):
     return A_ineq, b_ineq, A_eq, b_eq
 
 
+@section
 def demonstrate_robust_evaluation():
     """Demonstrate robust evaluation criteria"""
     print("\n" + "="*60)
@@ -266,53 +440,54 @@ def demonstrate_robust_evaluation():
 
 def main():
     """Run the complete portfolio optimization demonstration"""
-    print("LOGOS/NIMBUS/STATUS PROJECT PORTFOLIO OPTIMIZATION")
-    print("Robust Human-Machine Framework Demonstration")
-    print("=" * 80)
-    
-    try:
-        # Load data
-        projects, project_names = load_project_data()
-        evaluations = load_stakeholder_evaluations()
-        
-        # Demonstrate constraint generation
-        translator, constraints = demonstrate_constraint_generation(projects, evaluations)
-        
-        # Demonstrate budget analysis
-        budget_data = demonstrate_budget_constraints(projects)
-        
-        # Demonstrate project constraints
-        project_constraints = demonstrate_project_constraints(projects)
-        
-        # Demonstrate optimization integration
-        A_ineq, b_ineq, A_eq, b_eq = demonstrate_optimization_integration(translator, constraints)
-        
-        # Demonstrate robust evaluation
-        demonstrate_robust_evaluation()
-        
-        print("\n" + "="*80)
-        print("DEMONSTRATION COMPLETED SUCCESSFULLY")
-        print("="*80)
-        
-        print("\nSummary:")
-        print(f"✅ Processed {len(projects)} projects from {len(set(p['ecosystem'] for p in projects))} ecosystems")
-        print(f"✅ Translated {len(evaluations)} stakeholder evaluations into {len(constraints)} mathematical constraints")
-        print(f"✅ Generated constraint system with {A_ineq.shape[1]} variables and {A_ineq.shape[0]} constraints")
-        print(f"✅ Identified {len(project_constraints['cooperation'])} cooperation and {len(project_constraints['exclusive'])} exclusivity constraints")
-        print(f"✅ Analyzed budget constraints with {len(budget_data['constraint_violations'])} violations")
-        print(f"✅ Prepared optimization framework integration")
-        
-        print("\nNext Steps:")
-        print("1. Implement Deep Preference-based Q Network (DPbQN) algorithm")
-        print("2. Integrate constraint matrices with reinforcement learning")
-        print("3. Develop robust evaluation criteria module")
-        print("4. Create experience pool for preference learning")
-        print("5. Deploy human-machine optimization system")
+    with buffered_stdout():
+        print("LOGOS/NIMBUS/STATUS PROJECT PORTFOLIO OPTIMIZATION")
+        print("Robust Human-Machine Framework Demonstration")
+        print("=" * 80)
         
-    except Exception as e:
-        print(f"\nError during demonstration: {e}")
-        import traceback
-        traceback.print_exc()
+        try:
+            # Load data
+            projects, project_names = load_project_data()
+            evaluations = load_stakeholder_evaluations()
+            
+            # Demonstrate constraint generation
+            translator, constraints, matrices = demonstrate_constraint_generation(projects, evaluations)
+            
+            # Demonstrate budget analysis
+            budget_data = demonstrate_budget_constraints(projects)
+            
+            # Demonstrate project constraints
+            project_constraints = demonstrate_project_constraints(projects)
+            
+            # Demonstrate optimization integration
+            A_ineq, b_ineq, A_eq, b_eq = demonstrate_optimization_integration(translator, constraints, matrices)
+            
+            # Demonstrate robust evaluation
+            demonstrate_robust_evaluation()
+            
+            print("\n" + "="*80)
+            print("DEMONSTRATION COMPLETED SUCCESSFULLY")
+            print("="*80)
+            
+            print("\nSummary:")
+            print(f"✅ Processed {len(projects)} projects from {projects['ecosystem'].nunique()} ecosystems")
+            print(f"✅ Translated {len(evaluations)} stakeholder evaluations into {len(constraints)} mathematical constraints")
+            print(f"✅ Generated constraint system with {A_ineq.shape[1]} variables and {A_ineq.shape[0]} constraints")
+            print(f"✅ Identified {len(project_constraints['cooperation'])} cooperation and {len(project_constraints['exclusive'])} exclusivity constraints")
+            print(f"✅ Analyzed budget constraints with {len(budget_data['constraint_violations'])} violations")
+            print(f"✅ Prepared optimization framework integration")
+            
+            print("\nNext Steps:")
+            print("1. Implement Deep Preference-based Q Network (DPbQN) algorithm")
+            print("2. Integrate constraint matrices with reinforcement learning")
+            print("3. Develop robust evaluation criteria module")
+            print("4. Create experience pool for preference learning")
+            print("5. Deploy human-machine optimization system")
+            
+        except Exception as e:
+            print(f"\nError during demonstration: {e}")
+            sys.stdout.flush()
+            traceback.print_exc()
 
 
 if __name__ == "__main__":
@@ -52,10 +52,13 @@ Status: Phase 1 Complete - Core Translation Engine Operational
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple, Union, Optional
-from dataclasses import dataclass
+from collections import Counter
+from typing import List, Dict, Tuple, Union, Optional, IO
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
+import scipy.sparse as sp
+from scipy.sparse.linalg import lsqr
 from scipy.spatial import ConvexHull
 import warnings
 
@@ -97,14 +100,132 @@ class QualitativeEvaluation:
     metadata: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(init=False)
 class LinearConstraint:
-    """Represents a linear constraint: a^T * x <= b or a^T * x = b"""
-    coefficients: np.ndarray  # coefficient vector 'a'
+    """
+    Represents a linear constraint: a^T * x <= b or a^T * x = b
+    
+    Only the non-zero entries of 'a' are stored; the dense coefficient vector
+    is built on access via `coefficients`. Constraints can be created either
+    from a dense `coefficients` vector or from `nz_cols`/`nz_vals`/`n_vars`.
+    
+    `constraint_id` is either given directly or joined from `id_parts` (e.g.
+    ("comp", "A", "B", "value") -> "comp_A_B_value") the first time it is read.
+    
+    `supporting_evaluations` holds later evaluations that restated
+    `source_evaluation` (e.g. the same statement from another expert) and
+    were therefore not translated again.
+    """
+    nz_cols: np.ndarray      # column indices of the non-zeros of 'a'
+    nz_vals: np.ndarray      # values of the non-zeros of 'a'
+    n_vars: int              # length of 'a'
     bound: float             # bound value 'b'
     is_equality: bool = False  # True for equality, False for inequality
-    constraint_id: str = ""
+    id_parts: Tuple[str, ...] = ()  # parts of the lazily built constraint_id
     source_evaluation: Optional[QualitativeEvaluation] = None
+    supporting_evaluations: List[QualitativeEvaluation] = field(default_factory=list)
+    
+    def __init__(self, coefficients: Optional[np.ndarray] = None, bound: float = 0.0,
+                 is_equality: bool = False, constraint_id: Optional[str] = None,
+                 source_evaluation: Optional[QualitativeEvaluation] = None,
+                 nz_cols: Optional[np.ndarray] = None, nz_vals: Optional[np.ndarray] = None,
+                 n_vars: Optional[int] = None, id_parts: Tuple[str, ...] = ()):
+        if coefficients is not None:
+            coefficients = np.asarray(coefficients, dtype=float)
+            nz_cols = np.flatnonzero(coefficients)
+            nz_vals = coefficients[nz_cols]
+            n_vars = len(coefficients)
+        elif nz_cols is None or nz_vals is None or n_vars is None:
+            raise ValueError("LinearConstraint requires coefficients or nz_cols, nz_vals and n_vars")
+        
+        self.nz_cols = np.asarray(nz_cols, dtype=np.int64)
+        self.nz_vals = np.asarray(nz_vals, dtype=float)
+        self.n_vars = n_vars
+        self.bound = bound
+        self.is_equality = is_equality
+        self.id_parts = id_parts
+        self._constraint_id = constraint_id
+        self.source_evaluation = source_evaluation
+        self.supporting_evaluations = []
+    
+    @property
+    def constraint_id(self) -> str:
+        """Constraint identifier, formatted from id_parts on first access"""
+        if self._constraint_id is None:
+            self._constraint_id = "_".join(self.id_parts)
+        return self._constraint_id
+    
+    @constraint_id.setter
+    def constraint_id(self, value: str) -> None:
+        self._constraint_id = value
+    
+    @property
+    def coefficients(self) -> np.ndarray:
+        """Dense coefficient vector 'a' (repeated columns are summed)"""
+        coeffs = np.zeros(self.n_vars)
+        np.add.at(coeffs, self.nz_cols, self.nz_vals)
+        return coeffs
+
+
+def _coo_triplets(nz_cols: List[np.ndarray],
+                  nz_vals: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flatten per-row non-zero columns/values into COO (rows, cols, vals) arrays
+    
+    Row indices are produced with a single np.repeat over the row lengths
+    rather than one small allocation per constraint.
+    """
+    counts = np.fromiter((len(c) for c in nz_cols), dtype=np.int64, count=len(nz_cols))
+    rows = np.repeat(np.arange(len(nz_cols), dtype=np.int32), counts)
+    cols = np.concatenate(nz_cols).astype(np.int32, copy=False)
+    vals = np.concatenate(nz_vals).astype(np.float64, copy=False)
+    return rows, cols, vals
+
+
+def _append_grown(buffer: np.ndarray, n_used: int, new: np.ndarray) -> np.ndarray:
+    """
+    Write `new` after the first n_used entries of `buffer`, doubling its
+    capacity (starting at 256) when it is full
+    
+    Returns the buffer, which is reallocated only when it had to grow, so
+    repeated appends cost amortized O(len(new)).
+    """
+    n_total = n_used + len(new)
+    if n_total > len(buffer):
+        capacity = max(256, len(buffer))
+        while capacity < n_total:
+            capacity *= 2
+        grown = np.empty(capacity, dtype=buffer.dtype)
+        grown[:n_used] = buffer[:n_used]
+        buffer = grown
+    buffer[n_used:n_total] = new
+    return buffer
+
+
+def _make_read_only(*matrices: Union[np.ndarray, sp.spmatrix]) -> None:
+    """Mark arrays, or the index and value arrays of sparse matrices, read-only"""
+    for matrix in matrices:
+        parts = (matrix.data, matrix.indices, matrix.indptr) if sp.issparse(matrix) else (matrix,)
+        for part in parts:
+            part.flags.writeable = False
+
+
+def _matrix_format(sparse: Union[bool, str]) -> str:
+    """Normalize the `sparse` argument of the matrix getters to 'dense', 'csr' or 'csc'"""
+    if isinstance(sparse, str):
+        if sparse not in ('csr', 'csc'):
+            raise ValueError(f"Unsupported sparse format: {sparse}")
+        return sparse
+    return 'csr' if sparse else 'dense'
+
+
+def _empty_constraints(n_vars: int, fmt: str) -> Tuple[Union[np.ndarray, sp.spmatrix], np.ndarray]:
+    """
+    (0 x n_vars) constraint matrix and empty bound vector, returned when a
+    translator has no constraints of one kind
+    """
+    A = np.empty((0, n_vars)) if fmt == 'dense' else sp.csr_matrix((0, n_vars)).asformat(fmt)
+    return A, np.empty(0)
 
 
 class QualitativeEvaluationTranslator:
@@ -112,6 +233,17 @@ class QualitativeEvaluationTranslator:
     Main class for translating qualitative evaluations into mathematical constraints
     """
     
+    # Parser method per evaluation type; batch parsers take a list of
+    # evaluations sharing (type, operator), the others one evaluation
+    _BATCH_PARSER_NAMES = {
+        EvaluationType.COMPARISON: 'parse_comparison_batch',
+        EvaluationType.RANGE: 'parse_range_batch',
+        EvaluationType.THRESHOLD: 'parse_threshold_batch'
+    }
+    _PARSER_NAMES = {
+        EvaluationType.RANKING: 'parse_ranking_evaluation'
+    }
+    
     def __init__(self, projects: List[str], criteria: List[str] = None):
         """
         Initialize the translator
@@ -124,333 +256,703 @@ class QualitativeEvaluationTranslator:
         self.criteria = criteria or ['value']
         self.n_projects = len(projects)
         self.n_criteria = len(self.criteria)
+        self.n_vars = self.n_projects * self.n_criteria  # length of x
         self.project_index = {proj: i for i, proj in enumerate(projects)}
         self.criteria_index = {crit: i for i, crit in enumerate(self.criteria)}
+        self._criteria_positions = np.arange(self.n_criteria)
+        # Criterion names given by evaluations but not known here
+        self._unknown_criteria: set = set()
+        # Flat variable position of (project, criterion):
+        # _positions[i, j] == i * n_criteria + j
+        self._positions = np.arange(self.n_vars, dtype=np.int64).reshape(self.n_projects, self.n_criteria)
         
-        # Storage for evaluations and constraints
+        # Storage for evaluations and constraints; evaluations before
+        # _n_translated have already been parsed into self.constraints
         self.evaluations: List[QualitativeEvaluation] = []
         self.constraints: List[LinearConstraint] = []
+        self._reset_translation()
+        
+        # Columnar copy of the numeric constraint fields: COO entries over
+        # constraint index plus per-constraint bounds and equality flags.
+        # Synced from self.constraints, which stays the public list. Each
+        # array is a view of the filled part of a geometrically grown buffer
+        self._reset_columns()
+        
+        # Assembled matrices per output format, valid while the constraint
+        # list is the same object with the same length
+        self._matrix_cache: Dict[bool, Tuple] = {}
+        self._matrix_cache_key: Optional[Tuple[int, int]] = None
+        
+        # Evaluation counts maintained by add_evaluation
+        self.stats: Dict[str, Counter] = {
+            'by_evaluator': Counter(),
+            'by_type': Counter(),
+            'by_criteria': Counter(),
+            'by_operator': Counter()
+        }
         
         logger.info(f"Initialized translator for {self.n_projects} projects and {self.n_criteria} criteria")
     
+    @property
+    def n_variables(self) -> int:
+        """Number of decision variables (n_projects × n_criteria)"""
+        return self.n_vars
+    
+    def resolve_projects(self, names: List[str]) -> np.ndarray:
+        """
+        Indices of the named projects as an int32 array, built in one pass
+        
+        Raises:
+            KeyError: If a name is not one of the translator's projects
+        """
+        return np.fromiter((self.project_index[name] for name in names), dtype=np.int32, count=len(names))
+    
+    @property
+    def total_constraints(self) -> int:
+        """Number of constraints currently generated"""
+        return len(self.constraints)
+    
     def add_evaluation(self, evaluation: QualitativeEvaluation) -> None:
-        """Add a qualitative evaluation to the system"""
+        """
+        Add a qualitative evaluation to the system
+        
+        The evaluation is translated immediately and its constraints appended
+        to self.constraints; evaluations that fail to parse are logged and
+        contribute no constraints.
+        """
         self.evaluations.append(evaluation)
+        self._translate_pending()
+        self._count_evaluation(evaluation)
+        
         logger.info(f"Added evaluation from {evaluation.evaluator_id}: {evaluation.evaluation_type.value}")
     
+    def add_evaluations(self, evaluations: List[QualitativeEvaluation]) -> None:
+        """
+        Add several qualitative evaluations at once
+        
+        All evaluations are translated in a single pass, so comparisons,
+        ranges and thresholds are parsed as batches and the constraint
+        matrices are invalidated once.
+        """
+        evaluations = list(evaluations)
+        self.evaluations.extend(evaluations)
+        self._translate_pending()
+        for evaluation in evaluations:
+            self._count_evaluation(evaluation)
+        
+        logger.info(f"Added {len(evaluations)} evaluations")
+    
+    def _count_evaluation(self, evaluation: QualitativeEvaluation) -> None:
+        """Update the summary statistics for an added evaluation"""
+        self.stats['by_evaluator'][evaluation.evaluator_id] += 1
+        self.stats['by_type'][evaluation.evaluation_type.value] += 1
+        try:
+            self.stats['by_criteria'][evaluation.criteria] += 1
+        except TypeError:
+            # Unhashable (malformed) criteria are counted by their repr
+            self.stats['by_criteria'][repr(evaluation.criteria)] += 1
+        self.stats['by_operator'][evaluation.operator.value if evaluation.operator else None] += 1
+    
+    def _target_criteria(self, evaluation: QualitativeEvaluation) -> Tuple[np.ndarray, List[str]]:
+        """
+        Criterion indices and names an evaluation applies to: the specified
+        criterion, or all criteria if none is specified or the specified one
+        is not a criterion of this translator (logged once per name)
+        """
+        if not evaluation.criteria:
+            return self._criteria_positions, self.criteria
+        if evaluation.criteria not in self.criteria_index:
+            if evaluation.criteria not in self._unknown_criteria:
+                self._unknown_criteria.add(evaluation.criteria)
+                logger.warning(f"Unknown criterion '{evaluation.criteria}'; applying evaluations on it to all criteria")
+            return self._criteria_positions, self.criteria
+        return self._criteria_positions[[self.criteria_index[evaluation.criteria]]], [evaluation.criteria]
+    
     def parse_comparison_evaluation(self, evaluation: QualitativeEvaluation) -> List[LinearConstraint]:
         """
         Parse comparison evaluations like "Project A > Project B"
         
         Returns list of linear constraints representing the comparison
         """
-        constraints = []
+        self._resolve_comparison(evaluation)
+        return self.parse_comparison_batch([evaluation])[0]
+    
+    def parse_range_evaluation(self, evaluation: QualitativeEvaluation) -> List[LinearConstraint]:
+        """
+        Parse range evaluations like "Project A value between 0.3 and 0.7"
+        """
+        self._resolve_range(evaluation)
+        return self.parse_range_batch([evaluation])[0]
+    
+    def parse_ranking_evaluation(self, evaluation: QualitativeEvaluation) -> List[LinearConstraint]:
+        """
+        Parse ranking evaluations like "Project A > Project B > Project C"
+        
+        Each consecutive pair becomes a "higher > lower" comparison; the
+        positions of all pairs and target criteria are computed at once.
+        """
+        projects = evaluation.projects
+        
+        if len(projects) < 2:
+            raise ValueError("Ranking evaluation must involve at least 2 projects")
+        
+        proj_idx = self.resolve_projects(projects)
+        crit_idx, criteria = self._target_criteria(evaluation)
         
+        # (pair, criterion) rows in pair-major order, as an (n_rows, 2) block
+        higher = self._positions[proj_idx[:-1, None], crit_idx[None, :]].ravel()
+        lower = self._positions[proj_idx[1:, None], crit_idx[None, :]].ravel()
+        cols = np.column_stack([higher, lower])
+        vals = np.array([1.0, -1.0])
+        
+        # v_higher - v_lower >= epsilon, as for a ">" comparison
+        row_parts = [
+            ("comp", proj_higher, proj_lower, criterion)
+            for proj_higher, proj_lower in zip(projects[:-1], projects[1:])
+            for criterion in criteria
+        ]
+        
+        return [
+            LinearConstraint(
+                nz_cols=row_cols,
+                nz_vals=vals,
+                n_vars=self.n_vars,
+                bound=-0.01,  # Small epsilon for strict inequality
+                is_equality=False,
+                id_parts=parts,
+                source_evaluation=evaluation
+            )
+            for row_cols, parts in zip(cols, row_parts)
+        ]
+    
+    def parse_threshold_evaluation(self, evaluation: QualitativeEvaluation) -> List[LinearConstraint]:
+        """
+        Parse threshold evaluations like "Project A must have value >= 0.5"
+        """
+        self._resolve_threshold(evaluation)
+        return self.parse_threshold_batch([evaluation])[0]
+    
+    def _resolve_comparison(self, evaluation: QualitativeEvaluation) -> Tuple[int, int]:
+        """Validate a comparison evaluation and return its two project indices"""
         if len(evaluation.projects) != 2:
             raise ValueError("Comparison evaluation must involve exactly 2 projects")
         
         proj_a, proj_b = evaluation.projects
-        idx_a = self.project_index[proj_a]
-        idx_b = self.project_index[proj_b]
+        return self.project_index[proj_a], self.project_index[proj_b]
+    
+    def _resolve_range(self, evaluation: QualitativeEvaluation) -> Tuple[int]:
+        """Validate a range evaluation and return its project index"""
+        if len(evaluation.projects) != 1:
+            raise ValueError("Range evaluation must involve exactly 1 project")
         
-        # Only apply to the specified criterion, or all criteria if none specified
-        target_criteria = [evaluation.criteria] if evaluation.criteria else self.criteria
+        if not evaluation.values or len(evaluation.values) != 2:
+            raise ValueError("Range evaluation must specify exactly 2 values (min, max)")
+        
+        return (self.project_index[evaluation.projects[0]],)
+    
+    def _resolve_threshold(self, evaluation: QualitativeEvaluation) -> Tuple[int]:
+        """Validate a threshold evaluation and return its project index"""
+        if len(evaluation.projects) != 1:
+            raise ValueError("Threshold evaluation must involve exactly 1 project")
+        
+        if not evaluation.values or len(evaluation.values) != 1:
+            raise ValueError("Threshold evaluation must specify exactly 1 threshold value")
+        
+        return (self.project_index[evaluation.projects[0]],)
+    
+    def _expand_batch(self, evaluations: List[QualitativeEvaluation],
+                      resolve) -> Tuple[List[int], List[str], np.ndarray]:
+        """
+        Expand a batch of evaluations into one row per (evaluation, criterion)
+        
+        `resolve` validates an evaluation and returns its project indices;
+        evaluations it rejects are logged and skipped. The flat positions of
+        every row are computed in one broadcast over the whole batch.
         
-        for criterion in target_criteria:
-            if criterion not in self.criteria:
+        Returns:
+            row_owner: Index into `evaluations` of each row
+            row_criteria: Criterion name of each row
+            positions: (n_rows, n_projects_per_row) array of flat positions
+        """
+        row_owner, row_criteria, proj_rows, crit_rows = [], [], [], []
+        
+        for k, evaluation in enumerate(evaluations):
+            try:
+                proj_idx = resolve(evaluation)
+            except Exception as e:
+                logger.error(f"Error processing evaluation from {evaluation.evaluator_id}: {e}")
                 continue
-                
-            crit_idx = self.criteria_index[criterion]
-            # Create coefficient vector
-            coeffs = np.zeros(self.n_projects * self.n_criteria)
             
-            # Position in flattened matrix: project_idx * n_criteria + criterion_idx
-            pos_a = idx_a * self.n_criteria + crit_idx
-            pos_b = idx_b * self.n_criteria + crit_idx
+            crit_idx, criteria = self._target_criteria(evaluation)
             
-            if evaluation.operator == ComparisonOperator.GREATER:
-                # v_a - v_b >= epsilon (small positive value)
-                coeffs[pos_a] = 1.0
-                coeffs[pos_b] = -1.0
-                constraint = LinearConstraint(
-                    coefficients=coeffs,
-                    bound=-0.01,  # Small epsilon for strict inequality
-                    is_equality=False,
-                    constraint_id=f"comp_{proj_a}_{proj_b}_{criterion}",
-                    source_evaluation=evaluation
-                )
-                constraints.append(constraint)
-                
-            elif evaluation.operator == ComparisonOperator.LESS:
-                # v_a - v_b <= -epsilon
-                coeffs[pos_a] = 1.0
-                coeffs[pos_b] = -1.0
-                constraint = LinearConstraint(
-                    coefficients=coeffs,
-                    bound=-0.01,
-                    is_equality=False,
-                    constraint_id=f"comp_{proj_a}_{proj_b}_{criterion}",
-                    source_evaluation=evaluation
-                )
-                constraints.append(constraint)
-                
-            elif evaluation.operator == ComparisonOperator.EQUAL:
-                # v_a - v_b = 0
-                coeffs[pos_a] = 1.0
-                coeffs[pos_b] = -1.0
-                constraint = LinearConstraint(
-                    coefficients=coeffs,
-                    bound=0.0,
-                    is_equality=True,
-                    constraint_id=f"comp_{proj_a}_{proj_b}_{criterion}",
-                    source_evaluation=evaluation
-                )
-                constraints.append(constraint)
-        
-        return constraints
+            row_owner.extend([k] * len(criteria))
+            row_criteria.extend(criteria)
+            proj_rows.extend([proj_idx] * len(criteria))
+            crit_rows.append(crit_idx)
+        
+        if not row_owner:
+            return [], [], np.empty((0, 0), dtype=np.int64)
+        
+        # Position in flattened matrix, looked up in the (project, criterion) table
+        positions = self._positions[np.asarray(proj_rows, dtype=np.int64),
+                                    np.concatenate(crit_rows)[:, None]]
+        return row_owner, row_criteria, positions
     
-    def parse_range_evaluation(self, evaluation: QualitativeEvaluation) -> List[LinearConstraint]:
+    def parse_comparison_batch(self, evaluations: List[QualitativeEvaluation]) -> List[List[LinearConstraint]]:
         """
-        Parse range evaluations like "Project A value between 0.3 and 0.7"
+        Parse a batch of comparison evaluations that share one operator
+        
+        The column positions of all rows in the batch are gathered into one
+        (n_rows, 2) index block, and every constraint shares the same
+        [1, -1] value pair, instead of filling a vector per constraint.
+        
+        Returns one list of constraints per input evaluation (empty for
+        evaluations that failed to parse, which are logged and skipped).
         """
-        constraints = []
+        results: List[List[LinearConstraint]] = [[] for _ in evaluations]
+        if not evaluations:
+            return results
         
-        if len(evaluation.projects) != 1:
-            raise ValueError("Range evaluation must involve exactly 1 project")
+        operator = evaluations[0].operator
+        if operator == ComparisonOperator.GREATER:
+            # v_a - v_b >= epsilon (small positive value)
+            bound, is_equality = -0.01, False  # Small epsilon for strict inequality
+        elif operator == ComparisonOperator.LESS:
+            # v_a - v_b <= -epsilon
+            bound, is_equality = -0.01, False
+        elif operator == ComparisonOperator.EQUAL:
+            # v_a - v_b = 0
+            bound, is_equality = 0.0, True
+        else:
+            return results
         
-        if not evaluation.values or len(evaluation.values) != 2:
-            raise ValueError("Range evaluation must specify exactly 2 values (min, max)")
+        # Only apply to the specified criterion, or all criteria if none specified
+        row_owner, row_criteria, cols = self._expand_batch(evaluations, self._resolve_comparison)
+        vals = np.array([1.0, -1.0])
+        
+        for row, k in enumerate(row_owner):
+            proj_a, proj_b = evaluations[k].projects
+            results[k].append(LinearConstraint(
+                nz_cols=cols[row],
+                nz_vals=vals,
+                n_vars=self.n_vars,
+                bound=bound,
+                is_equality=is_equality,
+                id_parts=("comp", proj_a, proj_b, row_criteria[row]),
+                source_evaluation=evaluations[k]
+            ))
         
-        proj = evaluation.projects[0]
-        idx = self.project_index[proj]
-        min_val, max_val = evaluation.values
+        return results
+    
+    def parse_range_batch(self, evaluations: List[QualitativeEvaluation]) -> List[List[LinearConstraint]]:
+        """
+        Parse a batch of range evaluations
+        
+        Returns one list of constraints per input evaluation (empty for
+        evaluations that failed to parse, which are logged and skipped).
+        """
+        results: List[List[LinearConstraint]] = [[] for _ in evaluations]
         
         # Only apply to the specified criterion, or all criteria if none specified
-        target_criteria = [evaluation.criteria] if evaluation.criteria else self.criteria
+        row_owner, row_criteria, cols = self._expand_batch(evaluations, self._resolve_range)
+        lower_vals, upper_vals = np.array([-1.0]), np.array([1.0])
         
-        for criterion in target_criteria:
-            if criterion not in self.criteria:
-                continue
-                
-            crit_idx = self.criteria_index[criterion]
-            coeffs = np.zeros(self.n_projects * self.n_criteria)
-            pos = idx * self.n_criteria + crit_idx
+        for row, k in enumerate(row_owner):
+            evaluation = evaluations[k]
+            proj = evaluation.projects[0]
+            criterion = row_criteria[row]
+            min_val, max_val = evaluation.values
             
             # Lower bound: v >= min_val (rewrite as -v <= -min_val)
-            coeffs[pos] = -1.0
-            constraint_lower = LinearConstraint(
-                coefficients=coeffs.copy(),
+            results[k].append(LinearConstraint(
+                nz_cols=cols[row],
+                nz_vals=lower_vals,
+                n_vars=self.n_vars,
                 bound=-min_val,
                 is_equality=False,
-                constraint_id=f"range_lower_{proj}_{criterion}",
+                id_parts=("range", "lower", proj, criterion),
                 source_evaluation=evaluation
-            )
-            constraints.append(constraint_lower)
+            ))
             
             # Upper bound: v <= max_val
-            coeffs = np.zeros(self.n_projects * self.n_criteria)
-            coeffs[pos] = 1.0
-            constraint_upper = LinearConstraint(
-                coefficients=coeffs.copy(),
+            results[k].append(LinearConstraint(
+                nz_cols=cols[row],
+                nz_vals=upper_vals,
+                n_vars=self.n_vars,
                 bound=max_val,
                 is_equality=False,
-                constraint_id=f"range_upper_{proj}_{criterion}",
+                id_parts=("range", "upper", proj, criterion),
                 source_evaluation=evaluation
-            )
-            constraints.append(constraint_upper)
+            ))
         
-        return constraints
+        return results
     
-    def parse_ranking_evaluation(self, evaluation: QualitativeEvaluation) -> List[LinearConstraint]:
+    def parse_threshold_batch(self, evaluations: List[QualitativeEvaluation]) -> List[List[LinearConstraint]]:
         """
-        Parse ranking evaluations like "Project A > Project B > Project C"
+        Parse a batch of threshold evaluations that share one operator
+        
+        Returns one list of constraints per input evaluation (empty for
+        evaluations that failed to parse, which are logged and skipped).
         """
-        constraints = []
-        projects = evaluation.projects
+        results: List[List[LinearConstraint]] = [[] for _ in evaluations]
+        if not evaluations:
+            return results
         
-        if len(projects) < 2:
-            raise ValueError("Ranking evaluation must involve at least 2 projects")
+        operator = evaluations[0].operator
+        if operator == ComparisonOperator.GREATER_EQUAL:
+            # v >= threshold
+            vals, sign = np.array([1.0]), 1.0
+        elif operator == ComparisonOperator.LESS_EQUAL:
+            # v <= threshold
+            vals, sign = np.array([-1.0]), -1.0
+        else:
+            return results
         
-        # Create pairwise comparisons for consecutive projects in ranking
-        for i in range(len(projects) - 1):
-            proj_higher = projects[i]
-            proj_lower = projects[i + 1]
-            
-            # Create comparison evaluation
-            comp_eval = QualitativeEvaluation(
-                evaluator_id=evaluation.evaluator_id,
-                evaluation_type=EvaluationType.COMPARISON,
-                projects=[proj_higher, proj_lower],
-                operator=ComparisonOperator.GREATER,
-                confidence=evaluation.confidence,
-                criteria=evaluation.criteria
-            )
-            
-            # Parse the comparison
-            comp_constraints = self.parse_comparison_evaluation(comp_eval)
-            constraints.extend(comp_constraints)
+        # Only apply to the specified criterion, or all criteria if none specified
+        row_owner, row_criteria, cols = self._expand_batch(evaluations, self._resolve_threshold)
         
-        return constraints
+        for row, k in enumerate(row_owner):
+            evaluation = evaluations[k]
+            results[k].append(LinearConstraint(
+                nz_cols=cols[row],
+                nz_vals=vals,
+                n_vars=self.n_vars,
+                bound=sign * evaluation.values[0],
+                is_equality=False,
+                id_parts=("threshold", evaluation.projects[0], row_criteria[row]),
+                source_evaluation=evaluation
+            ))
+        
+        return results
     
-    def parse_threshold_evaluation(self, evaluation: QualitativeEvaluation) -> List[LinearConstraint]:
+    def translate_evaluations(self) -> List[LinearConstraint]:
         """
-        Parse threshold evaluations like "Project A must have value >= 0.5"
+        Translate all stored qualitative evaluations into linear constraints
+        
+        Evaluations are translated incrementally as they are added, so this
+        only parses evaluations that have not been translated yet and
+        returns a copy of the accumulated constraint list.
         """
-        constraints = []
+        self._translate_pending()
+        logger.info(f"Generated {len(self.constraints)} linear constraints from {len(self.evaluations)} evaluations")
         
-        if len(evaluation.projects) != 1:
-            raise ValueError("Threshold evaluation must involve exactly 1 project")
+        return list(self.constraints)
+    
+    def _reset_translation(self) -> None:
+        """
+        Forget which evaluations have been translated, so the next
+        translation parses all of self.evaluations again
         
-        if not evaluation.values or len(evaluation.values) != 1:
-            raise ValueError("Threshold evaluation must specify exactly 1 threshold value")
+        Constraints already in self.constraints are kept and seed the
+        duplicate check, so re-translated evaluations do not repeat them.
+        """
+        self._n_translated = 0
         
-        proj = evaluation.projects[0]
-        idx = self.project_index[proj]
-        threshold = evaluation.values[0]
+        # Keys of translated constraints, used to drop duplicates
+        # (e.g. a ranking restating an explicit comparison)
+        self._seen_keys: set = {self._constraint_key(c) for c in self.constraints}
         
-        # For each criterion, create threshold constraint
-        for crit_idx, criterion in enumerate(self.criteria):
-            coeffs = np.zeros(self.n_projects * self.n_criteria)
-            pos = idx * self.n_criteria + crit_idx
-            
-            if evaluation.operator == ComparisonOperator.GREATER_EQUAL:
-                # v >= threshold
-                coeffs[pos] = 1.0
-                constraint = LinearConstraint(
-                    coefficients=coeffs,
-                    bound=threshold,
-                    is_equality=False,
-                    constraint_id=f"threshold_{proj}_{criterion}",
-                    source_evaluation=evaluation
-                )
-                constraints.append(constraint)
-                
-            elif evaluation.operator == ComparisonOperator.LESS_EQUAL:
-                # v <= threshold
-                coeffs[pos] = -1.0
-                constraint = LinearConstraint(
-                    coefficients=coeffs,
-                    bound=-threshold,
-                    is_equality=False,
-                    constraint_id=f"threshold_{proj}_{criterion}",
-                    source_evaluation=evaluation
-                )
-                constraints.append(constraint)
-        
-        return constraints
+        # Structural keys of translated evaluations, mapped to the constraints
+        # they added; a repeat (e.g. the same statement from another expert)
+        # would only yield duplicate constraints, so it is not parsed again
+        # but recorded on those constraints' supporting_evaluations
+        self._seen_evaluations: Dict[Tuple, List[LinearConstraint]] = {}
+        self._n_repeated_evaluations = 0
+        
+        # The lists (and constraint count) the state above refers to
+        self._translated_lists = (id(self.evaluations), id(self.constraints))
+        self._n_translated_constraints = len(self.constraints)
     
-    def translate_evaluations(self) -> List[LinearConstraint]:
+    @staticmethod
+    def _constraint_key(c: LinearConstraint) -> Tuple:
         """
-        Translate all stored qualitative evaluations into linear constraints
+        Key identifying constraints with the same coefficients, bound and kind
+        
+        The bound is rounded to 12 decimals so that bounds differing only by
+        float noise (e.g. from differently ordered arithmetic) still match.
         """
-        all_constraints = []
+        return (tuple(c.nz_cols.tolist()), tuple(c.nz_vals.tolist()), round(c.bound, 12), c.is_equality)
+    
+    def _translate_pending(self) -> None:
+        """
+        Parse evaluations added since the last translation and append their
+        constraints to self.constraints
+        
+        Comparison, range and threshold evaluations are grouped by
+        (type, operator) and parsed as homogeneous batches; constraints keep
+        the order of the evaluations. Evaluations structurally identical to
+        an earlier one are skipped without parsing and appended to the
+        supporting_evaluations of the earlier one's constraints.
+        
+        If either list was replaced since the last translation, evaluations
+        were removed, or the constraints were emptied (e.g.
+        `translator.constraints = []`), all evaluations are translated again.
+        """
+        if ((id(self.evaluations), id(self.constraints)) != self._translated_lists
+                or len(self.evaluations) < self._n_translated
+                or (self._n_translated_constraints and not self.constraints)):
+            self._reset_translation()
+        
+        pending = self.evaluations[self._n_translated:]
+        if not pending:
+            return
         
-        for evaluation in self.evaluations:
+        per_evaluation: List[List[LinearConstraint]] = [[] for _ in pending]
+        evaluation_keys: List[Optional[Tuple]] = [None] * len(pending)
+        repeats: List[Tuple[Tuple, QualitativeEvaluation]] = []
+        batches: Dict[Tuple[EvaluationType, Optional[ComparisonOperator]], List[int]] = {}
+        
+        for i, evaluation in enumerate(pending):
+            evaluation_type = evaluation.evaluation_type
             try:
-                if evaluation.evaluation_type == EvaluationType.COMPARISON:
-                    constraints = self.parse_comparison_evaluation(evaluation)
-                elif evaluation.evaluation_type == EvaluationType.RANGE:
-                    constraints = self.parse_range_evaluation(evaluation)
-                elif evaluation.evaluation_type == EvaluationType.RANKING:
-                    constraints = self.parse_ranking_evaluation(evaluation)
-                elif evaluation.evaluation_type == EvaluationType.THRESHOLD:
-                    constraints = self.parse_threshold_evaluation(evaluation)
-                else:
-                    logger.warning(f"Unsupported evaluation type: {evaluation.evaluation_type}")
-                    continue
-                
-                all_constraints.extend(constraints)
+                evaluation_key = (evaluation_type, tuple(evaluation.projects), evaluation.operator,
+                                  tuple(evaluation.values or ()), evaluation.criteria)
+                repeated = evaluation_key in self._seen_evaluations
+            except TypeError as e:
+                # Malformed fields (e.g. a scalar `values` or a list `criteria`)
+                logger.error(f"Error processing evaluation from {evaluation.evaluator_id}: {e}")
+                continue
+            if repeated:
+                self._n_repeated_evaluations += 1
+                repeats.append((evaluation_key, evaluation))
+                continue
+            self._seen_evaluations[evaluation_key] = []
+            evaluation_keys[i] = evaluation_key
+            
+            if evaluation_type in self._BATCH_PARSER_NAMES:
+                batches.setdefault((evaluation_type, evaluation.operator), []).append(i)
+                continue
+            
+            parser_name = self._PARSER_NAMES.get(evaluation_type)
+            if parser_name is None:
+                logger.warning(f"Unsupported evaluation type: {evaluation_type}")
+                continue
+            
+            try:
+                per_evaluation[i] = getattr(self, parser_name)(evaluation)
                 
             except Exception as e:
                 logger.error(f"Error processing evaluation from {evaluation.evaluator_id}: {e}")
                 continue
         
-        self.constraints = all_constraints
-        logger.info(f"Generated {len(all_constraints)} linear constraints from {len(self.evaluations)} evaluations")
+        for (evaluation_type, _), indices in batches.items():
+            batch = getattr(self, self._BATCH_PARSER_NAMES[evaluation_type])([pending[i] for i in indices])
+            for i, constraints in zip(indices, batch):
+                per_evaluation[i] = constraints
+        
+        n_duplicates = 0
+        for evaluation_key, constraints in zip(evaluation_keys, per_evaluation):
+            for c in constraints:
+                key = self._constraint_key(c)
+                if key in self._seen_keys:
+                    n_duplicates += 1
+                    continue
+                self._seen_keys.add(key)
+                self.constraints.append(c)
+                self._seen_evaluations[evaluation_key].append(c)
+        
+        for evaluation_key, evaluation in repeats:
+            for c in self._seen_evaluations[evaluation_key]:
+                c.supporting_evaluations.append(evaluation)
+        
+        if n_duplicates:
+            logger.info(f"Skipped {n_duplicates} duplicate constraints")
+        
+        self._n_translated = len(self.evaluations)
+        self._n_translated_constraints = len(self.constraints)
+        self._matrix_cache_key = None
+    
+    def _sync_columns(self) -> None:
+        """
+        Bring the columnar constraint arrays up to date with self.constraints
+        
+        Only constraints appended since the last sync are converted; the
+        arrays are rebuilt if the list was replaced or shrank.
+        """
+        if id(self.constraints) != self._columnar_list_id or len(self.constraints) < self._n_columnar:
+            self._reset_columns()
+        
+        new = self.constraints[self._n_columnar:]
+        if not new:
+            return
         
-        return all_constraints
+        rows, cols, vals = _coo_triplets([c.nz_cols for c in new], [c.nz_vals for c in new])
+        columns = {
+            '_coeff_rows': rows + self._n_columnar,
+            '_coeff_cols': cols,
+            '_coeff_vals': vals,
+            '_bounds': np.fromiter((c.bound for c in new), dtype=np.float64, count=len(new)),
+            '_is_eq': np.fromiter((c.is_equality for c in new), dtype=bool, count=len(new))
+        }
+        for name, values in columns.items():
+            n_used = len(getattr(self, name))
+            buffer = _append_grown(self._column_buffers[name], n_used, values)
+            self._column_buffers[name] = buffer
+            setattr(self, name, buffer[:n_used + len(values)])
+        self._n_columnar = len(self.constraints)
+    
+    def _reset_columns(self) -> None:
+        """Empty the columnar constraint arrays and bind them to self.constraints"""
+        self._column_buffers: Dict[str, np.ndarray] = {
+            '_coeff_rows': np.empty(0, dtype=np.int64),
+            '_coeff_cols': np.empty(0, dtype=np.int64),
+            '_coeff_vals': np.empty(0),
+            '_bounds': np.empty(0),
+            '_is_eq': np.empty(0, dtype=bool)
+        }
+        for name, buffer in self._column_buffers.items():
+            setattr(self, name, buffer)
+        self._n_columnar = 0
+        self._columnar_list_id = id(self.constraints)
     
-    def get_constraint_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    def get_constraint_matrices(self, sparse: Union[bool, str] = False) -> Tuple[Union[np.ndarray, sp.spmatrix], np.ndarray,
+                                                                                Union[np.ndarray, sp.spmatrix], np.ndarray]:
         """
         Get constraint matrices in standard form for optimization
         
+        Args:
+            sparse: Return A_ineq and A_eq as scipy.sparse matrices: True or
+                'csr' for CSR, 'csc' for CSC (column-major, as used by HiGHS
+                internally). Each constraint only touches one or two
+                variables, so this keeps memory at O(nnz) and can be passed
+                straight to linprog/HiGHS.
+        
         Returns:
             A_ineq: Inequality constraint matrix (A_ineq * x <= b_ineq)
             b_ineq: Inequality constraint bounds
             A_eq: Equality constraint matrix (A_eq * x = b_eq)
             b_eq: Equality constraint bounds
+        
+        The assembled matrices are cached until evaluations are added or
+        constraints are appended, so repeat calls return the same shared
+        arrays. They are read-only (for sparse matrices: their data, indices
+        and indptr arrays); copy them before modifying.
         """
-        if not self.constraints:
-            self.translate_evaluations()
+        self._translate_pending()
         
-        # Separate equality and inequality constraints
-        ineq_constraints = [c for c in self.constraints if not c.is_equality]
-        eq_constraints = [c for c in self.constraints if c.is_equality]
+        cache_key = (id(self.constraints), len(self.constraints))
+        if cache_key != self._matrix_cache_key:
+            self._matrix_cache = {}
+            self._matrix_cache_key = cache_key
         
-        # Build inequality constraint matrix
-        if ineq_constraints:
-            A_ineq = np.vstack([c.coefficients for c in ineq_constraints])
-            b_ineq = np.array([c.bound for c in ineq_constraints])
-        else:
-            A_ineq = np.empty((0, self.n_projects * self.n_criteria))
-            b_ineq = np.empty(0)
+        fmt = _matrix_format(sparse)
+        if fmt not in self._matrix_cache:
+            self._sync_columns()
+            
+            # Separate equality and inequality constraints
+            A_ineq, b_ineq = self._assemble_constraints(~self._is_eq, fmt)
+            A_eq, b_eq = self._assemble_constraints(self._is_eq, fmt)
+            _make_read_only(A_ineq, b_ineq, A_eq, b_eq)
+            self._matrix_cache[fmt] = (A_ineq, b_ineq, A_eq, b_eq)
         
-        # Build equality constraint matrix
-        if eq_constraints:
-            A_eq = np.vstack([c.coefficients for c in eq_constraints])
-            b_eq = np.array([c.bound for c in eq_constraints])
-        else:
-            A_eq = np.empty((0, self.n_projects * self.n_criteria))
-            b_eq = np.empty(0)
+        return self._matrix_cache[fmt]
+    
+    def get_augmented_matrix(self, equality: bool = True,
+                             sparse: Union[bool, str] = False) -> Union[np.ndarray, sp.spmatrix]:
+        """
+        Get the augmented matrix [A | b] of the equality (or inequality)
+        constraints, e.g. for rank-based consistency checks
+        
+        The bound column is written during assembly, so no column_stack copy
+        of A and b is made.
+        """
+        self._translate_pending()
+        self._sync_columns()
+        
+        row_mask = self._is_eq if equality else ~self._is_eq
+        return self._assemble_constraints(row_mask, _matrix_format(sparse), augmented=True)[0]
+    
+    def _assemble_constraints(self, row_mask: np.ndarray, fmt: str,
+                              augmented: bool = False) -> Tuple[Union[np.ndarray, sp.spmatrix], np.ndarray]:
+        """
+        Assemble the constraints selected by row_mask (in order) into a dense,
+        CSR or CSC matrix plus its bound vector, straight from the columnar
+        arrays (as COO triplets)
+        
+        With augmented=True the bounds are also placed in an extra last column.
+        """
+        n_vars = self.n_vars
+        n_rows = int(np.count_nonzero(row_mask))
+        if n_rows == 0 and not augmented:
+            # e.g. no equality constraints, the common case
+            return _empty_constraints(n_vars, fmt)
+        b = self._bounds[row_mask]
+        
+        # New row number of each selected constraint
+        new_row = np.cumsum(row_mask) - 1
+        entry_mask = row_mask[self._coeff_rows]
+        rows = new_row[self._coeff_rows[entry_mask]]
+        cols = self._coeff_cols[entry_mask]
+        vals = self._coeff_vals[entry_mask]
+        
+        if augmented:
+            rows = np.concatenate([rows, np.arange(n_rows)])
+            cols = np.concatenate([cols, np.full(n_rows, n_vars, dtype=cols.dtype)])
+            vals = np.concatenate([vals, b])
+            n_vars += 1
         
-        return A_ineq, b_ineq, A_eq, b_eq
+        A = sp.coo_matrix((vals, (rows, cols)), shape=(n_rows, n_vars))
+        return (A.toarray() if fmt == 'dense' else A.asformat(fmt)), b
     
     def validate_constraints(self) -> Dict[str, any]:
         """
         Validate the constraint system for consistency and feasibility
+        
+        Works on the sparse constraint matrices, so no dense A_eq is built.
         """
-        A_ineq, b_ineq, A_eq, b_eq = self.get_constraint_matrices()
+        A_ineq, b_ineq, A_eq, b_eq = self.get_constraint_matrices(sparse=True)
         
         validation_results = {
             'n_inequality_constraints': len(b_ineq),
             'n_equality_constraints': len(b_eq),
             'total_constraints': len(b_ineq) + len(b_eq),
-            'n_variables': self.n_projects * self.n_criteria,
+            'n_variables': self.n_vars,
+            'evaluations_by_evaluator': dict(self.stats['by_evaluator']),
+            'n_repeated_evaluations': self._n_repeated_evaluations,
             'is_overconstrained': False,
             'warnings': []
         }
         
         # Check for overconstrained system
-        total_constraints = len(b_ineq) + len(b_eq)
-        n_variables = self.n_projects * self.n_criteria
-        
-        if len(b_eq) > n_variables:
+        if len(b_eq) > self.n_vars:
             validation_results['is_overconstrained'] = True
             validation_results['warnings'].append("System may be overconstrained (more equality constraints than variables)")
         
         # Check for contradictory constraints (basic check)
         if len(b_eq) > 0:
             try:
-                # Check if equality constraints are consistent
-                rank_A = np.linalg.matrix_rank(A_eq)
-                rank_Ab = np.linalg.matrix_rank(np.column_stack([A_eq, b_eq]))
+                # Check if equality constraints are consistent, i.e. b_eq lies in
+                # the range of A_eq (rank(A_eq) == rank([A_eq | b_eq])): the
+                # sparse least-squares solution leaves a zero residual exactly
+                # when it does
+                x = lsqr(A_eq, b_eq, atol=1e-12, btol=1e-12, iter_lim=10 * A_eq.shape[1])[0]
+                residual = b_eq - A_eq @ x
+                residual_tol = np.sqrt(np.finfo(float).eps) * max(1.0, np.linalg.norm(b_eq))
                 
-                if rank_A != rank_Ab:
+                if np.linalg.norm(residual) > residual_tol:
                     validation_results['warnings'].append("Equality constraints appear to be inconsistent")
             except:
                 validation_results['warnings'].append("Could not verify equality constraint consistency")
         
         return validation_results
     
-    def export_constraints(self, format: str = 'dict') -> Union[Dict, pd.DataFrame]:
+    def export_constraints(self, format: str = 'dict',
+                           file: Union[str, IO[bytes], None] = None) -> Union[Dict, pd.DataFrame, Tuple, None]:
         """
         Export constraints in various formats
         
         Args:
-            format: 'dict', 'dataframe', or 'matrices'
+            format: 'dict', 'dataframe', 'matrices' or 'npz'. The dataframe
+                has one row per constraint with its non-zero coefficients in
+                the 'nz_cols' and 'nz_vals' columns.
+            file: Path or binary file object to write to, required for
+                'npz'. The constraint matrices are stored in compressed CSR
+                form and can be read back with load_constraint_matrices.
         """
-        if not self.constraints:
-            self.translate_evaluations()
+        if format == 'npz' and file is None:
+            raise ValueError("The 'npz' export format requires a file")
+        
+        self._translate_pending()
         
         if format == 'dict':
             return {
@@ -460,7 +962,8 @@ class QualitativeEvaluationTranslator:
                         'coefficients': c.coefficients.tolist(),
                         'bound': c.bound,
                         'is_equality': c.is_equality,
-                        'evaluator': c.source_evaluation.evaluator_id if c.source_evaluation else None
+                        'evaluator': c.source_evaluation.evaluator_id if c.source_evaluation else None,
+                        'supporting_evaluators': [e.evaluator_id for e in c.supporting_evaluations]
                     }
                     for c in self.constraints
                 ],
@@ -469,24 +972,66 @@ class QualitativeEvaluationTranslator:
             }
         
         elif format == 'dataframe':
-            data = []
-            for c in self.constraints:
-                data.append({
-                    'constraint_id': c.constraint_id,
-                    'bound': c.bound,
-                    'is_equality': c.is_equality,
-                    'evaluator': c.source_evaluation.evaluator_id if c.source_evaluation else None,
-                    'coefficients': c.coefficients.tolist()
-                })
-            return pd.DataFrame(data)
+            # Build columns directly; coefficients are kept in their sparse
+            # form (non-zero columns and values) rather than as dense lists
+            self._sync_columns()
+            return pd.DataFrame({
+                'constraint_id': [c.constraint_id for c in self.constraints],
+                'bound': self._bounds.copy(),
+                'is_equality': self._is_eq.copy(),
+                'evaluator': [c.source_evaluation.evaluator_id if c.source_evaluation else None
+                              for c in self.constraints],
+                'supporting_evaluators': [[e.evaluator_id for e in c.supporting_evaluations]
+                                          for c in self.constraints],
+                'nz_cols': [c.nz_cols for c in self.constraints],
+                'nz_vals': [c.nz_vals for c in self.constraints]
+            })
         
         elif format == 'matrices':
             return self.get_constraint_matrices()
         
+        elif format == 'npz':
+            A_ineq, b_ineq, A_eq, b_eq = self.get_constraint_matrices(sparse='csr')
+            arrays = {'b_ineq': b_ineq, 'b_eq': b_eq,
+                      'projects': np.array(self.projects), 'criteria': np.array(self.criteria)}
+            for name, A in (('A_ineq', A_ineq), ('A_eq', A_eq)):
+                arrays.update({
+                    f'{name}_data': A.data,
+                    f'{name}_indices': A.indices,
+                    f'{name}_indptr': A.indptr,
+                    f'{name}_shape': np.array(A.shape)
+                })
+            np.savez_compressed(file, **arrays)
+        
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
 
+def load_constraint_matrices(file: Union[str, IO[bytes]],
+                             sparse: Union[bool, str] = False) -> Tuple[Union[np.ndarray, sp.spmatrix], np.ndarray,
+                                                                        Union[np.ndarray, sp.spmatrix], np.ndarray]:
+    """
+    Load constraint matrices written by export_constraints('npz', file)
+    
+    Args:
+        file: Path or binary file object of the .npz archive
+        sparse: Matrix format of A_ineq and A_eq, as for get_constraint_matrices
+    
+    Returns:
+        A_ineq, b_ineq, A_eq, b_eq
+    """
+    fmt = _matrix_format(sparse)
+    with np.load(file) as data:
+        matrices = {}
+        for name in ('A_ineq', 'A_eq'):
+            A = sp.csr_matrix(
+                (data[f'{name}_data'], data[f'{name}_indices'], data[f'{name}_indptr']),
+                shape=tuple(data[f'{name}_shape'])
+            )
+            matrices[name] = A.toarray() if fmt == 'dense' else A.asformat(fmt)
+        return matrices['A_ineq'], data['b_ineq'], matrices['A_eq'], data['b_eq']
+
+
 def create_sample_evaluations() -> List[QualitativeEvaluation]:
     """Create sample qualitative evaluations for testing"""
     evaluations = [
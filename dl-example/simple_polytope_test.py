@@ -144,10 +144,11 @@ def debug_constraint_system():
     print("\n=== Debugging Constraint System ===\n")
     
     translator = create_simple_test_case()
-    A_ineq, b_ineq, A_eq, b_eq = translator.get_constraint_matrices()
+    # Sparse CSR matrices can be handed to HiGHS as they are
+    A_ineq, b_ineq, A_eq, b_eq = translator.get_constraint_matrices(sparse=True)
     
     print(f"System dimensions: {A_ineq.shape[1]} variables, {A_ineq.shape[0]} constraints")
-    print(f"Constraint matrix A_ineq:\n{A_ineq}")
+    print(f"Constraint matrix A_ineq:\n{A_ineq.toarray()}")
     print(f"Bounds b_ineq: {b_ineq}")
     
     # Check for obvious infeasibilities
@@ -160,7 +161,8 @@ def debug_constraint_system():
     c = np.ones(A_ineq.shape[1])
     
     try:
-        result = linprog(c, A_ub=A_ineq, b_ub=b_ineq, method='highs')
+        result = linprog(c, A_ub=A_ineq, b_ub=b_ineq, method='highs',
+                         options={'presolve': True})
         if result.success:
             print(f"Found feasible point: {result.x}")
             print(f"Objective value: {result.fun}")
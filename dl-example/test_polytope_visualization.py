@@ -6,65 +6,152 @@ functionality, including unit tests and integration tests.
 """
 
 import unittest
+import io
 import numpy as np
 import pandas as pd
 import tempfile
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 
+import plotly.graph_objects as go
+import plotly.subplots  # noqa: F401
+
 from qualitative_evaluation_translator import (
     QualitativeEvaluationTranslator, 
     QualitativeEvaluation, 
     EvaluationType,
     ComparisonOperator
 )
-from polytope_visualizer import PolytopeVisualizer
+from polytope_visualizer import PolytopeVisualizer, verify_vertices
+
+# plotly resolves figure and trace classes lazily on first access; load them
+# at collection time so the threaded projection tests don't serialize on the
+# import lock
+for _plotly_class in ("Figure", "Scatter", "Scatter3d", "Mesh3d", "Table"):
+    getattr(go, _plotly_class)
+
+
+# Evaluation fixtures, built once at import; translators only read them.
+# Basic evaluations for the 2-project, 2-criteria test case
+_BASIC_EVALUATIONS = [
+    QualitativeEvaluation(
+        evaluator_id="test_evaluator_1",
+        evaluation_type=EvaluationType.COMPARISON,
+        projects=["Project A", "Project B"],
+        operator=ComparisonOperator.GREATER,
+        criteria="Strategic Value"
+    ),
+    QualitativeEvaluation(
+        evaluator_id="test_evaluator_2",
+        evaluation_type=EvaluationType.RANGE,
+        projects=["Project A"],
+        values=[0.6, 0.9],
+        criteria="Strategic Value"
+    ),
+    QualitativeEvaluation(
+        evaluator_id="test_evaluator_3",
+        evaluation_type=EvaluationType.THRESHOLD,
+        projects=["Project A"],
+        operator=ComparisonOperator.GREATER_EQUAL,
+        values=[0.5],
+        criteria="Technical Feasibility"
+    )
+]
+
+# Comprehensive evaluations for the 4-project, 3-criteria integration case
+_INTEGRATION_EVALUATIONS = [
+    # Comparisons
+    QualitativeEvaluation(
+        evaluator_id="test_evaluator_1",
+        evaluation_type=EvaluationType.COMPARISON,
+        projects=["Logos Core", "Status App"],
+        operator=ComparisonOperator.GREATER,
+        criteria="Strategic Value"
+    ),
+    QualitativeEvaluation(
+        evaluator_id="test_evaluator_2",
+        evaluation_type=EvaluationType.COMPARISON,
+        projects=["Nimbus Client", "Waku Protocol"],
+        operator=ComparisonOperator.GREATER,
+        criteria="Technical Feasibility"
+    ),
+    
+    # Ranges
+    QualitativeEvaluation(
+        evaluator_id="test_evaluator_3",
+        evaluation_type=EvaluationType.RANGE,
+        projects=["Logos Core"],
+        values=[0.7, 0.95],
+        criteria="Strategic Value"
+    ),
+    QualitativeEvaluation(
+        evaluator_id="test_evaluator_4",
+        evaluation_type=EvaluationType.RANGE,
+        projects=["Nimbus Client"],
+        values=[0.8, 1.0],
+        criteria="Technical Feasibility"
+    ),
+    
+    # Thresholds
+    QualitativeEvaluation(
+        evaluator_id="test_evaluator_5",
+        evaluation_type=EvaluationType.THRESHOLD,
+        projects=["Logos Core"],
+        operator=ComparisonOperator.GREATER_EQUAL,
+        values=[0.4],
+        criteria="Strategic Value"
+    ),
+    QualitativeEvaluation(
+        evaluator_id="test_evaluator_6",
+        evaluation_type=EvaluationType.THRESHOLD,
+        projects=["Nimbus Client"],
+        operator=ComparisonOperator.GREATER_EQUAL,
+        values=[0.3],
+        criteria="Resource Efficiency"
+    ),
+    
+    # Ranking
+    QualitativeEvaluation(
+        evaluator_id="test_evaluator_7",
+        evaluation_type=EvaluationType.RANKING,
+        projects=["Nimbus Client", "Logos Core", "Status App", "Waku Protocol"],
+        criteria="Technical Feasibility"
+    )
+]
 
 
 class TestPolytopeVisualizer(unittest.TestCase):
     """Test cases for PolytopeVisualizer class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests (they do not modify them)."""
         # Create a simple test case with 2 projects and 2 criteria
-        self.projects = ["Project A", "Project B"]
-        self.criteria = ["Strategic Value", "Technical Feasibility"]
+        cls.projects = ["Project A", "Project B"]
+        cls.criteria = ["Strategic Value", "Technical Feasibility"]
         
-        self.translator = QualitativeEvaluationTranslator(
-            projects=self.projects,
-            criteria=self.criteria
+        cls.translator = QualitativeEvaluationTranslator(
+            projects=cls.projects,
+            criteria=cls.criteria
         )
         
         # Add some basic evaluations
-        evaluations = [
-            QualitativeEvaluation(
-                evaluator_id="test_evaluator_1",
-                evaluation_type=EvaluationType.COMPARISON,
-                projects=["Project A", "Project B"],
-                operator=ComparisonOperator.GREATER,
-                criteria="Strategic Value"
-            ),
-            QualitativeEvaluation(
-                evaluator_id="test_evaluator_2",
-                evaluation_type=EvaluationType.RANGE,
-                projects=["Project A"],
-                values=[0.6, 0.9],
-                criteria="Strategic Value"
-            ),
-            QualitativeEvaluation(
-                evaluator_id="test_evaluator_3",
-                evaluation_type=EvaluationType.THRESHOLD,
-                projects=["Project A"],
-                operator=ComparisonOperator.GREATER_EQUAL,
-                values=[0.5],
-                criteria="Technical Feasibility"
-            )
-        ]
+        cls.translator.add_evaluations(_BASIC_EVALUATIONS)
+        
+        # The constraint set is fixed from here on, so assemble it once
+        cls.A_ineq, cls.b_ineq, cls.A_eq, cls.b_eq = cls.translator.get_constraint_matrices()
+        cls.visualizer = PolytopeVisualizer(
+            cls.translator,
+            constraint_matrices=(cls.A_ineq, cls.b_ineq, cls.A_eq, cls.b_eq)
+        )
         
-        for eval in evaluations:
-            self.translator.add_evaluation(eval)
+        # Compute the vertices once (also caching the LP interior point)
+        cls.visualizer.compute_vertices()
         
-        self.visualizer = PolytopeVisualizer(self.translator)
+        # Warm up the (optional) JIT-compiled vertex check
+        verify_vertices(np.eye(2), np.ones(2), np.zeros((1, 2)))
     
     def test_initialization(self):
         """Test PolytopeVisualizer initialization."""
@@ -85,11 +172,36 @@ class TestPolytopeVisualizer(unittest.TestCase):
             self.assertEqual(vertices.shape[1], self.visualizer.n_dimensions)
             
             # All vertices should satisfy constraints
-            A_ineq, b_ineq, _, _ = self.translator.get_constraint_matrices()
-            for vertex in vertices:
-                constraint_violations = A_ineq @ vertex - b_ineq
-                self.assertTrue(np.all(constraint_violations <= 1e-8), 
-                              f"Vertex {vertex} violates constraints")
+            if not verify_vertices(self.A_ineq, self.b_ineq, vertices, tol=1e-8):
+                # Only materialize residuals to report the offending vertex
+                constraint_violations = self.A_ineq @ vertices.T - self.b_ineq[:, None]
+                worst = np.argmax(constraint_violations.max(axis=0))
+                self.fail(f"Vertex {vertices[worst]} violates constraints")
+    
+    def test_compute_vertices_per_bounds(self):
+        """Test that vertices are recomputed when the bounds change."""
+        translator = QualitativeEvaluationTranslator(projects=["P1", "P2"], criteria=["value"])
+        translator.add_evaluations([
+            QualitativeEvaluation(
+                evaluator_id="expert1",
+                evaluation_type=EvaluationType.RANGE,
+                projects=[project],
+                values=[0.2, 0.8]
+            )
+            for project in ["P1", "P2"]
+        ])
+        visualizer = PolytopeVisualizer(translator)
+        
+        vertices = visualizer.compute_vertices()
+        self.assertEqual(len(vertices), 4)
+        self.assertIs(visualizer.compute_vertices(), vertices)
+        x0 = visualizer._last_x0
+        
+        # Only the upper corner lies within the new bounds; the previous
+        # interior point is still strictly inside, so it is reused
+        vertices = visualizer.compute_vertices([(0.4, 1.0), (0.4, 1.0)])
+        np.testing.assert_allclose(vertices, [[0.8, 0.8]])
+        self.assertIs(visualizer._last_x0, x0)
     
     def test_compute_polytope_properties(self):
         """Test polytope property computation."""
@@ -151,112 +263,67 @@ class TestPolytopeVisualizer(unittest.TestCase):
     
     def test_export_polytope_data(self):
         """Test polytope data export functionality."""
+        vertices = self.visualizer.compute_vertices()
+        
+        # Test JSON export
+        json_buffer = io.StringIO()
+        self.visualizer.export_polytope_data(json_buffer, format="json", vertices=vertices)
+        self.assertGreater(len(json_buffer.getvalue()), 0)
+        
+        # Test CSV export
+        csv_buffer = io.StringIO()
+        self.visualizer.export_polytope_data(csv_buffer, format="csv", vertices=vertices)
+        # CSV should be written if there are vertices
+        if len(vertices) > 0:
+            self.assertGreater(len(csv_buffer.getvalue()), 0)
+        
+        # Test NPZ export
+        npz_buffer = io.BytesIO()
+        self.visualizer.export_polytope_data(npz_buffer, format="npz", vertices=vertices)
+        self.assertGreater(len(npz_buffer.getvalue()), 0)
+        npz_buffer.seek(0)
+        with np.load(npz_buffer) as archive:
+            self.assertEqual(archive['vertices'].dtype, np.float32)
+            self.assertEqual(archive['A_ineq'].dtype, np.float64)
+    
+    def test_export_polytope_data_to_file(self):
+        """Test polytope data export to a file path."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Test JSON export
             json_file = os.path.join(temp_dir, "test_polytope.json")
             self.visualizer.export_polytope_data(json_file, format="json")
             self.assertTrue(os.path.exists(json_file))
-            
-            # Test CSV export
-            csv_file = os.path.join(temp_dir, "test_polytope.csv")
-            self.visualizer.export_polytope_data(csv_file, format="csv")
-            # CSV file should exist if there are vertices
-            vertices = self.visualizer.compute_vertices()
-            if len(vertices) > 0:
-                self.assertTrue(os.path.exists(csv_file))
-            
-            # Test NPZ export
-            npz_file = os.path.join(temp_dir, "test_polytope.npz")
-            self.visualizer.export_polytope_data(npz_file, format="npz")
-            self.assertTrue(os.path.exists(npz_file))
     
     def test_invalid_export_format(self):
         """Test handling of invalid export format."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            invalid_file = os.path.join(temp_dir, "test.invalid")
-            with self.assertRaises(ValueError):
-                self.visualizer.export_polytope_data(invalid_file, format="invalid")
+        with self.assertRaises(ValueError):
+            self.visualizer.export_polytope_data(io.StringIO(), format="invalid")
 
 
 class TestPolytopeVisualizationIntegration(unittest.TestCase):
     """Integration tests for polytope visualization with real data."""
     
-    def setUp(self):
-        """Set up integration test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up integration test fixtures shared by all tests."""
         # Create a more complex scenario
-        self.projects = ["Logos Core", "Nimbus Client", "Status App", "Waku Protocol"]
-        self.criteria = ["Strategic Value", "Technical Feasibility", "Resource Efficiency"]
+        cls.projects = ["Logos Core", "Nimbus Client", "Status App", "Waku Protocol"]
+        cls.criteria = ["Strategic Value", "Technical Feasibility", "Resource Efficiency"]
         
-        self.translator = QualitativeEvaluationTranslator(
-            projects=self.projects,
-            criteria=self.criteria
+        cls.translator = QualitativeEvaluationTranslator(
+            projects=cls.projects,
+            criteria=cls.criteria
         )
         
         # Add comprehensive evaluations
-        evaluations = [
-            # Comparisons
-            QualitativeEvaluation(
-                evaluator_id="test_evaluator_1",
-                evaluation_type=EvaluationType.COMPARISON,
-                projects=["Logos Core", "Status App"],
-                operator=ComparisonOperator.GREATER,
-                criteria="Strategic Value"
-            ),
-            QualitativeEvaluation(
-                evaluator_id="test_evaluator_2",
-                evaluation_type=EvaluationType.COMPARISON,
-                projects=["Nimbus Client", "Waku Protocol"],
-                operator=ComparisonOperator.GREATER,
-                criteria="Technical Feasibility"
-            ),
-            
-            # Ranges
-            QualitativeEvaluation(
-                evaluator_id="test_evaluator_3",
-                evaluation_type=EvaluationType.RANGE,
-                projects=["Logos Core"],
-                values=[0.7, 0.95],
-                criteria="Strategic Value"
-            ),
-            QualitativeEvaluation(
-                evaluator_id="test_evaluator_4",
-                evaluation_type=EvaluationType.RANGE,
-                projects=["Nimbus Client"],
-                values=[0.8, 1.0],
-                criteria="Technical Feasibility"
-            ),
-            
-            # Thresholds
-            QualitativeEvaluation(
-                evaluator_id="test_evaluator_5",
-                evaluation_type=EvaluationType.THRESHOLD,
-                projects=["Logos Core"],
-                operator=ComparisonOperator.GREATER_EQUAL,
-                values=[0.4],
-                criteria="Strategic Value"
-            ),
-            QualitativeEvaluation(
-                evaluator_id="test_evaluator_6",
-                evaluation_type=EvaluationType.THRESHOLD,
-                projects=["Nimbus Client"],
-                operator=ComparisonOperator.GREATER_EQUAL,
-                values=[0.3],
-                criteria="Resource Efficiency"
-            ),
-            
-            # Ranking
-            QualitativeEvaluation(
-                evaluator_id="test_evaluator_7",
-                evaluation_type=EvaluationType.RANKING,
-                projects=["Nimbus Client", "Logos Core", "Status App", "Waku Protocol"],
-                criteria="Technical Feasibility"
-            )
-        ]
-        
-        for eval in evaluations:
-            self.translator.add_evaluation(eval)
+        cls.translator.add_evaluations(_INTEGRATION_EVALUATIONS)
         
-        self.visualizer = PolytopeVisualizer(self.translator)
+        # The constraint set is fixed from here on, so assemble it once
+        cls.A_ineq, cls.b_ineq, cls.A_eq, cls.b_eq = cls.translator.get_constraint_matrices()
+        cls.visualizer = PolytopeVisualizer(
+            cls.translator,
+            constraint_matrices=(cls.A_ineq, cls.b_ineq, cls.A_eq, cls.b_eq)
+        )
+        cls.visualizer.compute_vertices()
     
     def test_complex_polytope_properties(self):
         """Test polytope properties with complex constraint set."""
@@ -275,15 +342,16 @@ class TestPolytopeVisualizationIntegration(unittest.TestCase):
         # Test different dimension pairs
         dimension_pairs = [(0, 1), (0, 2), (1, 2), (3, 4)]
         
-        for dim_x, dim_y in dimension_pairs:
+        # Vertices and projected constraints are shared by all pairs
+        figs = self.visualizer.create_2d_visualizations(
+            dimension_pairs,
+            show_vertices=True,
+            show_constraints=True,
+            show_feasible_region=True
+        )
+        
+        for (dim_x, dim_y), fig in zip(dimension_pairs, figs):
             with self.subTest(dim_x=dim_x, dim_y=dim_y):
-                fig = self.visualizer.create_2d_visualization(
-                    dim_x=dim_x, dim_y=dim_y,
-                    show_vertices=True,
-                    show_constraints=True,
-                    show_feasible_region=True
-                )
-                
                 self.assertIsNotNone(fig)
                 self.assertGreater(len(fig.data), 0)
     
@@ -291,15 +359,23 @@ class TestPolytopeVisualizationIntegration(unittest.TestCase):
         """Test creating 3D projections."""
         # Test different dimension triplets
         dimension_triplets = [(0, 1, 2), (3, 4, 5), (0, 3, 6)]
+        vertices = self.visualizer.compute_vertices()
+        
+        with ThreadPoolExecutor(max_workers=min(len(dimension_triplets), os.cpu_count() or 1)) as executor:
+            figs = list(executor.map(
+                lambda triplet: self.visualizer.create_3d_visualization(
+                    dim_x=triplet[0], dim_y=triplet[1], dim_z=triplet[2],
+                    show_vertices=True,
+                    precomputed_vertices=vertices
+                ),
+                dimension_triplets
+            ))
         
-        for dim_x, dim_y, dim_z in dimension_triplets:
+        for (dim_x, dim_y, dim_z), fig in zip(dimension_triplets, figs):
             with self.subTest(dim_x=dim_x, dim_y=dim_y, dim_z=dim_z):
-                fig = self.visualizer.create_3d_visualization(
-                    dim_x=dim_x, dim_y=dim_y, dim_z=dim_z,
-                    show_vertices=True
-                )
-                
                 self.assertIsNotNone(fig)
+                self.assertTrue(hasattr(fig, 'data'))
+                self.assertTrue(hasattr(fig, 'layout'))
     
     def test_constraint_sensitivity_analysis(self):
         """Test basic constraint sensitivity analysis."""
@@ -328,93 +404,98 @@ class TestPolytopeVisualizationIntegration(unittest.TestCase):
 class TestPolytopeVisualizationEdgeCases(unittest.TestCase):
     """Test edge cases and error handling."""
     
-    def test_empty_constraint_set(self):
-        """Test behavior with no constraints."""
-        translator = QualitativeEvaluationTranslator(
+    @classmethod
+    def setUpClass(cls):
+        """Build one translator/visualizer per edge case."""
+        # Empty constraint set
+        empty_translator = QualitativeEvaluationTranslator(
             projects=["Project A"],
             criteria=["Criterion 1"]
         )
         
-        visualizer = PolytopeVisualizer(translator)
-        
-        # Should handle empty constraint set gracefully
-        properties = visualizer.compute_polytope_properties()
-        self.assertEqual(properties['n_constraints'], 0)
-    
-    def test_infeasible_constraint_set(self):
-        """Test behavior with infeasible constraints."""
-        translator = QualitativeEvaluationTranslator(
+        # Infeasible: contradictory ranges
+        infeasible_translator = QualitativeEvaluationTranslator(
             projects=["Project A"],
             criteria=["Criterion 1"]
         )
+        infeasible_translator.add_evaluations([
+            QualitativeEvaluation(
+                evaluator_id="test_evaluator_1",
+                evaluation_type=EvaluationType.RANGE,
+                projects=["Project A"],
+                values=[0.8, 0.9],
+                criteria="Criterion 1"
+            ),
+            QualitativeEvaluation(
+                evaluator_id="test_evaluator_2",
+                evaluation_type=EvaluationType.RANGE,
+                projects=["Project A"],
+                values=[0.1, 0.2],
+                criteria="Criterion 1"
+            )
+        ])
         
-        # Add contradictory constraints
-        eval1 = QualitativeEvaluation(
-            evaluator_id="test_evaluator_1",
-            evaluation_type=EvaluationType.RANGE,
+        # Single dimension
+        single_dimension_translator = QualitativeEvaluationTranslator(
             projects=["Project A"],
-            values=[0.8, 0.9],
-            criteria="Criterion 1"
+            criteria=["Criterion 1"]
         )
-        
-        eval2 = QualitativeEvaluation(
-            evaluator_id="test_evaluator_2",
+        single_dimension_translator.add_evaluation(QualitativeEvaluation(
+            evaluator_id="test_evaluator_1",
             evaluation_type=EvaluationType.RANGE,
             projects=["Project A"],
-            values=[0.1, 0.2],
+            values=[0.3, 0.7],
             criteria="Criterion 1"
-        )
-        
-        translator.add_evaluation(eval1)
-        translator.add_evaluation(eval2)
-        
-        visualizer = PolytopeVisualizer(translator)
-        
-        # Should handle infeasible constraints gracefully
-        vertices = visualizer.compute_vertices()
-        properties = visualizer.compute_polytope_properties()
+        ))
         
-        # Should have no vertices for infeasible system
-        self.assertEqual(len(vertices), 0)
-        self.assertEqual(properties['n_vertices'], 0)
-    
-    def test_single_dimension(self):
-        """Test behavior with single dimension."""
-        translator = QualitativeEvaluationTranslator(
+        # Bounded 2D box: the range applies to both criteria, [0.2, 0.6] x [0.2, 0.6]
+        bounded_translator = QualitativeEvaluationTranslator(
             projects=["Project A"],
-            criteria=["Criterion 1"]
+            criteria=["Criterion 1", "Criterion 2"]
         )
-        
-        eval1 = QualitativeEvaluation(
+        bounded_translator.add_evaluation(QualitativeEvaluation(
             evaluator_id="test_evaluator_1",
             evaluation_type=EvaluationType.RANGE,
             projects=["Project A"],
-            values=[0.3, 0.7],
-            criteria="Criterion 1"
-        )
-        
-        translator.add_evaluation(eval1)
-        visualizer = PolytopeVisualizer(translator)
-        
-        # Should handle single dimension gracefully
-        properties = visualizer.compute_polytope_properties()
-        self.assertEqual(properties['n_dimensions'], 1)
+            values=[0.2, 0.6]
+        ))
+        
+        # (name, visualizer, expected polytope properties)
+        cls.cases = [
+            ("empty_constraint_set", PolytopeVisualizer(empty_translator),
+             {'n_constraints': 0}),
+            ("infeasible_constraint_set", PolytopeVisualizer(infeasible_translator),
+             {'n_vertices': 0}),
+            ("single_dimension", PolytopeVisualizer(single_dimension_translator),
+             {'n_dimensions': 1}),
+            ("bounded_polytope", PolytopeVisualizer(bounded_translator),
+             {'n_dimensions': 2, 'n_vertices': 4}),
+        ]
+    
+    def test_edge_cases(self):
+        """Test that edge-case constraint sets are handled gracefully."""
+        for name, visualizer, expected in self.cases:
+            with self.subTest(case=name):
+                vertices = visualizer.compute_vertices()
+                properties = visualizer.compute_polytope_properties()
+                
+                self.assertEqual(properties['n_vertices'], len(vertices))
+                for key, value in expected.items():
+                    self.assertEqual(properties[key], value)
+                
+                # All vertices should satisfy constraints
+                self.assertTrue(verify_vertices(visualizer.A_ineq, visualizer.b_ineq, vertices))
 
 
 def run_visualization_tests():
     """Run all polytope visualization tests."""
     print("Running Polytope Visualization Tests...\n")
     
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPolytopeVisualizer))
-    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPolytopeVisualizationIntegration))
-    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPolytopeVisualizationEdgeCases))
+    # Create test suite from all test cases in this module
+    test_suite = unittest.defaultTestLoader.loadTestsFromModule(sys.modules[__name__])
     
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Run tests (quietly on CI)
+    runner = unittest.TextTestRunner(verbosity=0 if os.environ.get("CI") else 2)
     result = runner.run(test_suite)
     
     # Print summary
@@ -5,6 +5,7 @@ This module contains comprehensive tests for the qualitative evaluation translat
 including unit tests, integration tests, and example scenarios.
 """
 
+import io
 import unittest
 import numpy as np
 import tempfile
@@ -17,7 +18,8 @@ from qualitative_evaluation_translator import (
     QualitativeEvaluation,
     EvaluationType,
     ComparisonOperator,
-    LinearConstraint
+    LinearConstraint,
+    load_constraint_matrices
 )
 from evaluation_input_parser import (
     NaturalLanguageParser,
@@ -66,7 +68,25 @@ class TestQualitativeEvaluationTranslator(unittest.TestCase):
         expected_coeffs[0] = 1.0   # ProjectA, value criterion
         expected_coeffs[2] = -1.0  # ProjectB, value criterion
         np.testing.assert_array_equal(constraint.coefficients, expected_coeffs)
-    
+
+        # Only the two non-zero entries are stored
+        np.testing.assert_array_equal(constraint.nz_cols, [0, 2])
+        np.testing.assert_array_equal(constraint.nz_vals, [1.0, -1.0])
+
+    def test_linear_constraint_from_dense(self):
+        """Test that dense and sparse constructions are equivalent"""
+        dense = LinearConstraint(coefficients=np.array([0.0, 2.0, 0.0, -1.0]), bound=1.0)
+        sparse = LinearConstraint(nz_cols=[1, 3], nz_vals=[2.0, -1.0], n_vars=4, bound=1.0)
+
+        np.testing.assert_array_equal(dense.nz_cols, sparse.nz_cols)
+        np.testing.assert_array_equal(dense.coefficients, sparse.coefficients)
+        with self.assertRaises(ValueError):
+            LinearConstraint(bound=1.0)
+        self.assertEqual(dense.constraint_id, "")
+        lazy = LinearConstraint(nz_cols=[0], nz_vals=[1.0], n_vars=4,
+                                id_parts=("range", "lower", "ProjectA", "value"))
+        self.assertEqual(lazy.constraint_id, "range_lower_ProjectA_value")
+
     def test_comparison_evaluation_equal(self):
         """Test parsing of equality comparison evaluations"""
         evaluation = QualitativeEvaluation(
@@ -82,7 +102,40 @@ class TestQualitativeEvaluationTranslator(unittest.TestCase):
         for constraint in constraints:
             self.assertTrue(constraint.is_equality)
             self.assertEqual(constraint.bound, 0.0)
-    
+
+    def test_comparison_batch_matches_single_parse(self):
+        """Test that batched comparison parsing matches per-evaluation parsing"""
+        evaluations = [
+            QualitativeEvaluation(
+                evaluator_id="expert1",
+                evaluation_type=EvaluationType.COMPARISON,
+                projects=["ProjectA", "ProjectB"],
+                operator=ComparisonOperator.GREATER
+            ),
+            QualitativeEvaluation(
+                evaluator_id="expert2",
+                evaluation_type=EvaluationType.COMPARISON,
+                projects=["ProjectA", "Unknown"],
+                operator=ComparisonOperator.GREATER
+            ),
+            QualitativeEvaluation(
+                evaluator_id="expert3",
+                evaluation_type=EvaluationType.COMPARISON,
+                projects=["ProjectC", "ProjectD"],
+                operator=ComparisonOperator.GREATER,
+                criteria="risk"
+            )
+        ]
+
+        batch = self.translator.parse_comparison_batch(evaluations)
+
+        self.assertEqual([len(constraints) for constraints in batch], [2, 0, 1])
+        for evaluation, constraints in zip([evaluations[0], evaluations[2]], [batch[0], batch[2]]):
+            expected = self.translator.parse_comparison_evaluation(evaluation)
+            for got, want in zip(constraints, expected):
+                np.testing.assert_array_equal(got.coefficients, want.coefficients)
+                self.assertEqual(got.constraint_id, want.constraint_id)
+
     def test_range_evaluation(self):
         """Test parsing of range evaluations"""
         evaluation = QualitativeEvaluation(
@@ -102,6 +155,23 @@ class TestQualitativeEvaluationTranslator(unittest.TestCase):
         self.assertIn(0.3, bounds)   # Lower bound
         self.assertIn(-0.7, bounds)  # Upper bound (negated for <= constraint)
     
+    def test_range_evaluation_single_entry_bounds(self):
+        """Test that each range bound is a single-entry constraint"""
+        evaluation = QualitativeEvaluation(
+            evaluator_id="test_expert",
+            evaluation_type=EvaluationType.RANGE,
+            projects=["ProjectA"],
+            values=[0.3, 0.7],
+            criteria="value"
+        )
+        
+        lower, upper = self.translator.parse_range_evaluation(evaluation)
+        
+        np.testing.assert_array_equal(lower.nz_cols, [0])
+        np.testing.assert_array_equal(upper.nz_cols, [0])
+        self.assertEqual(lower.nz_vals.tolist(), [-1.0])
+        self.assertEqual(upper.nz_vals.tolist(), [1.0])
+    
     def test_ranking_evaluation(self):
         """Test parsing of ranking evaluations"""
         evaluation = QualitativeEvaluation(
@@ -134,6 +204,41 @@ class TestQualitativeEvaluationTranslator(unittest.TestCase):
         for constraint in constraints:
             self.assertFalse(constraint.is_equality)
             self.assertEqual(constraint.bound, 0.5)
+
+    def test_threshold_evaluation_single_criterion(self):
+        """Test that a threshold on one criterion only constrains that criterion"""
+        evaluation = QualitativeEvaluation(
+            evaluator_id="test_expert",
+            evaluation_type=EvaluationType.THRESHOLD,
+            projects=["ProjectB"],
+            operator=ComparisonOperator.LESS_EQUAL,
+            values=[0.4],
+            criteria="risk"
+        )
+
+        constraints = self.translator.parse_threshold_evaluation(evaluation)
+
+        self.assertEqual(len(constraints), 1)
+        self.assertEqual(constraints[0].constraint_id, "threshold_ProjectB_risk")
+        np.testing.assert_array_equal(constraints[0].nz_cols, [3])  # ProjectB, risk
+
+    def test_threshold_evaluation_unknown_criterion(self):
+        """Test that a threshold on an unknown criterion applies to all criteria"""
+        evaluation = QualitativeEvaluation(
+            evaluator_id="test_expert",
+            evaluation_type=EvaluationType.THRESHOLD,
+            projects=["ProjectB"],
+            operator=ComparisonOperator.GREATER_EQUAL,
+            values=[0.4],
+            criteria="strategic_value"
+        )
+
+        with self.assertLogs('qualitative_evaluation_translator', level='WARNING'):
+            constraints = self.translator.parse_threshold_evaluation(evaluation)
+
+        self.assertEqual([c.constraint_id for c in constraints],
+                         ["threshold_ProjectB_value", "threshold_ProjectB_risk"])
+        self.assertEqual([c.nz_cols.tolist() for c in constraints], [[2], [3]])
     
     def test_constraint_matrices(self):
         """Test generation of constraint matrices"""
@@ -165,7 +270,267 @@ class TestQualitativeEvaluationTranslator(unittest.TestCase):
         # Should have equality constraints from second evaluation
         self.assertGreater(A_eq.shape[0], 0)
         self.assertEqual(A_eq.shape[1], 8)
-    
+
+    def test_sparse_constraint_matrices(self):
+        """Test that sparse constraint matrices match the dense ones"""
+        self.translator.add_evaluation(QualitativeEvaluation(
+            evaluator_id="expert1",
+            evaluation_type=EvaluationType.RANKING,
+            projects=["ProjectA", "ProjectB", "ProjectC"],
+            criteria="value"
+        ))
+
+        A_ineq, b_ineq, A_eq, b_eq = self.translator.get_constraint_matrices()
+        S_ineq, s_ineq, S_eq, s_eq = self.translator.get_constraint_matrices(sparse=True)
+
+        self.assertEqual(S_ineq.format, 'csr')
+        self.assertEqual(S_ineq.nnz, 4)  # 2 comparisons x 2 projects
+        np.testing.assert_array_equal(S_ineq.toarray(), A_ineq)
+        np.testing.assert_array_equal(s_ineq, b_ineq)
+        self.assertEqual(S_eq.shape, (0, 8))
+
+        C_ineq, c_ineq, C_eq, _ = self.translator.get_constraint_matrices(sparse='csc')
+        self.assertEqual(C_ineq.format, 'csc')
+        np.testing.assert_array_equal(C_ineq.toarray(), A_ineq)
+        np.testing.assert_array_equal(c_ineq, b_ineq)
+        self.assertEqual((C_eq.format, C_eq.shape), ('csc', (0, 8)))
+        with self.assertRaises(ValueError):
+            self.translator.get_constraint_matrices(sparse='dok')
+
+        # Without equality constraints empty matrices are returned, not
+        # shared between translators
+        other = QualitativeEvaluationTranslator(self.projects, self.criteria)
+        self.assertIsNot(other.get_constraint_matrices(sparse=True)[2], S_eq)
+        self.assertEqual(other.get_constraint_matrices()[2].shape, (0, 8))
+
+    def test_incremental_translation(self):
+        """Test that evaluations are translated as they are added"""
+        self.translator.add_evaluation(QualitativeEvaluation(
+            evaluator_id="expert1",
+            evaluation_type=EvaluationType.COMPARISON,
+            projects=["ProjectA", "ProjectB"],
+            operator=ComparisonOperator.GREATER
+        ))
+        self.assertEqual(len(self.translator.constraints), 2)
+
+        self.translator.add_evaluation(QualitativeEvaluation(
+            evaluator_id="expert2",
+            evaluation_type=EvaluationType.RANGE,
+            projects=["ProjectC"],
+            values=[0.2, 0.8],
+            criteria="risk"
+        ))
+        self.assertEqual(len(self.translator.constraints), 4)
+
+        # Re-translating does not duplicate constraints
+        self.assertEqual(len(self.translator.translate_evaluations()), 4)
+
+    def test_translation_after_lists_replaced(self):
+        """Test that replacing or clearing the lists re-translates the evaluations"""
+        evaluation = QualitativeEvaluation(
+            evaluator_id="expert1",
+            evaluation_type=EvaluationType.COMPARISON,
+            projects=["ProjectA", "ProjectB"],
+            operator=ComparisonOperator.GREATER
+        )
+        self.translator.add_evaluation(evaluation)
+
+        # The returned list is a copy
+        constraints = self.translator.translate_evaluations()
+        constraints.clear()
+        self.assertEqual(len(self.translator.constraints), 2)
+
+        self.translator.evaluations = [evaluation]
+        self.translator.constraints = []
+        self.assertEqual(len(self.translator.translate_evaluations()), 2)
+
+        self.translator.constraints.clear()
+        A_ineq, b_ineq, _, _ = self.translator.get_constraint_matrices()
+        self.assertEqual(A_ineq.shape, (2, 8))
+
+    def test_add_evaluations_batch(self):
+        """Test that a batch add matches adding evaluations one by one"""
+        evaluations = [
+            QualitativeEvaluation(
+                evaluator_id="expert1",
+                evaluation_type=EvaluationType.COMPARISON,
+                projects=["ProjectA", "ProjectB"],
+                operator=ComparisonOperator.GREATER
+            ),
+            QualitativeEvaluation(
+                evaluator_id="expert2",
+                evaluation_type=EvaluationType.RANKING,
+                projects=["ProjectC", "ProjectD"],
+                criteria="value"
+            ),
+            QualitativeEvaluation(
+                evaluator_id="expert2",
+                evaluation_type=EvaluationType.RANGE,
+                projects=["ProjectC"],
+                values=[0.2, 0.8],
+                criteria="risk"
+            )
+        ]
+        for ev in evaluations:
+            self.translator.add_evaluation(ev)
+
+        batch_translator = QualitativeEvaluationTranslator(self.projects, self.criteria)
+        batch_translator.add_evaluations(evaluations)
+
+        self.assertEqual([c.constraint_id for c in batch_translator.constraints],
+                         [c.constraint_id for c in self.translator.constraints])
+        self.assertEqual(batch_translator.stats, self.translator.stats)
+        for batch_part, single_part in zip(batch_translator.get_constraint_matrices(),
+                                           self.translator.get_constraint_matrices()):
+            np.testing.assert_array_equal(batch_part, single_part)
+
+    def test_resolve_projects(self):
+        """Test that project names resolve to an int32 index array"""
+        indices = self.translator.resolve_projects(["ProjectC", "ProjectA"])
+        self.assertEqual(indices.dtype, np.int32)
+        np.testing.assert_array_equal(indices, [2, 0])
+        with self.assertRaises(KeyError):
+            self.translator.resolve_projects(["Unknown"])
+
+    def test_incremental_matrices_past_buffer_growth(self):
+        """Test that matrices synced in steps match a single translation"""
+        evaluations = [
+            QualitativeEvaluation(
+                evaluator_id="expert1",
+                evaluation_type=EvaluationType.THRESHOLD,
+                projects=[self.projects[i % len(self.projects)]],
+                operator=ComparisonOperator.GREATER_EQUAL,
+                values=[i / 1000],
+                criteria="value"
+            )
+            for i in range(600)
+        ]
+        for start in range(0, len(evaluations), 100):
+            self.translator.add_evaluations(evaluations[start:start + 100])
+            self.translator.get_constraint_matrices(sparse=True)
+
+        batch_translator = QualitativeEvaluationTranslator(self.projects, self.criteria)
+        batch_translator.add_evaluations(evaluations)
+
+        for batch_part, step_part in zip(batch_translator.get_constraint_matrices(),
+                                         self.translator.get_constraint_matrices()):
+            np.testing.assert_array_equal(batch_part, step_part)
+
+    def test_duplicate_constraints_skipped(self):
+        """Test that a ranking restating a comparison adds no duplicate rows"""
+        self.translator.add_evaluation(QualitativeEvaluation(
+            evaluator_id="expert1",
+            evaluation_type=EvaluationType.COMPARISON,
+            projects=["ProjectA", "ProjectB"],
+            operator=ComparisonOperator.GREATER,
+            criteria="value"
+        ))
+        self.translator.add_evaluation(QualitativeEvaluation(
+            evaluator_id="expert2",
+            evaluation_type=EvaluationType.RANKING,
+            projects=["ProjectA", "ProjectB", "ProjectC"],
+            criteria="value"
+        ))
+
+        # A>B from the comparison, plus only B>C from the ranking
+        self.assertEqual(len(self.translator.constraints), 2)
+
+    def test_repeated_evaluation_not_reparsed(self):
+        """Test that the same statement from another expert is skipped"""
+        for evaluator_id in ["expert1", "expert2"]:
+            self.translator.add_evaluation(QualitativeEvaluation(
+                evaluator_id=evaluator_id,
+                evaluation_type=EvaluationType.THRESHOLD,
+                projects=["ProjectA"],
+                operator=ComparisonOperator.GREATER_EQUAL,
+                values=[0.4],
+                criteria="value"
+            ))
+
+        self.assertEqual(len(self.translator.constraints), 1)
+        validation = self.translator.validate_constraints()
+        self.assertEqual(validation['n_repeated_evaluations'], 1)
+        self.assertEqual(validation['evaluations_by_evaluator'], {"expert1": 1, "expert2": 1})
+
+        # The second expert's statement is kept on the surviving constraint
+        constraint = self.translator.constraints[0]
+        self.assertEqual(constraint.source_evaluation.evaluator_id, "expert1")
+        self.assertEqual([e.evaluator_id for e in constraint.supporting_evaluations], ["expert2"])
+        exported = self.translator.export_constraints('dict')['constraints'][0]
+        self.assertEqual(exported['supporting_evaluators'], ["expert2"])
+
+    def test_duplicate_bounds_within_float_noise(self):
+        """Test that constraints whose bounds differ only by float noise are deduplicated"""
+        self.translator.add_evaluations([
+            QualitativeEvaluation(
+                evaluator_id=evaluator_id,
+                evaluation_type=EvaluationType.THRESHOLD,
+                projects=["ProjectA"],
+                operator=ComparisonOperator.GREATER_EQUAL,
+                values=[value],
+                criteria="value"
+            )
+            for evaluator_id, value in [("expert1", 0.1 + 0.2), ("expert2", 0.3)]
+        ])
+        self.assertEqual(len(self.translator.constraints), 1)
+
+    def test_malformed_evaluation_skipped(self):
+        """Test that a malformed evaluation is logged and later ones still translate"""
+        with self.assertLogs('qualitative_evaluation_translator', level='ERROR'):
+            self.translator.add_evaluation(QualitativeEvaluation(
+                evaluator_id="expert1",
+                evaluation_type=EvaluationType.THRESHOLD,
+                projects=["ProjectA"],
+                operator=ComparisonOperator.GREATER_EQUAL,
+                values=5,
+                criteria="value"
+            ))
+            self.translator.add_evaluation(QualitativeEvaluation(
+                evaluator_id="expert1",
+                evaluation_type=EvaluationType.COMPARISON,
+                projects=["ProjectA", "ProjectB"],
+                operator=ComparisonOperator.GREATER,
+                criteria=["value"]
+            ))
+        self.assertEqual(len(self.translator.constraints), 0)
+
+        self.translator.add_evaluation(QualitativeEvaluation(
+            evaluator_id="expert2",
+            evaluation_type=EvaluationType.THRESHOLD,
+            projects=["ProjectA"],
+            operator=ComparisonOperator.GREATER_EQUAL,
+            values=[0.4],
+            criteria="value"
+        ))
+        constraints = self.translator.translate_evaluations()
+        self.assertEqual([c.constraint_id for c in constraints], ["threshold_ProjectA_value"])
+
+    def test_constraint_matrices_cached(self):
+        """Test that assembled matrices are reused until constraints change"""
+        self.translator.add_evaluation(QualitativeEvaluation(
+            evaluator_id="expert1",
+            evaluation_type=EvaluationType.COMPARISON,
+            projects=["ProjectA", "ProjectB"],
+            operator=ComparisonOperator.GREATER
+        ))
+
+        first = self.translator.get_constraint_matrices()
+        self.assertIs(self.translator.get_constraint_matrices(), first)
+
+        # The shared arrays cannot be modified through the returned values
+        with self.assertRaises(ValueError):
+            first[0][0, 0] = 99
+        with self.assertRaises(ValueError):
+            self.translator.get_constraint_matrices(sparse=True)[0].data[0] = 99
+
+        # Appending directly to the constraint list must invalidate the cache
+        self.translator.constraints.append(LinearConstraint(
+            coefficients=np.ones(8), bound=1.0, constraint_id="manual"
+        ))
+        A_ineq, b_ineq, _, _ = self.translator.get_constraint_matrices()
+        self.assertEqual(A_ineq.shape[0], first[0].shape[0] + 1)
+        self.assertEqual(b_ineq[-1], 1.0)
+
     def test_validation(self):
         """Test constraint validation"""
         # Add a simple evaluation
@@ -185,7 +550,36 @@ class TestQualitativeEvaluationTranslator(unittest.TestCase):
         self.assertIn('n_variables', validation)
         self.assertIn('is_overconstrained', validation)
         self.assertIn('warnings', validation)
+        self.assertEqual(validation['evaluations_by_evaluator'], {'expert1': 1})
+        self.assertEqual(self.translator.stats['by_operator'][">"], 1)
+        self.assertEqual(self.translator.n_variables, 8)
+        self.assertEqual(self.translator.n_vars, 8)
     
+    def test_validation_detects_inconsistent_equalities(self):
+        """Test that contradictory equality constraints produce a warning"""
+        self.translator.add_evaluation(QualitativeEvaluation(
+            evaluator_id="expert1",
+            evaluation_type=EvaluationType.COMPARISON,
+            projects=["ProjectA", "ProjectB"],
+            operator=ComparisonOperator.EQUAL
+        ))
+        self.assertEqual(self.translator.validate_constraints()['warnings'], [])
+
+        # v_A - v_B = 1 contradicts v_A - v_B = 0
+        coeffs = np.zeros(8)
+        coeffs[0], coeffs[2] = 1.0, -1.0
+        self.translator.constraints.append(LinearConstraint(
+            coefficients=coeffs, bound=1.0, is_equality=True
+        ))
+        self.assertIn("Equality constraints appear to be inconsistent",
+                      self.translator.validate_constraints()['warnings'])
+
+        _, _, A_eq, b_eq = self.translator.get_constraint_matrices()
+        augmented = self.translator.get_augmented_matrix()
+        np.testing.assert_array_equal(augmented[:, :-1], A_eq)
+        np.testing.assert_array_equal(augmented[:, -1], b_eq)
+        self.assertGreater(np.linalg.matrix_rank(augmented), np.linalg.matrix_rank(A_eq))
+
     def test_export_constraints(self):
         """Test constraint export functionality"""
         evaluation = QualitativeEvaluation(
@@ -205,11 +599,46 @@ class TestQualitativeEvaluationTranslator(unittest.TestCase):
         # Test dataframe export
         constraint_df = self.translator.export_constraints('dataframe')
         self.assertGreater(len(constraint_df), 0)
+        self.assertEqual(constraint_df['bound'].dtype, np.float64)
+        np.testing.assert_array_equal(constraint_df['nz_cols'].iloc[0], [0, 2])
         
         # Test matrices export
         matrices = self.translator.export_constraints('matrices')
         self.assertEqual(len(matrices), 4)  # A_ineq, b_ineq, A_eq, b_eq
 
+    def test_npz_export_import(self):
+        """Test constraint matrix roundtrip through a compressed .npz archive"""
+        self.translator.add_evaluations([
+            QualitativeEvaluation(
+                evaluator_id="expert1",
+                evaluation_type=EvaluationType.COMPARISON,
+                projects=["ProjectA", "ProjectB"],
+                operator=ComparisonOperator.EQUAL
+            ),
+            QualitativeEvaluation(
+                evaluator_id="expert2",
+                evaluation_type=EvaluationType.THRESHOLD,
+                projects=["ProjectC"],
+                operator=ComparisonOperator.GREATER_EQUAL,
+                values=[0.4]
+            )
+        ])
+
+        buffer = io.BytesIO()
+        self.translator.export_constraints('npz', buffer)
+        buffer.seek(0)
+        loaded = load_constraint_matrices(buffer)
+
+        for loaded_part, part in zip(loaded, self.translator.get_constraint_matrices()):
+            np.testing.assert_array_equal(loaded_part, part)
+
+        buffer.seek(0)
+        A_ineq, _, A_eq, _ = load_constraint_matrices(buffer, sparse='csc')
+        self.assertEqual((A_ineq.format, A_eq.format), ('csc', 'csc'))
+
+        with self.assertRaises(ValueError):
+            self.translator.export_constraints('npz')
+
 
 class TestNaturalLanguageParser(unittest.TestCase):
     """Test cases for natural language parsing"""
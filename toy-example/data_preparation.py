@@ -3,6 +3,85 @@ import numpy as np
 import json
 from datetime import datetime
 import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# orjson encodes the visualization JSON files when it is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyarrow's multithreaded CSV reader is used when it is installed
+try:
+    import pyarrow
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# CSV files in ../toy-data, with the columns to parse as dates
+DATA_FILES = {
+    'projects': ['start_date', 'end_date', 'created_date', 'last_updated'],
+    'dependencies': ['created_date'],
+    'resources': [],
+    'resource_allocations': ['allocation_start', 'allocation_end'],
+    'strategic_dimensions': ['last_assessed'],
+    'timeline_events': ['planned_date', 'actual_date'],
+    'portfolio_metrics': ['metric_date'],
+    'dependency_impacts': [],
+    'time_series_snapshots': ['snapshot_date']
+}
+
+# Total dataset rows from which the per-dataset export runs in worker
+# processes; below it, process startup costs more than the export
+PARALLEL_EXPORT_ROWS = 100_000
+
+# Low-cardinality string columns, read as categoricals
+CATEGORY_COLUMNS = {
+    'projects': ['status', 'strategic_priority', 'portfolio_theme', 'risk_level'],
+    'dependencies': ['dependency_type', 'impact_if_broken'],
+    'resources': ['resource_type'],
+    'resource_allocations': ['priority_level', 'allocation_status']
+}
+
+def read_data_file(name):
+    """
+    Read one toy-data CSV file, parsing its date and categorical columns
+    while reading
+    
+    Integer columns whose values fit are narrowed to int32. Float columns
+    stay float64, as float32 would change the exported values.
+    """
+    dtype = {col: 'category' for col in CATEGORY_COLUMNS.get(name, [])}
+    df = pd.read_csv(f'../toy-data/{name}.csv', parse_dates=DATA_FILES[name],
+                     dtype=dtype, engine=CSV_ENGINE)
+    
+    int32_range = np.iinfo(np.int32)
+    for col in df.select_dtypes(include='int64').columns:
+        if df[col].between(int32_range.min, int32_range.max).all():
+            df[col] = df[col].astype('int32')
+    
+    return name, df
+
+def write_json(data, path):
+    """
+    Write data to path as JSON indented by two spaces, with orjson when it
+    is installed (which also encodes NumPy values directly)
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+def count_by_project(project_ids, name):
+    """
+    Number of occurrences of each project id, as a Series indexed by id
+    (missing ids are not counted)
+    """
+    codes, uniques = pd.factorize(project_ids)
+    return pd.Series(np.bincount(codes[codes >= 0], minlength=len(uniques)), index=uniques, name=name)
 
 def load_and_prepare_data():
     """
@@ -12,52 +91,22 @@ def load_and_prepare_data():
     # Load all CSV files
     print("Loading CSV files...")
     
-    # Core project data
-    projects = pd.read_csv('../toy-data/projects.csv')
-    dependencies = pd.read_csv('../toy-data/dependencies.csv')
-    resources = pd.read_csv('../toy-data/resources.csv')
-    resource_allocations = pd.read_csv('../toy-data/resource_allocations.csv')
-    strategic_dimensions = pd.read_csv('../toy-data/strategic_dimensions.csv')
-    timeline_events = pd.read_csv('../toy-data/timeline_events.csv')
-    portfolio_metrics = pd.read_csv('../toy-data/portfolio_metrics.csv')
-    dependency_impacts = pd.read_csv('../toy-data/dependency_impacts.csv')
-    time_series_snapshots = pd.read_csv('../toy-data/time_series_snapshots.csv')
-    
-    print(f"Loaded {len(projects)} projects, {len(dependencies)} dependencies, {len(resources)} resources")
+    # The files are parsed concurrently; the C parser releases the GIL
+    with ThreadPoolExecutor(max_workers=len(DATA_FILES)) as executor:
+        tables = dict(executor.map(read_data_file, DATA_FILES))
     
-    # Data cleaning and type conversions
-    print("Cleaning and preparing data...")
-    
-    # Convert date columns
-    date_columns = {
-        'projects': ['start_date', 'end_date', 'created_date', 'last_updated'],
-        'dependencies': ['created_date'],
-        'resource_allocations': ['allocation_start', 'allocation_end'],
-        'timeline_events': ['planned_date', 'actual_date'],
-        'portfolio_metrics': ['metric_date'],
-        'time_series_snapshots': ['snapshot_date'],
-        'strategic_dimensions': ['last_assessed']
-    }
+    projects = tables['projects']
+    dependencies = tables['dependencies']
+    resources = tables['resources']
+    resource_allocations = tables['resource_allocations']
+    strategic_dimensions = tables['strategic_dimensions']
+    time_series_snapshots = tables['time_series_snapshots']
     
-    for df_name, cols in date_columns.items():
-        df = locals()[df_name]
-        for col in cols:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
+    print(f"Loaded {len(projects)} projects, {len(dependencies)} dependencies, {len(resources)} resources")
     
     # Create unified project dataset
     print("Creating unified project dataset...")
     
-    # Start with projects as base
-    unified_projects = projects.copy()
-    
-    # Add strategic dimensions
-    unified_projects = unified_projects.merge(
-        strategic_dimensions, 
-        on='project_id', 
-        how='left'
-    )
-    
     # Calculate resource allocation summaries per project
     resource_summary = resource_allocations.groupby('project_id').agg({
         'allocated_amount': 'sum',
@@ -67,72 +116,70 @@ def load_and_prepare_data():
         'allocated_amount': 'total_allocated_amount',
         'allocation_percentage': 'total_allocation_percentage', 
         'resource_id': 'resource_count'
-    }).reset_index()
-    
-    unified_projects = unified_projects.merge(
-        resource_summary,
-        on='project_id',
-        how='left'
-    )
+    })
     
     # Add dependency counts
-    dep_out = dependencies.groupby('source_project_id').size().rename('dependencies_out').reset_index()
-    dep_in = dependencies.groupby('target_project_id').size().rename('dependencies_in').reset_index()
-    
-    unified_projects = unified_projects.merge(
-        dep_out.rename(columns={'source_project_id': 'project_id'}),
-        on='project_id',
-        how='left'
-    )
-    
-    unified_projects = unified_projects.merge(
-        dep_in.rename(columns={'target_project_id': 'project_id'}),
-        on='project_id', 
-        how='left'
-    )
+    dep_out = count_by_project(dependencies['source_project_id'], 'dependencies_out')
+    dep_in = count_by_project(dependencies['target_project_id'], 'dependencies_in')
+    
+    # Every table is keyed uniquely by project id, so align them on that
+    # index and add strategic dimensions, resource summaries and
+    # dependency counts to the projects in a single join
+    project_data = pd.concat([
+        strategic_dimensions.set_index('project_id'),
+        resource_summary,
+        dep_out.rename_axis('project_id'),
+        dep_in.rename_axis('project_id')
+    ], axis=1)
+    unified_projects = projects.join(project_data, on='project_id', how='left')
     
     # Fill NaN values
-    unified_projects['dependencies_out'] = unified_projects['dependencies_out'].fillna(0)
-    unified_projects['dependencies_in'] = unified_projects['dependencies_in'].fillna(0)
-    unified_projects['total_allocated_amount'] = unified_projects['total_allocated_amount'].fillna(0)
-    unified_projects['total_allocation_percentage'] = unified_projects['total_allocation_percentage'].fillna(0)
-    unified_projects['resource_count'] = unified_projects['resource_count'].fillna(0)
+    unified_projects = unified_projects.fillna({
+        'dependencies_out': 0,
+        'dependencies_in': 0,
+        'total_allocated_amount': 0,
+        'total_allocation_percentage': 0,
+        'resource_count': 0
+    })
     
     # Calculate derived metrics
     unified_projects['budget_utilization'] = unified_projects['budget_spent'] / unified_projects['budget_allocated']
-    unified_projects['strategic_score_avg'] = unified_projects[['innovation_score', 'market_impact_score', 'strategic_fit_score', 'customer_value_score', 'competitive_advantage_score']].mean(axis=1)
+    
+    # Mean of the available strategic scores, over one (n_projects, 5) array
+    # (NaN for projects without any scores)
+    scores = unified_projects[['innovation_score', 'market_impact_score', 'strategic_fit_score', 'customer_value_score', 'competitive_advantage_score']].to_numpy(dtype=float)
+    score_counts = np.count_nonzero(~np.isnan(scores), axis=1)
+    unified_projects['strategic_score_avg'] = np.divide(
+        np.nansum(scores, axis=1), score_counts,
+        out=np.full(len(scores), np.nan), where=score_counts > 0
+    )
     
     # Prepare dependency network data
     print("Preparing dependency network data...")
     
-    # Enhance dependencies with project names
-    dependencies_enhanced = dependencies.merge(
-        projects[['project_id', 'name']].rename(columns={'project_id': 'source_project_id', 'name': 'source_name'}),
-        on='source_project_id',
-        how='left'
-    ).merge(
-        projects[['project_id', 'name']].rename(columns={'project_id': 'target_project_id', 'name': 'target_name'}),
-        on='target_project_id',
-        how='left'
+    # Enhance dependencies with project names, looked up by project id
+    project_names = projects.set_index('project_id')['name']
+    dependencies_enhanced = dependencies.assign(
+        source_name=dependencies['source_project_id'].map(project_names),
+        target_name=dependencies['target_project_id'].map(project_names)
     )
     
     # Prepare resource allocation network data
     print("Preparing resource allocation data...")
     
-    resource_allocations_enhanced = resource_allocations.merge(
-        projects[['project_id', 'name']].rename(columns={'name': 'project_name'}),
-        on='project_id',
-        how='left'
+    resource_allocations_enhanced = resource_allocations.assign(
+        project_name=resource_allocations['project_id'].map(project_names)
     ).merge(
         resources[['resource_id', 'resource_name', 'resource_type']],
         on='resource_id',
         how='left'
     )
     
-    # Get latest time series data for each project
-    latest_snapshots = time_series_snapshots.loc[
-        time_series_snapshots.groupby('project_id')['snapshot_date'].idxmax()
-    ]
+    # Get latest time series data for each project: after sorting by
+    # project and date (missing dates first) it is each project's last row
+    latest_snapshots = time_series_snapshots.sort_values(
+        ['project_id', 'snapshot_date'], na_position='first'
+    ).drop_duplicates('project_id', keep='last')
     
     # Prepare data for export
     datasets = {
@@ -140,9 +187,9 @@ def load_and_prepare_data():
         'dependencies': dependencies_enhanced,
         'resources': resources,
         'resource_allocations': resource_allocations_enhanced,
-        'timeline_events': timeline_events,
-        'portfolio_metrics': portfolio_metrics,
-        'dependency_impacts': dependency_impacts,
+        'timeline_events': tables['timeline_events'],
+        'portfolio_metrics': tables['portfolio_metrics'],
+        'dependency_impacts': tables['dependency_impacts'],
         'time_series_snapshots': time_series_snapshots,
         'latest_snapshots': latest_snapshots
     }
@@ -178,45 +225,53 @@ def create_decision_tree_data(projects_df):
     # Get all projects with complete data
     complete_projects = projects_df.dropna(subset=['strategic_score_avg', 'risk_score', 'roi_projected']).copy()
     
-    # Create project summaries for leaf nodes
-    def get_project_summary(project_list):
-        return [
-            {
-                "id": row['project_id'],
-                "name": row['name'],
-                "budget": row['budget_allocated'],
-                "strategic_score": round(row['strategic_score_avg'], 1),
-                "risk_score": row['risk_score'],
-                "roi": row['roi_projected'],
-                "status": row['status'],
-                "priority": row['strategic_priority']
-            }
-            for _, row in project_list.iterrows()
-        ]
-    
-    # Level 1: Strategic Priority
-    high_priority = complete_projects[complete_projects['strategic_priority'].isin(['Critical', 'High'])]
-    medium_low_priority = complete_projects[complete_projects['strategic_priority'].isin(['Medium', 'Low'])]
-    
-    # Level 2a: High Priority -> Risk Assessment
-    high_priority_low_risk = high_priority[high_priority['risk_score'] <= 5]
-    high_priority_high_risk = high_priority[high_priority['risk_score'] > 5]
-    
-    # Level 2b: Medium/Low Priority -> ROI Assessment
-    medium_low_high_roi = medium_low_priority[medium_low_priority['roi_projected'] >= 1.5]
-    medium_low_low_roi = medium_low_priority[medium_low_priority['roi_projected'] < 1.5]
-    
-    # Level 3a: High Priority, Low Risk -> Budget Assessment
-    hp_lr_high_budget = high_priority_low_risk[high_priority_low_risk['budget_allocated'] >= 300000]
-    hp_lr_low_budget = high_priority_low_risk[high_priority_low_risk['budget_allocated'] < 300000]
-    
-    # Level 3b: High Priority, High Risk -> Strategic Score Assessment
-    hp_hr_high_strategic = high_priority_high_risk[high_priority_high_risk['strategic_score_avg'] >= 8.0]
-    hp_hr_low_strategic = high_priority_high_risk[high_priority_high_risk['strategic_score_avg'] < 8.0]
+    # Create project summaries for leaf nodes, converted once for all
+    # complete projects; leaves then just pick their rows
+    summary_columns = {
+        'project_id': 'id',
+        'name': 'name',
+        'budget_allocated': 'budget',
+        'strategic_score_avg': 'strategic_score',
+        'risk_score': 'risk_score',
+        'roi_projected': 'roi',
+        'status': 'status',
+        'strategic_priority': 'priority'
+    }
+    summary = complete_projects[list(summary_columns)].rename(columns=summary_columns)
+    summary['strategic_score'] = summary['strategic_score'].round(1)
+    project_summaries = summary.to_dict('records')
+    
+    # Assign every project to its leaf in one pass: the priority, risk and
+    # budget/strategic score/ROI tests along each path are combined into
+    # one condition per leaf (projects matching none are left out)
+    priority = complete_projects['strategic_priority']
+    high_priority = priority.isin(['Critical', 'High']).to_numpy()
+    medium_low_priority = priority.isin(['Medium', 'Low']).to_numpy()
+    risk = complete_projects['risk_score'].to_numpy()
+    roi = complete_projects['roi_projected'].to_numpy()
+    budget = complete_projects['budget_allocated'].to_numpy()
+    strategic = complete_projects['strategic_score_avg'].to_numpy()
+    
+    leaf_conditions = {
+        # High Priority, Low Risk -> Budget Assessment
+        'hp_lr_high_budget': high_priority & (risk <= 5) & (budget >= 300000),
+        'hp_lr_low_budget': high_priority & (risk <= 5) & (budget < 300000),
+        # High Priority, High Risk -> Strategic Score Assessment
+        'hp_hr_high_strategic': high_priority & (risk > 5) & (strategic >= 8.0),
+        'hp_hr_low_strategic': high_priority & (risk > 5) & (strategic < 8.0),
+        # Medium/Low Priority, High ROI -> Risk Assessment
+        'ml_hr_low_risk': medium_low_priority & (roi >= 1.5) & (risk <= 4),
+        'ml_hr_high_risk': medium_low_priority & (roi >= 1.5) & (risk > 4),
+        # Medium/Low Priority, Low ROI
+        'medium_low_low_roi': medium_low_priority & (roi < 1.5)
+    }
+    leaf_names = list(leaf_conditions)
+    bucket = np.select(list(leaf_conditions.values()), range(len(leaf_names)), default=-1)
     
-    # Level 3c: Medium/Low Priority, High ROI -> Risk Assessment
-    ml_hr_low_risk = medium_low_high_roi[medium_low_high_roi['risk_score'] <= 4]
-    ml_hr_high_risk = medium_low_high_roi[medium_low_high_roi['risk_score'] > 4]
+    leaf_projects = {
+        name: [project_summaries[i] for i in np.flatnonzero(bucket == leaf)]
+        for leaf, name in enumerate(leaf_names)
+    }
     
     # Build the decision tree structure
     decision_tree = create_node(
@@ -233,13 +288,13 @@ def create_decision_tree_data(projects_df):
                         children=[
                             create_node(
                                 name="High Budget (≥$300K)",
-                                projects=get_project_summary(hp_lr_high_budget),
+                                projects=leaf_projects['hp_lr_high_budget'],
                                 recommendation="PROCEED WITH CAUTION",
                                 reasoning="High strategic value but significant investment. Ensure strong governance and milestone tracking."
                             ),
                             create_node(
                                 name="Low Budget (<$300K)",
-                                projects=get_project_summary(hp_lr_low_budget),
+                                projects=leaf_projects['hp_lr_low_budget'],
                                 recommendation="STRONGLY RECOMMEND",
                                 reasoning="High strategic value, low risk, manageable budget. Ideal portfolio addition."
                             )
@@ -251,13 +306,13 @@ def create_decision_tree_data(projects_df):
                         children=[
                             create_node(
                                 name="High Strategic Score",
-                                projects=get_project_summary(hp_hr_high_strategic),
+                                projects=leaf_projects['hp_hr_high_strategic'],
                                 recommendation="CONDITIONAL APPROVAL",
                                 reasoning="High strategic value justifies risk. Implement strong risk mitigation strategies."
                             ),
                             create_node(
                                 name="Lower Strategic Score",
-                                projects=get_project_summary(hp_hr_low_strategic),
+                                projects=leaf_projects['hp_hr_low_strategic'],
                                 recommendation="DEFER OR REDESIGN",
                                 reasoning="High risk without sufficient strategic justification. Consider alternatives or risk reduction."
                             )
@@ -275,13 +330,13 @@ def create_decision_tree_data(projects_df):
                         children=[
                             create_node(
                                 name="Low Risk (≤4)",
-                                projects=get_project_summary(ml_hr_low_risk),
+                                projects=leaf_projects['ml_hr_low_risk'],
                                 recommendation="RECOMMEND",
                                 reasoning="Good financial returns with manageable risk. Solid portfolio addition."
                             ),
                             create_node(
                                 name="Higher Risk (>4)",
-                                projects=get_project_summary(ml_hr_high_risk),
+                                projects=leaf_projects['ml_hr_high_risk'],
                                 recommendation="EVALUATE ALTERNATIVES",
                                 reasoning="Good ROI but elevated risk. Compare with other opportunities."
                             )
@@ -289,7 +344,7 @@ def create_decision_tree_data(projects_df):
                     ),
                     create_node(
                         name="Lower ROI (<1.5)",
-                        projects=get_project_summary(medium_low_low_roi),
+                        projects=leaf_projects['medium_low_low_roi'],
                         recommendation="DO NOT RECOMMEND",
                         reasoning="Limited strategic priority and poor financial returns. Resources better allocated elsewhere."
                     )
@@ -300,28 +355,51 @@ def create_decision_tree_data(projects_df):
     
     return decision_tree
 
-def export_for_visualization(datasets):
+def export_dataset(name, df, export_csv=True):
+    """
+    Write one dataset to visualization_data/<name>.json (and the
+    <name>_processed.csv backup)
+    """
+    # Convert datetime columns (of any resolution) to date strings for
+    # JSON serialization; a cast to day precision formats the whole
+    # column at once, and missing dates stay missing. Only the converted
+    # columns are new; the rest are shared with the source frame
+    date_strings = {}
+    for col in df.select_dtypes(include='datetime').columns:
+        dates = df[col]
+        day_strings = dates.to_numpy().astype('datetime64[D]').astype(str)
+        date_strings[col] = pd.Series(day_strings, index=dates.index).where(dates.notna())
+    df_export = df.assign(**date_strings) if date_strings else df
+    
+    # Export as JSON
+    df_export.to_json(f'visualization_data/{name}.json', orient='records', indent=2)
+    
+    # Also export as CSV for backup
+    if export_csv:
+        df_export.to_csv(f'visualization_data/{name}_processed.csv', index=False)
+
+def export_for_visualization(datasets, export_csv=True):
     """
     Export processed data in formats suitable for D3.js visualizations
+    
+    The visualizations only read the JSON files; the *_processed.csv
+    backups are skipped when export_csv is False.
     """
     print("Exporting data for visualizations...")
     
     # Create output directory
     os.makedirs('visualization_data', exist_ok=True)
     
-    # Export as JSON for D3.js
-    for name, df in datasets.items():
-        # Convert datetime columns to strings for JSON serialization
-        df_export = df.copy()
-        for col in df_export.columns:
-            if df_export[col].dtype == 'datetime64[ns]':
-                df_export[col] = df_export[col].dt.strftime('%Y-%m-%d')
-        
-        # Export as JSON
-        df_export.to_json(f'visualization_data/{name}.json', orient='records', indent=2)
-        
-        # Also export as CSV for backup
-        df_export.to_csv(f'visualization_data/{name}_processed.csv', index=False)
+    # Export as JSON for D3.js; each dataset goes to its own files, so large
+    # exports are spread over worker processes
+    names = list(datasets)
+    frames = [datasets[name] for name in names]
+    if sum(len(df) for df in frames) >= PARALLEL_EXPORT_ROWS:
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(export_dataset, names, frames, [export_csv] * len(names)))
+    else:
+        for name, df in zip(names, frames):
+            export_dataset(name, df, export_csv)
     
     # Create specific datasets for visualizations
     
@@ -329,7 +407,8 @@ def export_for_visualization(datasets):
     projects_for_network = datasets['projects'][['project_id', 'name', 'budget_allocated', 'strategic_score_avg', 'status', 'portfolio_theme', 'risk_level']].copy()
     
     # Filter dependencies to only include those where both source and target projects exist
-    valid_project_ids = set(projects_for_network['project_id'])
+    # (an id array keeps isin on pandas' hashtable path rather than probing a Python set)
+    valid_project_ids = projects_for_network['project_id'].unique()
     dependencies_for_network = datasets['dependencies'][
         (datasets['dependencies']['source_project_id'].isin(valid_project_ids)) &
         (datasets['dependencies']['target_project_id'].isin(valid_project_ids))
@@ -340,38 +419,41 @@ def export_for_visualization(datasets):
         'links': dependencies_for_network.to_dict('records')
     }
     
-    with open('visualization_data/dependency_network.json', 'w') as f:
-        json.dump(network_data, f, indent=2)
+    write_json(network_data, 'visualization_data/dependency_network.json')
     
-    # 2. Resource allocation matrix data
-    resource_matrix = datasets['resource_allocations'].pivot_table(
-        index='project_name',
-        columns='resource_name', 
-        values='allocated_amount',
-        fill_value=0
-    )
+    # 2. Resource allocation matrix data: the mean allocated amount of each
+    # (project, resource) pair, or 0 where a project does not use a resource.
+    # Both keys are factorized in sorted order and the amounts scatter-added
+    # into a dense matrix
+    allocations = datasets['resource_allocations'].dropna(subset=['project_name', 'resource_name', 'allocated_amount'])
+    project_codes, project_names = pd.factorize(allocations['project_name'], sort=True)
+    resource_codes, resource_names = pd.factorize(allocations['resource_name'], sort=True)
+    
+    shape = (len(project_names), len(resource_names))
+    totals = np.zeros(shape)
+    counts = np.zeros(shape)
+    np.add.at(totals, (project_codes, resource_codes), allocations['allocated_amount'].to_numpy(dtype=float))
+    np.add.at(counts, (project_codes, resource_codes), 1)
+    resource_matrix = np.divide(totals, counts, out=np.zeros(shape), where=counts > 0)
     
     resource_matrix_data = {
-        'projects': resource_matrix.index.tolist(),
-        'resources': resource_matrix.columns.tolist(),
-        'matrix': resource_matrix.values.tolist()
+        'projects': project_names.tolist(),
+        'resources': resource_names.tolist(),
+        'matrix': resource_matrix.tolist()
     }
     
-    with open('visualization_data/resource_matrix.json', 'w') as f:
-        json.dump(resource_matrix_data, f, indent=2)
+    write_json(resource_matrix_data, 'visualization_data/resource_matrix.json')
     
     # 3. Strategic positioning data
     strategic_data = datasets['projects'][['project_id', 'name', 'budget_allocated', 'strategic_score_avg', 'risk_score', 'completion_percentage', 'status', 'portfolio_theme']].copy()
     strategic_data = strategic_data.dropna(subset=['strategic_score_avg', 'risk_score'])
     
-    with open('visualization_data/strategic_positioning.json', 'w') as f:
-        json.dump(strategic_data.to_dict('records'), f, indent=2)
+    write_json(strategic_data.to_dict('records'), 'visualization_data/strategic_positioning.json')
     
     # 4. Decision tree data for portfolio investment decisions
     decision_tree_data = create_decision_tree_data(datasets['projects'])
     
-    with open('visualization_data/decision_tree.json', 'w') as f:
-        json.dump(decision_tree_data, f, indent=2)
+    write_json(decision_tree_data, 'visualization_data/decision_tree.json')
     
     print("Data export complete!")
     print("Files created in visualization_data/ directory:")
@@ -399,8 +481,8 @@ def main():
     sample_cols = ['project_id', 'name', 'status', 'budget_allocated', 'strategic_score_avg', 'dependencies_out', 'dependencies_in']
     print(datasets['projects'][sample_cols].head())
     
-    # Export for visualizations
-    export_for_visualization(datasets)
+    # Export for visualizations (set EXPORT_CSV=0 to skip the CSV backups)
+    export_for_visualization(datasets, export_csv=os.environ.get('EXPORT_CSV', '1') != '0')
     
     return datasets
 
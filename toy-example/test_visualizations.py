@@ -8,6 +8,17 @@ import os
 import json
 import pandas as pd
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+def check_csv_file(file_path):
+    """Parse one CSV file and return its status line."""
+    if not os.path.exists(file_path):
+        return f"✗ {file_path}: File not found"
+    try:
+        df = pd.read_csv(file_path)
+        return f"✓ {file_path}: {len(df)} rows"
+    except Exception as e:
+        return f"✗ {file_path}: Error reading - {e}"
 
 def test_data_files():
     """Test that all required data files exist and are valid."""
@@ -26,15 +37,10 @@ def test_data_files():
         '../toy-data/time_series_snapshots.csv'
     ]
     
-    for file_path in csv_files:
-        if os.path.exists(file_path):
-            try:
-                df = pd.read_csv(file_path)
-                print(f"✓ {file_path}: {len(df)} rows")
-            except Exception as e:
-                print(f"✗ {file_path}: Error reading - {e}")
-        else:
-            print(f"✗ {file_path}: File not found")
+    # Files are parsed concurrently; results are reported in list order
+    with ThreadPoolExecutor(max_workers=len(csv_files)) as executor:
+        for message in executor.map(check_csv_file, csv_files):
+            print(message)
     
     # Check JSON files
     json_files = [
@@ -4,12 +4,27 @@ Project Portfolio Wizard Backend Integration
 Connects the web interface with the qualitative evaluation translator
 """
 
+import base64
+import hashlib
 import json
+import mmap
 import sys
 import os
+import queue
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add the dl-example directory to the path to import the translator
 sys.path.append(str(Path(__file__).parent / "dl-example"))
@@ -21,12 +36,172 @@ try:
         EvaluationType,
         ComparisonOperator
     )
-    from polytope_visualizer import PolytopeVisualizer
-    from evaluation_input_parser import NaturalLanguageParser, EvaluationExporter
+
+    # Wizard enum names -> translator enums
+    _TYPE_MAP = {
+        'COMPARISON': EvaluationType.COMPARISON,
+        'RANGE': EvaluationType.RANGE,
+        'RANKING': EvaluationType.RANKING,
+        'THRESHOLD': EvaluationType.THRESHOLD
+    }
+    _OP_MAP = {
+        'GREATER': ComparisonOperator.GREATER,
+        'LESS': ComparisonOperator.LESS,
+        'EQUAL': ComparisonOperator.EQUAL,
+        'GREATER_EQUAL': ComparisonOperator.GREATER_EQUAL,
+        'LESS_EQUAL': ComparisonOperator.LESS_EQUAL
+    }
 except ImportError as e:
     print(f"Warning: Could not import evaluation modules: {e}")
     print("Make sure you're running this from the correct directory with dl-example/ available")
 
+# Wizard evaluation fields: the required ones, and the optional ones with
+# their defaults, each fetched in a single itemgetter call
+_REQUIRED_FIELDS = ('evaluator_id', 'evaluation_type', 'projects')
+_OPTIONAL_FIELDS = {
+    'operator': None,
+    'values': None,
+    'confidence': 1.0,
+    'criteria': None,
+    'timestamp': None
+}
+_required_keys = frozenset(_REQUIRED_FIELDS)
+_get_required = itemgetter(*_REQUIRED_FIELDS)
+_get_optional = itemgetter(*_OPTIONAL_FIELDS)
+
+
+def _is_valid_evaluation(eval_data: Any) -> bool:
+    """
+    Check that a wizard evaluation has the required fields, a supported type
+    and operator, and fields of the types the translator expects
+    """
+    if not isinstance(eval_data, dict) or not _required_keys <= eval_data.keys():
+        return False
+    evaluation_type = eval_data['evaluation_type']
+    operator, values, _, criteria, _ = _get_optional({**_OPTIONAL_FIELDS, **eval_data})
+    return (isinstance(evaluation_type, str) and evaluation_type in _TYPE_MAP
+            and isinstance(eval_data['projects'], list)
+            and (not operator or (isinstance(operator, str) and operator in _OP_MAP))
+            and (values is None or isinstance(values, list))
+            and (criteria is None or isinstance(criteria, str)))
+
+# Constraint matrices with a lower fraction of non-zeros are exported in CSR
+# form instead of as dense rows
+SPARSE_EXPORT_DENSITY = 0.3
+
+# Written to a visualization output directory: the hash of the constraint
+# system the files were generated from, and their names
+VISUALIZATION_MANIFEST = '.visualization_manifest.json'
+
+# Buffer size for JSON files written through the stdlib encoder, which emits
+# many small chunks
+JSON_WRITE_BUFFER = 1 << 20
+
+
+def _json_default(obj):
+    """Serialize NumPy arrays and scalars for the stdlib json encoder"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _read_json(path: str) -> Any:
+    """Load a JSON file, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        # orjson parses the memory-mapped file in place, without first
+        # copying it into a bytes object
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(data: Any, path: str) -> None:
+    """
+    Write data as JSON indented by two spaces, with orjson when it is
+    installed; NumPy arrays are serialized directly in either case
+    """
+    if ORJSON_AVAILABLE:
+        # orjson encodes to bytes in one call; hand them straight to the file
+        # descriptor, bypassing Python's buffered text layer
+        view = memoryview(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    else:
+        with open(path, 'w', buffering=JSON_WRITE_BUFFER) as f:
+            json.dump(data, f, indent=2, default=_json_default)
+
+
+def _compact_coefficients(values: np.ndarray) -> np.ndarray:
+    """
+    values as int8 when they are all small integers, such as the +/-1
+    coefficients of comparisons and rankings, so they are written as "1"
+    rather than "1.0"; otherwise unchanged
+    """
+    compact = values.astype(np.int8)
+    return compact if np.array_equal(compact, values) else values
+
+
+def _pack_ndarray(a: np.ndarray) -> Dict[str, Any]:
+    """
+    JSON form of an array as its raw bytes in base64 with dtype and shape,
+    so readers rebuild it with np.frombuffer instead of parsing nested lists
+    """
+    return {
+        '__ndarray__': True,
+        'dtype': a.dtype.str,
+        'shape': list(a.shape),
+        'data': base64.b64encode(a.tobytes()).decode('ascii')
+    }
+
+
+def _matrix_fields(name: str, A) -> Dict[str, Any]:
+    """
+    Export fields for a constraint matrix given in CSR form: its CSR
+    components under '<name>_csr' when it is sparse enough, otherwise the
+    packed dense matrix (see _pack_ndarray) under '<name>'
+    """
+    n_rows, n_cols = A.shape
+    if n_rows and A.nnz < SPARSE_EXPORT_DENSITY * n_rows * n_cols:
+        data = _compact_coefficients(A.data)
+        return {
+            f'{name}_csr': {
+                'data': data,
+                'indices': A.indices,
+                'indptr': A.indptr,
+                'shape': [n_rows, n_cols],
+                'dtype': data.dtype.name
+            }
+        }
+    return {name: _pack_ndarray(_compact_coefficients(A.toarray()))}
+
+
+def _write_figure(figure, filename: str) -> str:
+    """Render a Plotly figure to an HTML file; run in a worker process"""
+    figure.write_html(filename)
+    return filename
+
+
+def _writer_loop(write_queue: queue.Queue, errors: Dict[str, Exception]) -> None:
+    """
+    Write (filename, text) items taken from write_queue until a None
+    sentinel arrives; failures are recorded in errors by filename
+    """
+    while True:
+        item = write_queue.get()
+        if item is None:
+            return
+        filename, text = item
+        try:
+            Path(filename).write_text(text, encoding='utf-8')
+        except Exception as e:
+            errors[filename] = e
+
 
 class WizardBackend:
     """Backend integration for the Project Portfolio Wizard"""
@@ -36,12 +211,14 @@ class WizardBackend:
         self.evaluations = []
         self.translator = None
         self.visualizer = None
+        # Variable names and bounds of the current translator's problem
+        self._variable_names = []
+        self._bounds = {'lower': [], 'upper': []}
         
     def load_data_from_wizard(self, data_file: str) -> Dict[str, Any]:
         """Load project and evaluation data from wizard export"""
         try:
-            with open(data_file, 'r') as f:
-                data = json.load(f)
+            data = _read_json(data_file)
             
             self.projects = data.get('projects', [])
             self.evaluations = data.get('evaluations', [])
@@ -82,21 +259,28 @@ class WizardBackend:
                 criteria=criteria
             )
             
-            # Convert wizard evaluations to translator format
-            converted_count = 0
-            for eval_data in self.evaluations:
-                try:
-                    evaluation = self._convert_wizard_evaluation(eval_data)
-                    if evaluation:
-                        self.translator.add_evaluation(evaluation)
-                        converted_count += 1
-                except Exception as e:
-                    print(f"Warning: Could not convert evaluation {eval_data}: {e}")
+            # One variable per (project, criterion), each bounded to [0, 1]
+            self._variable_names = [f"{project}_{criterion}" for project in project_ids for criterion in criteria]
+            n_vars = len(self._variable_names)
+            self._bounds = {'lower': [0.0] * n_vars, 'upper': [1.0] * n_vars}
+            
+            # Validate up front: evaluations that are missing a required
+            # field or have malformed fields are skipped and reported together
+            valid = [eval_data for eval_data in self.evaluations if _is_valid_evaluation(eval_data)]
+            n_rejected = len(self.evaluations) - len(valid)
+            if n_rejected:
+                print(f"Warning: Skipped {n_rejected} invalid evaluation(s) (missing one of "
+                      f"{', '.join(_REQUIRED_FIELDS)}, or with an unsupported type, operator or field value)")
+            
+            # Convert wizard evaluations to translator format and add them
+            # in one batch
+            converted = [self._convert_wizard_evaluation(eval_data) for eval_data in valid]
+            self.translator.add_evaluations(converted)
             
             return {
                 'status': 'success',
                 'translator_created': True,
-                'evaluations_converted': converted_count,
+                'evaluations_converted': len(converted),
                 'total_evaluations': len(self.evaluations)
             }
             
@@ -106,51 +290,45 @@ class WizardBackend:
                 'message': str(e)
             }
     
-    def _convert_wizard_evaluation(self, eval_data: Dict[str, Any]) -> Optional[QualitativeEvaluation]:
-        """Convert wizard evaluation format to translator format"""
-        try:
-            # Map evaluation types
-            type_mapping = {
-                'COMPARISON': EvaluationType.COMPARISON,
-                'RANGE': EvaluationType.RANGE,
-                'RANKING': EvaluationType.RANKING,
-                'THRESHOLD': EvaluationType.THRESHOLD
-            }
-            
-            # Map operators
-            operator_mapping = {
-                'GREATER': ComparisonOperator.GREATER,
-                'LESS': ComparisonOperator.LESS,
-                'EQUAL': ComparisonOperator.EQUAL,
-                'GREATER_EQUAL': ComparisonOperator.GREATER_EQUAL,
-                'LESS_EQUAL': ComparisonOperator.LESS_EQUAL
-            }
-            
-            evaluation_type = type_mapping.get(eval_data['evaluation_type'])
-            if not evaluation_type:
-                return None
-            
-            operator = None
-            if eval_data.get('operator'):
-                operator = operator_mapping.get(eval_data['operator'])
-            
-            return QualitativeEvaluation(
-                evaluator_id=eval_data['evaluator_id'],
-                evaluation_type=evaluation_type,
-                projects=eval_data['projects'],
-                operator=operator,
-                values=eval_data.get('values'),
-                confidence=eval_data.get('confidence', 1.0),
-                criteria=eval_data.get('criteria'),
-                timestamp=eval_data.get('timestamp')
-            )
-            
-        except Exception as e:
-            print(f"Error converting evaluation: {e}")
-            return None
+    def _convert_wizard_evaluation(self, eval_data: Dict[str, Any]) -> QualitativeEvaluation:
+        """
+        Convert wizard evaluation format to translator format
+        
+        The evaluation must pass _is_valid_evaluation(); create_translator()
+        filters out the others beforehand.
+        """
+        evaluator_id, evaluation_type, projects = _get_required(eval_data)
+        operator, values, confidence, criteria, timestamp = _get_optional({**_OPTIONAL_FIELDS, **eval_data})
+        
+        return QualitativeEvaluation(
+            evaluator_id=evaluator_id,
+            evaluation_type=_TYPE_MAP[evaluation_type],
+            projects=projects,
+            operator=_OP_MAP.get(operator),
+            values=values,
+            confidence=confidence,
+            criteria=criteria,
+            timestamp=timestamp
+        )
+    
+    def _get_matrices(self, sparse: Union[bool, str] = False) -> Tuple[Any, Any, Any, Any]:
+        """
+        Constraint matrices (A_ineq, b_ineq, A_eq, b_eq) of the current
+        translator; see get_constraint_matrices for `sparse`
+        
+        The translator caches the assembled matrices until its constraints
+        change, so every command of a session shares the same arrays; a new
+        translator from create_translator() starts a fresh cache.
+        """
+        return self.translator.get_constraint_matrices(sparse=sparse)
     
     def generate_constraint_matrices(self) -> Dict[str, Any]:
-        """Generate constraint matrices from evaluations"""
+        """
+        Generate constraint matrices from evaluations
+
+        The matrices are returned as NumPy arrays; pass the result to
+        _write_json (or orjson with OPT_SERIALIZE_NUMPY) when JSON is needed.
+        """
         try:
             if not self.translator:
                 return {
@@ -162,14 +340,14 @@ class WizardBackend:
             self.translator.translate_evaluations()
             
             # Get constraint matrices
-            A_ineq, b_ineq, A_eq, b_eq = self.translator.get_constraint_matrices()
+            A_ineq, b_ineq, A_eq, b_eq = self._get_matrices()
             
             return {
                 'status': 'success',
-                'A_ineq': A_ineq.tolist() if A_ineq is not None else None,
-                'b_ineq': b_ineq.tolist() if b_ineq is not None else None,
-                'A_eq': A_eq.tolist() if A_eq is not None else None,
-                'b_eq': b_eq.tolist() if b_eq is not None else None,
+                'A_ineq': A_ineq,
+                'b_ineq': b_ineq,
+                'A_eq': A_eq,
+                'b_eq': b_eq,
                 'n_inequality_constraints': len(b_ineq) if b_ineq is not None else 0,
                 'n_equality_constraints': len(b_eq) if b_eq is not None else 0,
                 'n_variables': A_ineq.shape[1] if A_ineq is not None else 0
@@ -181,8 +359,39 @@ class WizardBackend:
                 'message': str(e)
             }
     
+    def _visualization_stamp(self) -> str:
+        """Hash of the constraint system the visualizations are generated from"""
+        digest = hashlib.blake2b(digest_size=16)
+        for array in self._get_matrices():
+            digest.update(array.tobytes())
+        digest.update('\0'.join(self._variable_names).encode())
+        digest.update('\0'.join(c.constraint_id for c in self.translator.constraints).encode())
+        return digest.hexdigest()
+    
+    def _cached_visualizations(self, output_dir: str, stamp: str) -> Optional[List[str]]:
+        """
+        Files of a previous create_visualizations() run in output_dir for the
+        same constraint system, or None when they have to be regenerated
+        """
+        try:
+            manifest = _read_json(os.path.join(output_dir, VISUALIZATION_MANIFEST))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get('stamp') != stamp:
+            return None
+        
+        files = [f"{output_dir}/{name}" for name in manifest.get('files', [])]
+        if not all(os.path.exists(filename) for filename in files):
+            return None
+        return files
+    
     def create_visualizations(self, output_dir: str = "wizard_output") -> Dict[str, Any]:
-        """Create polytope visualizations"""
+        """
+        Create polytope visualizations
+        
+        Generation is skipped when output_dir already holds the files of an
+        earlier run for the same constraint system.
+        """
         try:
             if not self.translator:
                 return {
@@ -193,31 +402,54 @@ class WizardBackend:
             # Create output directory
             os.makedirs(output_dir, exist_ok=True)
             
-            # Create visualizer
-            self.visualizer = PolytopeVisualizer(self.translator)
+            stamp = self._visualization_stamp()
+            cached_files = self._cached_visualizations(output_dir, stamp)
+            if cached_files is not None:
+                return {
+                    'status': 'success',
+                    'output_directory': output_dir,
+                    'generated_files': cached_files,
+                    'file_count': len(cached_files),
+                    'warnings': []
+                }
             
-            generated_files = []
+            # Imported here: plotly is only needed for this command
+            from polytope_visualizer import PolytopeVisualizer
             
-            # Generate 2D visualizations for different dimension pairs
-            dimensions = len(self.translator.projects) * len(self.translator.criteria)
-            if dimensions >= 2:
-                for i in range(min(3, dimensions-1)):  # Generate a few 2D projections
-                    for j in range(i+1, min(i+3, dimensions)):
-                        try:
-                            fig_2d = self.visualizer.create_2d_visualization(
-                                dim_x=i, 
-                                dim_y=j,
-                                show_vertices=True,
-                                show_constraints=True,
-                                show_feasible_region=True
-                            )
-                            
-                            filename = f"{output_dir}/polytope_2d_{i}_{j}.html"
-                            fig_2d.write_html(filename)
-                            generated_files.append(filename)
-                            
-                        except Exception as e:
-                            print(f"Warning: Could not generate 2D visualization ({i},{j}): {e}")
+            # Create visualizer; the vertices are computed once and shared by
+            # every figure and export below
+            self.visualizer = PolytopeVisualizer(self.translator, self._get_matrices())
+            vertices = self.visualizer.compute_vertices()
+            
+            generated_files = []
+            # Figures and exports that failed, reported together at the end
+            problems = []
+            # (figure, filename, description) of each HTML file to render
+            figures = []
+            
+            # Generate 2D visualizations for a few neighbouring dimension
+            # pairs; at most 3 x 2 of them, however many dimensions there are
+            dimensions = len(self._variable_names)
+            pairs = [(i, j)
+                     for i in range(min(3, dimensions-1))
+                     for j in range(i+1, min(i+3, dimensions))]
+            if pairs:
+                # All pairs share the vertices and one gather of the
+                # constraint coefficients; each only builds its own 2D hull
+                try:
+                    figures_2d = self.visualizer.create_2d_visualizations(
+                        pairs,
+                        show_vertices=True,
+                        show_constraints=True,
+                        show_feasible_region=True
+                    )
+                    figures.extend(
+                        (fig_2d, f"{output_dir}/polytope_2d_{i}_{j}.html", f"2D visualization ({i},{j})")
+                        for fig_2d, (i, j) in zip(figures_2d, pairs)
+                    )
+                    
+                except Exception as e:
+                    problems.append(f"Could not generate 2D visualizations: {e}")
             
             # Generate 3D visualization if possible
             if dimensions >= 3:
@@ -227,53 +459,97 @@ class WizardBackend:
                         dim_y=1, 
                         dim_z=2,
                         show_vertices=True,
-                        opacity=0.3
+                        opacity=0.3,
+                        precomputed_vertices=vertices
                     )
-                    
-                    filename = f"{output_dir}/polytope_3d.html"
-                    fig_3d.write_html(filename)
-                    generated_files.append(filename)
+                    figures.append((fig_3d, f"{output_dir}/polytope_3d.html", "3D visualization"))
                     
                 except Exception as e:
-                    print(f"Warning: Could not generate 3D visualization: {e}")
+                    problems.append(f"Could not generate 3D visualization: {e}")
             
             # Generate interactive dashboard
             try:
                 dashboard = self.visualizer.create_dimension_selector_dashboard()
-                filename = f"{output_dir}/polytope_dashboard.html"
-                dashboard.write_html(filename)
-                generated_files.append(filename)
+                figures.append((dashboard, f"{output_dir}/polytope_dashboard.html", "dashboard"))
                 
             except Exception as e:
-                print(f"Warning: Could not generate dashboard: {e}")
+                problems.append(f"Could not generate dashboard: {e}")
+            
+            # Rendering the HTML dominates; with several cores the files are
+            # written from worker processes, which only receive the figures
+            if len(figures) > 1 and (os.cpu_count() or 1) > 1:
+                with ProcessPoolExecutor() as executor:
+                    futures = [executor.submit(_write_figure, fig, filename)
+                               for fig, filename, _ in figures]
+                    for future, (_, filename, description) in zip(futures, figures):
+                        try:
+                            generated_files.append(future.result())
+                        except Exception as e:
+                            problems.append(f"Could not generate {description}: {e}")
+            else:
+                # Rendering is CPU-bound and writing I/O-bound: a background
+                # thread writes each file while the next figure is rendered
+                write_queue = queue.Queue(maxsize=2)
+                write_errors = {}
+                writer = threading.Thread(target=_writer_loop, args=(write_queue, write_errors), daemon=True)
+                writer.start()
+                rendered = []
+                try:
+                    for fig, filename, description in figures:
+                        try:
+                            write_queue.put((filename, fig.to_html()))
+                            rendered.append((filename, description))
+                        except Exception as e:
+                            problems.append(f"Could not generate {description}: {e}")
+                finally:
+                    write_queue.put(None)
+                    writer.join()
+                
+                for filename, description in rendered:
+                    if filename in write_errors:
+                        problems.append(f"Could not generate {description}: {write_errors[filename]}")
+                    else:
+                        generated_files.append(filename)
             
             # Export polytope data
             try:
-                polytope_data = self.visualizer.export_polytope_data()
                 filename = f"{output_dir}/polytope_data.json"
-                with open(filename, 'w') as f:
-                    json.dump(polytope_data, f, indent=2)
+                with open(filename, 'w', buffering=JSON_WRITE_BUFFER) as f:
+                    self.visualizer.export_polytope_data(f, vertices=vertices)
                 generated_files.append(filename)
                 
             except Exception as e:
-                print(f"Warning: Could not export polytope data: {e}")
+                problems.append(f"Could not export polytope data: {e}")
             
             # Compute polytope properties
             try:
-                properties = self.visualizer.compute_polytope_properties()
+                properties = self.visualizer.compute_polytope_properties(vertices)
                 filename = f"{output_dir}/polytope_properties.json"
-                with open(filename, 'w') as f:
-                    json.dump(properties, f, indent=2)
+                _write_json(properties, filename)
                 generated_files.append(filename)
                 
             except Exception as e:
-                print(f"Warning: Could not compute polytope properties: {e}")
+                problems.append(f"Could not compute polytope properties: {e}")
+            
+            # Only a complete run is recorded, so failed figures and exports
+            # are retried next time
+            manifest_file = os.path.join(output_dir, VISUALIZATION_MANIFEST)
+            if problems:
+                print("\n".join(f"Warning: {problem}" for problem in problems))
+                if os.path.exists(manifest_file):
+                    os.remove(manifest_file)
+            else:
+                _write_json({
+                    'stamp': stamp,
+                    'files': [os.path.basename(filename) for filename in generated_files]
+                }, manifest_file)
             
             return {
                 'status': 'success',
                 'output_directory': output_dir,
                 'generated_files': generated_files,
-                'file_count': len(generated_files)
+                'file_count': len(generated_files),
+                'warnings': problems
             }
             
         except Exception as e:
@@ -315,8 +591,9 @@ class WizardBackend:
                     'message': 'Translator not initialized. Call create_translator() first.'
                 }
             
-            # Get constraint matrices
-            A_ineq, b_ineq, A_eq, b_eq = self.translator.get_constraint_matrices()
+            # Get constraint matrices; each row only involves a few
+            # variables, so they usually go out in CSR form
+            A_ineq, b_ineq, A_eq, b_eq = self._get_matrices(sparse='csr')
             
             # Prepare optimization data
             optimization_data = {
@@ -327,30 +604,33 @@ class WizardBackend:
                     'criteria': self.translator.criteria
                 },
                 'constraints': {
-                    'A_ineq': A_ineq.tolist() if A_ineq is not None else None,
-                    'b_ineq': b_ineq.tolist() if b_ineq is not None else None,
-                    'A_eq': A_eq.tolist() if A_eq is not None else None,
-                    'b_eq': b_eq.tolist() if b_eq is not None else None
-                },
-                'bounds': {
-                    'lower': [0.0] * (len(self.translator.projects) * len(self.translator.criteria)),
-                    'upper': [1.0] * (len(self.translator.projects) * len(self.translator.criteria))
+                    **_matrix_fields('A_ineq', A_ineq),
+                    'b_ineq': b_ineq,
+                    **_matrix_fields('A_eq', A_eq),
+                    'b_eq': b_eq
                 },
-                'variable_names': [
-                    f"{project}_{criterion}"
-                    for project in self.translator.projects
-                    for criterion in self.translator.criteria
-                ],
+                'bounds': self._bounds,
+                'variable_names': self._variable_names,
                 'usage_examples': {
                     'scipy': {
                         'description': 'Use with scipy.optimize.linprog',
                         'code': '''
+import base64
 import numpy as np
 from scipy.optimize import linprog
+from scipy.sparse import csr_matrix
 
-# Load constraint data
-A_ineq = np.array(data['constraints']['A_ineq'])
-b_ineq = np.array(data['constraints']['b_ineq'])
+# Load constraint data (sparse systems are stored as 'A_ineq_csr', dense
+# ones as raw bytes)
+constraints = data['constraints']
+if 'A_ineq_csr' in constraints:
+    csr = constraints['A_ineq_csr']
+    A_ineq = csr_matrix((np.array(csr['data'], dtype=csr['dtype']), csr['indices'], csr['indptr']),
+                        shape=csr['shape'])
+else:
+    packed = constraints['A_ineq']
+    A_ineq = np.frombuffer(base64.b64decode(packed['data']), dtype=packed['dtype']).reshape(packed['shape'])
+b_ineq = np.array(constraints['b_ineq'])
 bounds = [(data['bounds']['lower'][i], data['bounds']['upper'][i]) 
           for i in range(len(data['bounds']['lower']))]
 
@@ -364,12 +644,22 @@ result = linprog(c, A_ub=A_ineq, b_ub=b_ineq, bounds=bounds, method='highs')
                     'cvxpy': {
                         'description': 'Use with CVXPY for convex optimization',
                         'code': '''
+import base64
 import cvxpy as cp
 import numpy as np
+from scipy.sparse import csr_matrix
 
-# Load constraint data
-A_ineq = np.array(data['constraints']['A_ineq'])
-b_ineq = np.array(data['constraints']['b_ineq'])
+# Load constraint data (sparse systems are stored as 'A_ineq_csr', dense
+# ones as raw bytes)
+constraints = data['constraints']
+if 'A_ineq_csr' in constraints:
+    csr = constraints['A_ineq_csr']
+    A_ineq = csr_matrix((np.array(csr['data'], dtype=csr['dtype']), csr['indices'], csr['indptr']),
+                        shape=csr['shape'])
+else:
+    packed = constraints['A_ineq']
+    A_ineq = np.frombuffer(base64.b64decode(packed['data']), dtype=packed['dtype']).reshape(packed['shape'])
+b_ineq = np.array(constraints['b_ineq'])
 
 # Define variables
 n_vars = A_ineq.shape[1]
@@ -390,14 +680,13 @@ problem.solve()
                 }
             }
             
-            # Save to file
-            with open(output_file, 'w') as f:
-                json.dump(optimization_data, f, indent=2)
+            # Save to file (the constraint arrays are serialized directly)
+            _write_json(optimization_data, output_file)
             
             return {
                 'status': 'success',
                 'output_file': output_file,
-                'n_variables': len(optimization_data['variable_names']),
+                'n_variables': len(self._variable_names),
                 'n_inequality_constraints': len(b_ineq) if b_ineq is not None else 0,
                 'n_equality_constraints': len(b_eq) if b_eq is not None else 0
             }